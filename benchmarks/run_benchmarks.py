@@ -0,0 +1,449 @@
+"""
+Times raxpy's design generation, design optimization, encoding and
+measurement computations over parameterised input spaces and writes the
+timings to a JSON report. A report can be compared against a saved
+baseline report to catch performance regressions.
+
+Usage
+-----
+Save a baseline (for example on the main branch)::
+
+    python benchmarks/run_benchmarks.py --output baseline.json
+
+Compare a change against the baseline, exiting with status 1 if any
+benchmark raised an error, is missing compared with the baseline, or is
+slower than the baseline by more than the threshold::
+
+    python benchmarks/run_benchmarks.py --output report.json \\
+        --baseline baseline.json --threshold 1.25
+
+Use `--quick` for a smoke run with small sizes and `--filter` to only
+run the benchmarks whose names contain a substring.
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+import warnings
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import scipy
+
+import raxpy
+import raxpy.spaces as s
+from raxpy.does import lhs, random, sobol
+from raxpy.does import measure
+from raxpy.does.doe import EncodingEnum
+from raxpy.does.maxpro import optimize_design_with_sa
+from raxpy.does.scipy_optimizations import random_cd
+from raxpy.spaces.complexity import assign_null_portions
+
+# the design algorithms accepting an rng that `design_experiment`
+# supports
+DESIGN_ALGORITHMS = {
+    "lhs_pool": lhs.generate_seperate_designs_by_full_subspace_and_pool,
+    "random": random.generate_design,
+    "random_full_subspace": random.generate_seperate_designs_by_full_subspace,
+    "sobol": sobol.generate_design,
+}
+
+# (n, d) sizes of the benchmarks
+SIZES = [(50, 4), (50, 12), (200, 4), (200, 12)]
+QUICK_SIZES = [(20, 4)]
+
+SEED = 2025
+
+
+@dataclass
+class Benchmark:
+    """
+    A timed computation; setup creates the inputs (not timed) and
+    returns the function to time.
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+
+
+def create_flat_float_space(d: int) -> s.InputSpace:
+    """
+    Creates a space of d non-optional floats.
+    """
+    return s.InputSpace(
+        dimensions=[s.Float(id=f"x{k}", lb=0.0, ub=1.0) for k in range(d)]
+    )
+
+
+def create_optional_space(d: int) -> s.InputSpace:
+    """
+    Creates a space of d floats, all but the first optional.
+    """
+    return s.InputSpace(
+        dimensions=[
+            s.Float(id=f"x{k}", lb=0.0, ub=1.0, nullable=k > 0)
+            for k in range(d)
+        ]
+    )
+
+
+def create_tree_space(d: int) -> s.InputSpace:
+    """
+    Creates a space with about d dimensions nested in alternating
+    optional composites and variants.
+    """
+    counter = iter(range(d * 4))
+
+    def create_level(remaining: int) -> List[s.Dimension]:
+        k = next(counter)
+        leaf = s.Float(id=f"x{k}", lb=0.0, ub=1.0, nullable=True)
+        if remaining <= 2:
+            return [leaf]
+        if k % 2 == 0:
+            return [
+                leaf,
+                s.Composite(
+                    id=f"c{k}",
+                    nullable=True,
+                    children=create_level(remaining - 2),
+                ),
+            ]
+        options = [
+            s.Float(id=f"o{k}", lb=0.0, ub=1.0),
+            s.Composite(id=f"oc{k}", children=create_level(remaining - 3)),
+        ]
+        return [leaf, s.Variant(id=f"v{k}", options=options)]
+
+    return s.InputSpace(dimensions=create_level(d))
+
+
+def create_categorical_space(d: int) -> s.InputSpace:
+    """
+    Creates a space of d categorical dimensions with large value sets,
+    half of them optional.
+    """
+    return s.InputSpace(
+        dimensions=[
+            s.Text(
+                id=f"x{k}",
+                value_set=tuple(f"level_{v}" for v in range(100)),
+                nullable=k % 2 == 1,
+            )
+            for k in range(d)
+        ]
+    )
+
+
+SPACES = {
+    "flat": create_flat_float_space,
+    "optional": create_optional_space,
+    "tree": create_tree_space,
+    "categorical": create_categorical_space,
+}
+
+
+def _create_space(space_kind: str, d: int) -> s.InputSpace:
+    space = SPACES[space_kind](d)
+    assign_null_portions(s.create_level_iterable(space.children))
+    return space
+
+
+@lru_cache(maxsize=None)
+def _create_design(space_kind: str, n: int, d: int):
+    space = _create_space(space_kind, d)
+    return lhs.generate_seperate_designs_by_full_subspace_and_pool(
+        space, n, rng=np.random.default_rng(SEED)
+    )
+
+
+@lru_cache(maxsize=None)
+def _measure_sub_spaces(space_kind: str, n: int, d: int):
+    return measure.MeasurementSession(
+        _create_design(space_kind, n, d),
+        EncodingEnum.ZERO_ONE_NULL_ENCODING,
+    ).measure_sub_spaces()
+
+
+def create_benchmarks(sizes: List[Tuple[int, int]]) -> Iterator[Benchmark]:
+    """
+    Creates the benchmarks of every space kind and size.
+    """
+    for space_kind in SPACES:
+        for n, d in sizes:
+            suffix = f"[{space_kind}-n{n}-d{d}]"
+
+            for algorithm_name, algorithm in DESIGN_ALGORITHMS.items():
+
+                def setup_design(algorithm=algorithm, space_kind=space_kind):
+                    space = _create_space(space_kind, d)
+                    return lambda: raxpy.design_experiment(
+                        space,
+                        n,
+                        design_algorithm=algorithm,
+                        optimize_projections=False,
+                        seed=SEED,
+                    )
+
+                yield Benchmark(
+                    f"design_experiment.{algorithm_name}{suffix}",
+                    setup_design,
+                )
+
+            def setup_sa(space_kind=space_kind):
+                design = _create_design(space_kind, n, d)
+                return lambda: optimize_design_with_sa(
+                    design,
+                    encoding=EncodingEnum.ZERO_ONE_NULL_ENCODING,
+                    maxiter=1000,
+                    rng=np.random.default_rng(SEED),
+                )
+
+            yield Benchmark(f"optimize_design_with_sa{suffix}", setup_sa)
+
+            def setup_decode(space_kind=space_kind):
+                design = _create_design(space_kind, n, d)
+                encoded = np.random.default_rng(SEED).random(
+                    design.input_sets.shape
+                )
+                return lambda: design.input_space.decode_zero_one_matrix(
+                    encoded, design.input_set_map
+                )
+
+            yield Benchmark(f"decode_zero_one_matrix{suffix}", setup_decode)
+
+            def setup_convert(space_kind=space_kind):
+                design = _create_design(space_kind, n, d)
+                decoded = design.decoded_input_sets
+                return lambda: design.input_space.convert_flat_values_to_dict(
+                    decoded, design.input_set_map
+                )
+
+            yield Benchmark(
+                f"convert_flat_values_to_dict{suffix}", setup_convert
+            )
+
+            for (
+                metric_id,
+                compute,
+            ) in measure.doe_metric_computation_map.items():
+
+                def setup_metric(compute=compute, space_kind=space_kind):
+                    design = _create_design(space_kind, n, d)
+                    sub_space_measurements = _measure_sub_spaces(
+                        space_kind, n, d
+                    )
+                    return lambda: compute(
+                        design,
+                        sub_space_measurements,
+                        EncodingEnum.ZERO_ONE_NULL_ENCODING,
+                    )
+
+                yield Benchmark(f"metric.{metric_id}{suffix}", setup_metric)
+
+    for n, d in sizes:
+
+        def setup_random_cd(n=n, d=d):
+            sample = np.random.default_rng(SEED).random((n, d))
+            return lambda: random_cd(
+                np.copy(sample),
+                n_iters=1000,
+                n_nochange=1000,
+                rng=np.random.default_rng(SEED),
+            )
+
+        yield Benchmark(f"random_cd[n{n}-d{d}]", setup_random_cd)
+
+
+def time_benchmark(
+    benchmark: Benchmark, repeat: int, min_time: float
+) -> Dict[str, Any]:
+    """
+    Times a benchmark: the function is called repeat times, and each
+    timing averages as many calls as needed to take at least min_time
+    seconds.
+
+    Returns
+    -------
+    Dict[str, Any]
+        the minimum and median seconds per call and the number of calls
+        per timing, or the error raised by the benchmark
+    """
+    try:
+        # the computations' progress messages and warnings are not
+        # reported
+        with (
+            contextlib.redirect_stdout(io.StringIO()),
+            warnings.catch_warnings(),
+        ):
+            warnings.simplefilter("ignore")
+            f = benchmark.setup()
+
+            # warm-up call, also determines the calls per timing
+            start = time.perf_counter()
+            f()
+            elapsed = time.perf_counter() - start
+            number = max(1, int(min_time / max(elapsed, 1e-9)))
+
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for _ in range(number):
+                    f()
+                timings.append((time.perf_counter() - start) / number)
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def create_metadata() -> Dict[str, Any]:
+    """
+    Describes the environment the benchmarks ran in.
+    """
+    try:
+        from importlib.metadata import version
+
+        raxpy_version = version("raxpy")
+    except Exception:
+        raxpy_version = "unknown"
+
+    return {
+        "created": datetime.datetime.now().isoformat(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "raxpy": raxpy_version,
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+    }
+
+
+def compare_reports(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float,
+    name_filter: str = "",
+) -> List[str]:
+    """
+    Compares the median timings of the benchmarks in both reports and
+    prints the ratio of each.
+
+    Arguments
+    ---------
+    report: Dict[str, Any]
+        the report of the benchmarks run
+    baseline: Dict[str, Any]
+        the baseline report
+    threshold: float
+        the ratio of the baseline median flagged as a regression
+    name_filter: str = ""
+        only the baseline benchmarks containing this are expected to
+        be in the report
+
+    Returns
+    -------
+    List[str]
+        the names of the benchmarks slower than the baseline by more
+        than the threshold ratio or in the baseline but not in the
+        report
+    """
+    regressions = []
+    results = report["results"]
+    baseline_results = baseline["results"]
+    print(f"{'benchmark':<70} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, baseline_result in baseline_results.items():
+        if name_filter in name and name not in results:
+            regressions.append(name)
+            print(f"{name:<70} MISSING")
+    for name, result in results.items():
+        baseline_result = baseline_results.get(name)
+        if (
+            baseline_result is None
+            or "median" not in result
+            or "median" not in baseline_result
+        ):
+            continue
+        ratio = result["median"] / baseline_result["median"]
+        flag = ""
+        if ratio > threshold:
+            regressions.append(name)
+            flag = " REGRESSION"
+        print(
+            f"{name:<70} {baseline_result['median']:>10.2e} "
+            f"{result['median']:>10.2e} {ratio:>7.2f}{flag}"
+        )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the benchmarks, see the module's description.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="path of the JSON report to write")
+    parser.add_argument("--baseline", help="path of a JSON report to compare")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="ratio of the baseline median flagged as a regression",
+    )
+    parser.add_argument(
+        "--filter", default="", help="only run benchmarks containing this"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="minimum seconds of each timing",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="only run the smallest sizes"
+    )
+    args = parser.parse_args(argv)
+
+    sizes = QUICK_SIZES if args.quick else SIZES
+    results = {}
+    for benchmark in create_benchmarks(sizes):
+        if args.filter not in benchmark.name:
+            continue
+        result = time_benchmark(benchmark, args.repeat, args.min_time)
+        results[benchmark.name] = result
+        if "error" in result:
+            print(f"{benchmark.name}: {result['error']}")
+        else:
+            print(f"{benchmark.name}: {result['median']:.3e} s")
+
+    report = {"metadata": create_metadata(), "results": results}
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    failures = [name for name, result in results.items() if "error" in result]
+    if args.baseline is not None:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        failures += compare_reports(
+            report, baseline, args.threshold, args.filter
+        )
+    if len(failures) > 0:
+        print(f"{len(failures)} benchmark(s) failed or regressed")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,10 +6,19 @@ from .annotations import function_spec
 from .annotations.values import *
 from .execute import (
     perform_experiment,
+    resume_experiment,
+    aperform_experiment,
+    iperform_experiment,
+    ExperimentStream,
     design_experiment,
     generate_random_design,
     design_simple_random_experiment,
+    ProcessPoolOrchistrator,
+    PointFailure,
+    AsyncioOrchistrator,
 )
+from .cache import EvaluationCache
+from .journal import ExperimentJournal
 from .decorators import validate_at_runtime
 from .spaces import dim_tags as tags
 from . import spaces
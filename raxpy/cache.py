@@ -0,0 +1,300 @@
+"""
+Provides a persistent cache of the values returned by a subject
+function, so repeated argument sets and re-executed experiments (e.g.,
+after a crash) are not evaluated again.
+"""
+
+import dataclasses
+import enum
+import hashlib
+import pickle
+import sqlite3
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+
+def _canonicalize(value: Any) -> Any:
+    """
+    Helper function that converts an argument value to a structure of
+    builtin values with a deterministic representation: dicts and sets
+    are sorted, dataclasses (i.e., composite dimensions' values) are
+    converted to their type's name and fields, and floats are
+    represented exactly.
+
+    Raises
+    ------
+    TypeError
+        If the value (or a value within it) is not of a supported type;
+        the representation of other objects may not be deterministic
+        (e.g., include a memory address) or may not distinguish values
+    """
+    if value is None or isinstance(value, (bool, int, str, bytes)):
+        return (type(value).__name__, repr(value))
+    if isinstance(value, float):
+        return ("float", float(value).hex())
+    if isinstance(value, np.generic):
+        return _canonicalize(value.item())
+    if isinstance(value, enum.Enum):
+        value_type = type(value)
+        return (
+            f"{value_type.__module__}.{value_type.__qualname__}",
+            value.name,
+        )
+    if isinstance(value, dict):
+        return (
+            "dict",
+            tuple(
+                sorted(
+                    (_canonicalize(k), _canonicalize(v))
+                    for k, v in value.items()
+                )
+            ),
+        )
+    if isinstance(value, (set, frozenset)):
+        return ("set", tuple(sorted(_canonicalize(v) for v in value)))
+    if isinstance(value, (list, tuple)):
+        return (
+            type(value).__name__,
+            tuple(_canonicalize(v) for v in value),
+        )
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        value_type = type(value)
+        return (
+            f"{value_type.__module__}.{value_type.__qualname__}",
+            tuple(
+                (f.name, _canonicalize(getattr(value, f.name)))
+                for f in dataclasses.fields(value)
+            ),
+        )
+    raise TypeError(
+        f"Unable to create a cache key with a value of type "
+        f"{type(value).__qualname__}, specify the key_function of the "
+        "EvaluationCache"
+    )
+
+
+class EvaluationCache:
+    """
+    Stores the values returned by a subject function in a SQLite
+    database, keyed by a hash of the subject's name, a user-supplied
+    subject version and the canonical form of the argument set. The
+    subject version must be changed when the subject's behavior changes
+    to not reuse stale values. If the size of the stored values exceeds
+    a maximum, the least recently used values are evicted.
+
+    Changes are committed every commit_interval changes and when the
+    cache is committed or closed. The total size of the stored values is
+    tracked by the cache object, so a database should not be written by
+    multiple caches at a time when a maximum size is specified.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        subject_version: str = "",
+        max_size_bytes: Optional[int] = None,
+        commit_interval: int = 100,
+        key_function: Optional[Callable[[Dict], str]] = None,
+    ):
+        """
+        Arguments
+        ---------
+        path: str
+            The path of the SQLite database file, created if it does
+            not exist
+        subject_version: str = ""
+            The version of the subject functions' behavior
+        max_size_bytes: Optional[int] = None
+            If specified, the maximum total size of the pickled values
+            stored
+        commit_interval: int = 100
+            The number of changes (stored values and lookups) between
+            commits to the database
+        key_function: Optional[Callable[[Dict], str]] = None
+            If specified, creates the string identifying an argument
+            set, otherwise argument sets are identified by their
+            canonical form (supporting builtin values and dataclasses)
+        """
+        if commit_interval < 1:
+            raise ValueError(
+                f"commit_interval must be at least 1: {commit_interval}"
+            )
+        self.path = path
+        self.subject_version = subject_version
+        self.max_size_bytes = max_size_bytes
+        self.commit_interval = commit_interval
+        self.key_function = key_function
+        self._connection: Optional[sqlite3.Connection] = None
+        self._total_size = 0
+        self._uncommitted_count = 0
+        self._last_access_time = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS evaluations_accessed "
+                "ON evaluations (accessed)"
+            )
+            self._connection.commit()
+            self._total_size = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM evaluations"
+            ).fetchone()[0]
+        return self._connection
+
+    def _create_access_time(self) -> float:
+        # strictly increasing, so the recency of values is ordered
+        self._last_access_time = max(
+            time.time(), self._last_access_time + 1e-6
+        )
+        return self._last_access_time
+
+    def _record_change(self):
+        self._uncommitted_count += 1
+        if self._uncommitted_count >= self.commit_interval:
+            self.commit()
+
+    def commit(self):
+        """
+        Commits the uncommitted changes to the database.
+        """
+        if self._connection is not None and self._uncommitted_count > 0:
+            self._connection.commit()
+        self._uncommitted_count = 0
+
+    def close(self):
+        """
+        Commits the changes and closes the connection to the database,
+        reopened as needed.
+        """
+        if self._connection is not None:
+            self.commit()
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> "EvaluationCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def create_key(self, f: Callable, arg_set: Dict) -> str:
+        """
+        Creates the key of the value returned by f given arg_set.
+
+        Arguments
+        ---------
+        f: Callable
+            the subject function
+        arg_set: Dict
+            the arguments passed to f
+
+        Raises
+        ------
+        TypeError
+            If the arguments cannot be canonicalized and no key_function
+            is specified
+
+        Returns
+        -------
+        str
+            the hex digest identifying the evaluation
+        """
+        subject_name = (
+            f"{getattr(f, '__module__', '')}."
+            f"{getattr(f, '__qualname__', repr(f))}"
+        )
+        if self.key_function is not None:
+            arg_set_form: Any = ("key", self.key_function(arg_set))
+        else:
+            arg_set_form = _canonicalize(arg_set)
+        canonical_form = repr(
+            (subject_name, self.subject_version, arg_set_form)
+        )
+        return hashlib.sha256(canonical_form.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Looks up a stored value, marking it as recently used.
+
+        Arguments
+        ---------
+        key: str
+            the key of the value, see `create_key`
+
+        Returns
+        -------
+        found: bool
+            whether the value is stored
+        value: Any
+            the value if found, otherwise None
+        """
+        connection = self._connect()
+        row = connection.execute(
+            "SELECT value FROM evaluations WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return False, None
+        connection.execute(
+            "UPDATE evaluations SET accessed = ? WHERE key = ?",
+            (self._create_access_time(), key),
+        )
+        self._record_change()
+        return True, pickle.loads(row[0])
+
+    def put(self, key: str, value: Any):
+        """
+        Stores a value, evicting the least recently used values if the
+        maximum size is exceeded.
+
+        Arguments
+        ---------
+        key: str
+            the key of the value, see `create_key`
+        value: Any
+            the picklable value to store
+        """
+        data = pickle.dumps(value)
+        connection = self._connect()
+        row = connection.execute(
+            "SELECT size FROM evaluations WHERE key = ?", (key,)
+        ).fetchone()
+        connection.execute(
+            "INSERT OR REPLACE INTO evaluations (key, value, size, accessed) "
+            "VALUES (?, ?, ?, ?)",
+            (key, data, len(data), self._create_access_time()),
+        )
+        self._total_size += len(data) - (row[0] if row is not None else 0)
+        if (
+            self.max_size_bytes is not None
+            and self._total_size > self.max_size_bytes
+        ):
+            self._evict(connection, self.max_size_bytes)
+        self._record_change()
+
+    def _evict(self, connection: sqlite3.Connection, max_size_bytes: int):
+        evicted_keys = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM evaluations ORDER BY accessed"
+        ):
+            if self._total_size <= max_size_bytes:
+                break
+            evicted_keys.append((key,))
+            self._total_size -= size
+        connection.executemany(
+            "DELETE FROM evaluations WHERE key = ?", evicted_keys
+        )
+
+    def __len__(self) -> int:
+        return (
+            self._connect()
+            .execute("SELECT COUNT(*) FROM evaluations")
+            .fetchone()[0]
+        )
@@ -3,11 +3,14 @@ This module defines the data structures
 used to represent designs of experiments.
 """
 
-from typing import Dict, List, Literal, Optional
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 import numpy as np
+from scipy.spatial.distance import pdist
 
 from ..spaces.root import InputSpace
 
@@ -34,6 +37,13 @@ Encoding = Literal[
     EncodingEnum.NONE,
 ]
 
+# the maximum number of condensed distance matrices cached per design
+DISTANCE_CACHE_SIZE = 16
+
+DistanceKey = Tuple[
+    Optional[Tuple[int, ...]], Optional[Tuple[int, ...]], float
+]
+
 
 @dataclass
 class DesignOfExperiment:
@@ -48,6 +58,31 @@ class DesignOfExperiment:
 
     _decoded_cache: Optional[np.ndarray] = None
     _zero_one_null_encoding_cache: Optional[np.ndarray] = None
+    _distance_cache: "OrderedDict[DistanceKey, np.ndarray]" = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    _distance_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any):
+        if name == "input_sets" and "_distance_lock" in self.__dict__:
+            with self._distance_lock:
+                self._distance_cache.clear()
+        super().__setattr__(name, value)
+
+    def __getstate__(self):
+        # the distance matrices and the lock are not pickled (or
+        # deep-copied) with the design
+        state = self.__dict__.copy()
+        del state["_distance_cache"]
+        del state["_distance_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._distance_cache = OrderedDict()
+        self._distance_lock = threading.Lock()
 
     def __post_init__(self):
         """
@@ -194,24 +229,172 @@ class DesignOfExperiment:
 
         column_indexes = [self.input_set_map[dim_id] for dim_id in dim_set]
 
+        base_design_points = self._get_base_design_points(encoding)
+
+        return DesignOfExperiment(
+            input_space=self.input_space,
+            input_sets=base_design_points[point_row_mask][:, column_indexes],
+            input_set_map={dim_id: i for i, dim_id in enumerate(dim_set)},
+            encoding=encoding,
+        )
+
+    def extract_grouped_points_and_dimensions(
+        self,
+        point_groups: np.ndarray,
+        dim_sets: List[List[str]],
+        encoding: Encoding,
+    ) -> List["DesignOfExperiment"]:
+        """
+        Extracts a sub-design for each group of points, equivalent to
+        calling `extract_points_and_dimensions` with the row mask of
+        each group. The rows are ordered by group once, so each group's
+        rows are a contiguous slice of the ordered points. The
+        sub-designs' input_sets are views of the ordered points when
+        the group's columns are a contiguous range, otherwise a copy of
+        the group's rows only, and must not be modified.
+
+        Arguments
+        ---------
+        self
+            the parent design
+        point_groups : np.ndarray
+            the index of the group in dim_sets each row belongs to
+        dim_sets : List[List[str]]
+            the id of the columns that should be included in the
+            extracted design of each group
+        encoding: Encoding
+
+        Returns
+        -------
+        List[DesignOfExperiment]
+            a sub design for each group, in the order of dim_sets
+        """
+        base_design_points = self._get_base_design_points(encoding)
+
+        point_groups = np.asarray(point_groups, dtype=np.int64)
+        row_order = np.argsort(point_groups, kind="stable")
+        if np.all(row_order == np.arange(len(row_order))):
+            # the rows are already grouped
+            ordered_points = base_design_points
+        else:
+            ordered_points = base_design_points[row_order]
+        group_offsets = np.concatenate(
+            (
+                [0],
+                np.cumsum(np.bincount(point_groups, minlength=len(dim_sets))),
+            )
+        )
+
+        sub_designs = []
+        for i, dim_set in enumerate(dim_sets):
+            group_points = ordered_points[
+                group_offsets[i] : group_offsets[i + 1]
+            ]
+            column_indexes = [
+                self.input_set_map[dim_id] for dim_id in dim_set
+            ]
+            if len(column_indexes) > 0 and column_indexes == list(
+                range(column_indexes[0], column_indexes[-1] + 1)
+            ):
+                group_points = group_points[
+                    :, column_indexes[0] : column_indexes[-1] + 1
+                ]
+            else:
+                group_points = group_points[:, column_indexes]
+
+            sub_designs.append(
+                DesignOfExperiment(
+                    input_space=self.input_space,
+                    input_sets=group_points,
+                    input_set_map={
+                        dim_id: k for k, dim_id in enumerate(dim_set)
+                    },
+                    encoding=encoding,
+                )
+            )
+        return sub_designs
+
+    def _get_base_design_points(self, encoding: Encoding) -> np.ndarray:
+        """
+        Gets the data points of the design to extract sub-designs from
+        given the encoding.
+        """
         if encoding == EncodingEnum.NONE:
-            base_design_points = self.decoded_input_sets
+            return self.decoded_input_sets
         elif encoding == EncodingEnum.ZERO_ONE_NULL_ENCODING:
-            base_design_points = self.zero_one_null_input_sets
+            return self.zero_one_null_input_sets
         else:
             if EncodingEnum.ZERO_ONE_RAW_ENCODING == self.encoding:
-                base_design_points = self.input_sets
+                return self.input_sets
             else:
                 raise ValueError(
                     "Unable to derive a zero-one-raw encoding due to information loss"
                 )
 
-        return DesignOfExperiment(
-            input_space=self.input_space,
-            input_sets=base_design_points[point_row_mask][:, column_indexes],
-            input_set_map={dim_id: i for i, dim_id in enumerate(dim_set)},
-            encoding=encoding,
+    def get_condensed_distances(
+        self,
+        rows: Optional[Sequence[int]] = None,
+        columns: Optional[Sequence[int]] = None,
+        p: float = 2,
+    ) -> np.ndarray:
+        """
+        Gets the condensed matrix of the Minkowski p-norm distances
+        between the rows of input_sets, projected onto columns (see
+        `scipy.spatial.distance.pdist`). The most recently used
+        `DISTANCE_CACHE_SIZE` matrices are cached, so metrics computed
+        with the same design (possibly in multiple threads) share them;
+        the cache is cleared when input_sets is assigned. The returned
+        numpy array must not be modified.
+
+        Arguments
+        ---------
+        rows : Optional[Sequence[int]]
+            the indexes of the rows to include, all rows if None
+        columns : Optional[Sequence[int]]
+            the indexes of the columns to include, all columns if None
+        p:float=2
+            Which Minkowski p-norm to use in the distance computation
+
+        Returns
+        -------
+        np.ndarray
+            the distance between rows i < j at index
+            n * i + j - ((i + 2) * (i + 1)) // 2
+        """
+        key = (
+            None if rows is None else tuple(rows),
+            None if columns is None else tuple(columns),
+            p,
         )
+        with self._distance_lock:
+            distances = self._distance_cache.get(key)
+            if distances is not None:
+                self._distance_cache.move_to_end(key)
+                return distances
+
+        # computed without holding the lock, so distances of other keys
+        # are computed concurrently
+        input_sets = self.input_sets
+        points = input_sets
+        if rows is not None:
+            points = points[list(rows)]
+        if columns is not None:
+            points = points[:, list(columns)]
+        if p == 2:
+            distances = pdist(points, "euclidean")
+        elif p == np.inf:
+            distances = pdist(points, "chebyshev")
+        else:
+            distances = pdist(points, "minkowski", p=p)
+
+        with self._distance_lock:
+            if self.input_sets is not input_sets:
+                # input_sets was assigned while computing the distances
+                return distances
+            self._distance_cache[key] = distances
+            while len(self._distance_cache) > DISTANCE_CACHE_SIZE:
+                self._distance_cache.popitem(last=False)
+        return distances
 
     def get_data_points(self, encoding: EncodingEnum):
         """
@@ -283,3 +466,30 @@ class DesignOfExperiment:
             encoding=self.encoding,
         )
         return design_copy
+
+
+def spawn_rngs(
+    rng: np.random.Generator, n: int
+) -> List[np.random.Generator]:
+    """
+    Creates n independent random number generators seeded from rng,
+    so work split across processes stays reproducible given rng.
+
+    Arguments
+    ---------
+    rng: np.random.Generator
+        the random number generator to spawn from
+    n: int
+        the number of random number generators to create
+
+    Returns
+    -------
+    List[np.random.Generator]
+        the spawned random number generators
+    """
+    if hasattr(rng, "spawn"):
+        return rng.spawn(n)
+
+    # numpy < 1.25 does not support spawning generators
+    seeds = rng.integers(0, np.iinfo(np.int64).max, size=n)
+    return [np.random.default_rng(int(seed)) for seed in seeds]
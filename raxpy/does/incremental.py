@@ -0,0 +1,243 @@
+"""
+Provides design measurements that are updated incrementally as the
+values of a design are swapped within columns, the elementary move of
+the design optimizers. Optimizers can track (or optimize) any of these
+metrics at a cost of O(n) per move instead of measuring the design
+from scratch (see the tracked_metrics of
+`raxpy.does.maxpro.optimize_design_with_sa` and
+`raxpy.does.scipy_optimizations.random_cd`).
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import numpy as np
+from scipy.stats.qmc import discrepancy
+
+from .doe import DesignOfExperiment, EncodingEnum
+from .maxpro import MaxProPairMatrix, _derive_max_pro_column_factors
+from .measure import (
+    _compute_min_column_gaps,
+    _compute_nan_distance_matrix,
+    _compute_nan_distance_tile,
+)
+from .scipy_optimizations import CenteredDiscrepancyCache
+
+
+class IncrementalMetric(ABC):
+    """
+    Base class of the metrics tracked incrementally. A metric is
+    initialized with a design, keeping its own copy of the design's
+    data points, and then notified of each swap of two values within a
+    column. Swapping the same values again reverts a swap.
+    """
+
+    def __init__(self, encoding: Optional[EncodingEnum] = None):
+        """
+        Arguments
+        ---------
+        encoding: Optional[EncodingEnum] = None
+            The encoding of the data points to measure, otherwise use
+            the design's encoding
+        """
+        self.encoding = encoding
+
+    def _get_data_points(self, design: DesignOfExperiment) -> np.ndarray:
+        """
+        Copies the data points of the design to measure.
+        """
+        if self.encoding is None:
+            return np.array(design.input_sets, dtype=float)
+        return np.array(design.get_data_points(self.encoding), dtype=float)
+
+    @abstractmethod
+    def init(self, design: DesignOfExperiment) -> None:
+        """
+        Measures the design from scratch.
+
+        Arguments
+        ---------
+        design: DesignOfExperiment
+            the design to measure
+        """
+
+    @abstractmethod
+    def on_swap(self, i: int, j: int, k: int) -> None:
+        """
+        Updates the measurement after the values of rows i and j in
+        column k were swapped.
+
+        Arguments
+        ---------
+        i: int
+            the first row of the swap
+        j: int
+            the second row of the swap
+        k: int
+            the column of the swap
+        """
+
+    @abstractmethod
+    def value(self) -> float:
+        """
+        Returns
+        -------
+        float
+            the measurement of the design with the swaps applied
+        """
+
+
+class IncrementalMaxPro(IncrementalMetric):
+    """
+    Tracks the MaxPro measurement of a design (see
+    `raxpy.does.measure.compute_max_pro`) with the cached pair terms
+    of a `MaxProPairMatrix`. Like the MaxPro optimizers, swaps must
+    exchange non-null values.
+    """
+
+    def __init__(
+        self,
+        encoding: Optional[EncodingEnum] = EncodingEnum.ZERO_ONE_NULL_ENCODING,
+    ):
+        """
+        Arguments
+        ---------
+        encoding: Optional[EncodingEnum] = EncodingEnum.ZERO_ONE_NULL_ENCODING
+            The encoding of the data points to measure, otherwise use
+            the design's encoding; the level factors of the MaxPro
+            distances assume the zero-one-null encoding
+        """
+        super().__init__(encoding)
+
+    def init(self, design: DesignOfExperiment) -> None:
+        level_factors, null_aware = _derive_max_pro_column_factors(design)
+        with np.errstate(all="ignore"):
+            self._pair_matrix = MaxProPairMatrix(
+                self._get_data_points(design), level_factors, null_aware
+            )
+        n, d = self._pair_matrix.x.shape
+        self._normalization = n * (n - 1)
+        self._d = d
+
+    def on_swap(self, i: int, j: int, k: int) -> None:
+        with np.errstate(all="ignore"):
+            self._pair_matrix.swap(i, j, k)
+        self._pair_matrix.commit()
+
+    def value(self) -> float:
+        return (self._pair_matrix.value / self._normalization) ** (
+            1.0 / self._d
+        )
+
+
+class IncrementalCenteredDiscrepancy(IncrementalMetric):
+    """
+    Tracks the centered discrepancy of a design without null values
+    with the cached terms of a `CenteredDiscrepancyCache`.
+    """
+
+    def init(self, design: DesignOfExperiment) -> None:
+        sample = self._get_data_points(design)
+        if np.any(np.isnan(sample)):
+            raise ValueError(
+                "Unable to compute the centered discrepancy of a design "
+                "with null values"
+            )
+        self._disc = discrepancy(sample, method="CD")
+        self._cache = CenteredDiscrepancyCache(sample)
+
+    def on_swap(self, i: int, j: int, k: int) -> None:
+        self._disc = self._cache.perturb_discrepancy(i, j, k, self._disc)
+        self._cache.swap(i, j, k)
+
+    def value(self) -> float:
+        return self._disc
+
+
+class IncrementalMinInterpointDistance(IncrementalMetric):
+    """
+    Tracks the minimum null-aware distance between two points of a
+    design (see `raxpy.does.measure.compute_min_interpoint_dist`). The
+    distance matrix and the minimum distance of each point are cached,
+    so a swap recomputes the distances of the two swapped points and
+    only rescans the points whose nearest point was one of them and
+    moved away.
+    """
+
+    def __init__(self, encoding: Optional[EncodingEnum] = None, p: float = 2):
+        """
+        Arguments
+        ---------
+        encoding: Optional[EncodingEnum] = None
+            The encoding of the data points to measure, otherwise use
+            the design's encoding
+        p:float=2
+            Which Minkowski p-norm to use in the distance computation
+        """
+        super().__init__(encoding)
+        self.p = p
+
+    def init(self, design: DesignOfExperiment) -> None:
+        self._x = self._get_data_points(design)
+        self._dm = _compute_nan_distance_matrix(self._x, p=self.p)
+        np.fill_diagonal(self._dm, np.inf)
+        self._row_mins = np.min(self._dm, axis=1)
+
+    def on_swap(self, i: int, j: int, k: int) -> None:
+        if i == j:
+            return
+        x = self._x
+        x[i, k], x[j, k] = x[j, k], x[i, k]
+
+        old_distances = self._dm[[i, j], :]
+        new_distances = _compute_nan_distance_tile(x[[i, j]], x, p=self.p)
+        # a point is not paired with itself
+        new_distances[0, i] = np.inf
+        new_distances[1, j] = np.inf
+
+        self._dm[[i, j], :] = new_distances
+        self._dm[:, [i, j]] = new_distances.T
+
+        # the points whose nearest point moved away must be rescanned
+        rescan = np.any(
+            (old_distances == self._row_mins)
+            & (new_distances > old_distances),
+            axis=0,
+        )
+        rescan[[i, j]] = True
+        self._row_mins = np.minimum(
+            self._row_mins, np.min(new_distances, axis=0)
+        )
+        self._row_mins[rescan] = np.min(self._dm[rescan], axis=1)
+
+    def value(self) -> float:
+        return np.min(self._row_mins)
+
+
+class IncrementalMinProjectedDistance(IncrementalMetric):
+    """
+    Tracks the minimum projected distance of a design (see
+    `raxpy.does.measure.compute_min_projected_distance`). A swap
+    exchanges values within a column, so the sorted values of every
+    column, and the metric, do not change.
+    """
+
+    def init(self, design: DesignOfExperiment) -> None:
+        dim_map = design.input_space.create_dim_map()
+        column_indexes = [
+            column_i
+            for dim_id, column_i in design.input_set_map.items()
+            if not dim_map[dim_id].has_child_dimensions()
+        ]
+        self._value = np.min(
+            _compute_min_column_gaps(
+                self._get_data_points(design)[:, column_indexes]
+            ),
+            initial=np.inf,
+        )
+
+    def on_swap(self, i: int, j: int, k: int) -> None:
+        pass
+
+    def value(self) -> float:
+        return self._value
@@ -0,0 +1,528 @@
+"""
+Provides compiled kernels of the design optimization and measurement
+loops. The kernels are compiled with numba, imported when the numba
+backend is first requested, if the `numba` optional dependencies are
+installed (`pip install raxpy[numba]`); otherwise the optimizers fall
+back to their NumPy implementations and the measurement loops run as
+plain Python.
+"""
+
+import math
+import warnings
+from typing import Callable, Dict
+
+import numpy as np
+
+NUMPY_BACKEND = "numpy"
+NUMBA_BACKEND = "numba"
+
+# smallest factor considered, avoids taking the log of zero
+# distances when points share a value in a non-null-aware column
+MIN_FACTOR = np.finfo(float).tiny
+
+# ratio the objective can drop within a swap before the running
+# sum is recomputed to avoid accumulating cancellation errors
+RESUM_RATIO = 1e-6
+
+# the Python functions of the kernels to compile, see `_jit`
+_python_kernels: Dict[str, Callable] = {}
+
+# whether the kernels were compiled, see `compile_kernels`
+_compiled = False
+
+
+def compile_kernels() -> bool:
+    """
+    Imports numba and compiles the kernels of this module, once. The
+    kernels are compiled lazily by numba when first called, and the
+    compiled kernels are cached on disk so later processes load them
+    instead of compiling them again.
+
+    Returns
+    -------
+    bool
+        whether the kernels were compiled, False if numba is not
+        installed
+    """
+    global _compiled
+    if not _compiled:
+        try:
+            import numba
+        except ImportError:
+            return False
+        # the compiled kernels replace the module's functions, so
+        # kernels calling other kernels call the compiled versions
+        for name, f in _python_kernels.items():
+            globals()[name] = numba.njit(f, cache=True)
+        _compiled = True
+    return True
+
+
+def resolve_backend(backend: str) -> str:
+    """
+    Resolves the backend to use for a design optimizer.
+
+    Arguments
+    ---------
+    backend: str
+        the requested backend, either "numpy" or "numba"
+
+    Raises
+    ------
+    ValueError
+        If the backend is not supported
+
+    Returns
+    -------
+    str
+        the requested backend, or "numpy" if numba is
+        requested but not installed
+    """
+    if backend == NUMBA_BACKEND:
+        if not compile_kernels():
+            warnings.warn(
+                "numba is not installed, falling back to the numpy backend"
+            )
+            return NUMPY_BACKEND
+        return NUMBA_BACKEND
+    elif backend == NUMPY_BACKEND:
+        return NUMPY_BACKEND
+
+    raise ValueError(f"Unsupported optimization backend: {backend}")
+
+
+def _jit(f):
+    """
+    Registers f as a kernel compiled with numba by `compile_kernels`.
+    """
+    _python_kernels[f.__name__] = f
+    return f
+
+
+@_jit
+def _max_pro_log_factor(v1, v2, null2, level_factor, null_aware):
+    if null2 and null_aware:
+        f = 1.0 + level_factor
+    else:
+        f = abs(v1 - v2) + level_factor
+    if f < MIN_FACTOR:
+        f = MIN_FACTOR
+    return 2.0 * math.log(f)
+
+
+@_jit
+def _max_pro_pair_value(log_product, min_log_product):
+    if log_product < min_log_product:
+        log_product = min_log_product
+    return math.exp(-log_product)
+
+
+@_jit
+def _max_pro_sum_pair_values(log_products, min_log_product):
+    n = log_products.shape[0]
+    total = 0.0
+    for i in range(n - 1):
+        for j in range(i + 1, n):
+            total += _max_pro_pair_value(log_products[i, j], min_log_product)
+    return total
+
+
+@_jit
+def _max_pro_rollback(
+    x, log_products, undo_cells, undo_rows_i, undo_rows_j, undo_values, count
+):
+    value = 0.0
+    for u in range(count - 1, -1, -1):
+        i = undo_cells[u, 0]
+        j = undo_cells[u, 1]
+        k = undo_cells[u, 2]
+        v = x[i, k]
+        x[i, k] = x[j, k]
+        x[j, k] = v
+        log_products[i, :] = undo_rows_i[u]
+        log_products[:, i] = undo_rows_i[u]
+        log_products[j, :] = undo_rows_j[u]
+        log_products[:, j] = undo_rows_j[u]
+        value = undo_values[u]
+    return value
+
+
+@_jit
+def anneal_max_pro(
+    x,
+    log_products,
+    null_mask,
+    level_factors,
+    null_aware,
+    min_log_product,
+    value,
+    swap_columns,
+    row_offsets,
+    rows_flat,
+    draws,
+    temperatures,
+    max_rabbit_whole_threshold,
+    max_attempt_from_best_count,
+):
+    """
+    Compiled version of the simulated annealing loop of
+    `raxpy.does.maxpro.optimize_design_with_sa`. The design x and the
+    cached log products are updated in-place.
+
+    Arguments
+    ---------
+    x
+        the design matrix
+    log_products
+        the log of the squared distance products of every pair of points
+    null_mask
+        the null mask of x
+    level_factors
+        the level factor of each column
+    null_aware
+        mask of the columns using null-aware distances
+    min_log_product
+        the lower bound of the log products used to compute pair terms
+    value
+        the MaxPro objective of x
+    swap_columns
+        the columns to swap values in
+    row_offsets
+        offsets of each swap column's rows within rows_flat
+    rows_flat
+        the concatenated non-null rows of each swap column
+    draws
+        uniform random values, a row of four values for each iteration
+    temperatures
+        the annealing temperature of each iteration
+    max_rabbit_whole_threshold
+        the number of rejected swaps before reverting to the best design
+    max_attempt_from_best_count
+        the number of iterations without improvement before stopping
+
+    Returns
+    -------
+    float
+        the MaxPro objective of the optimized design
+    """
+    n = x.shape[0]
+    n_columns = swap_columns.shape[0]
+
+    undo_cells = np.empty((max_rabbit_whole_threshold, 3), dtype=np.int64)
+    undo_rows_i = np.empty((max_rabbit_whole_threshold, n))
+    undo_rows_j = np.empty((max_rabbit_whole_threshold, n))
+    undo_values = np.empty(max_rabbit_whole_threshold)
+    undo_count = 0
+
+    best_value = value
+    dig_count = 0
+    attempt_from_best_count = 0
+
+    for it in range(draws.shape[0]):
+        dig_count += 1
+        attempt_from_best_count += 1
+        if attempt_from_best_count > max_attempt_from_best_count:
+            break
+
+        c = int(draws[it, 0] * n_columns)
+        k = swap_columns[c]
+        start = row_offsets[c]
+        m = row_offsets[c + 1] - start
+        a = int(draws[it, 1] * m)
+        b = int(draws[it, 2] * (m - 1))
+        if b >= a:
+            b += 1
+        i = rows_flat[start + a]
+        j = rows_flat[start + b]
+
+        undo_cells[undo_count, 0] = i
+        undo_cells[undo_count, 1] = j
+        undo_cells[undo_count, 2] = k
+        undo_rows_i[undo_count, :] = log_products[i, :]
+        undo_rows_j[undo_count, :] = log_products[j, :]
+        undo_values[undo_count] = value
+        undo_count += 1
+
+        x_i = x[i, k]
+        x_j = x[j, k]
+        level_factor = level_factors[k]
+        aware = null_aware[k]
+
+        delta_i = 0.0
+        delta_j = 0.0
+        for r in range(n):
+            if r == i or r == j:
+                continue
+            x_r = x[r, k]
+            null_r = null_mask[r, k]
+            old_i = _max_pro_pair_value(log_products[i, r], min_log_product)
+            old_j = _max_pro_pair_value(log_products[j, r], min_log_product)
+
+            log_products[i, r] += _max_pro_log_factor(
+                x_j, x_r, null_r, level_factor, aware
+            ) - _max_pro_log_factor(x_i, x_r, null_r, level_factor, aware)
+            log_products[r, i] = log_products[i, r]
+            log_products[j, r] += _max_pro_log_factor(
+                x_i, x_r, null_r, level_factor, aware
+            ) - _max_pro_log_factor(x_j, x_r, null_r, level_factor, aware)
+            log_products[r, j] = log_products[j, r]
+
+            delta_i += (
+                _max_pro_pair_value(log_products[i, r], min_log_product)
+                - old_i
+            )
+            delta_j += (
+                _max_pro_pair_value(log_products[j, r], min_log_product)
+                - old_j
+            )
+
+        x[i, k] = x_j
+        x[j, k] = x_i
+
+        new_value = value + delta_i + delta_j
+        if new_value < value * RESUM_RATIO:
+            new_value = _max_pro_sum_pair_values(log_products, min_log_product)
+        value = new_value
+
+        if value < best_value or (
+            math.exp(-(value - best_value) / temperatures[it]) > draws[it, 3]
+        ):
+            undo_count = 0
+            best_value = value
+            attempt_from_best_count = 0
+            dig_count = 0
+        elif dig_count >= max_rabbit_whole_threshold:
+            dig_count = 0
+            value = _max_pro_rollback(
+                x,
+                log_products,
+                undo_cells,
+                undo_rows_i,
+                undo_rows_j,
+                undo_values,
+                undo_count,
+            )
+            undo_count = 0
+
+    if undo_count > 0:
+        value = _max_pro_rollback(
+            x,
+            log_products,
+            undo_cells,
+            undo_rows_i,
+            undo_rows_j,
+            undo_values,
+            undo_count,
+        )
+
+    return value
+
+
+@_jit
+def _perturb_discrepancy(z, abs_z, pair_products, g, h, i1, i2, k, disc):
+    """
+    Compiled version of
+    `raxpy.does.scipy_optimizations.CenteredDiscrepancyCache.perturb_discrepancy`.
+    """
+    n = z.shape[0]
+
+    z_i1k = z[i1, k]
+    z_i2k = z[i2, k]
+
+    # Eq (20)
+    c_i1i1 = 1.0 / n**2 * g[i1] - 2.0 / n * h[i1]
+    c_i2i2 = 1.0 / n**2 * g[i2] - 2.0 / n * h[i2]
+
+    sum_ = 0.0
+    for m in range(n):
+        if m == i1 or m == i2:
+            continue
+        c_i1j = pair_products[i1, m]
+        c_i2j = pair_products[i2, m]
+
+        # Eq (22), typo in the article in the denominator i2 -> i1
+        num = 2 + abs(z_i2k) + abs_z[m, k] - abs(z_i2k - z[m, k])
+        denum = 2 + abs(z_i1k) + abs_z[m, k] - abs(z_i1k - z[m, k])
+        gamma = num / denum
+
+        # Eq (23), (24)
+        c_p_i1j = gamma * c_i1j
+        c_p_i2j = c_i2j / gamma
+
+        sum_ += c_p_i1j - c_i1j + c_p_i2j - c_i2j
+
+    alpha = (1 + abs(z_i2k)) / (1 + abs(z_i1k))
+    beta = (2 - abs(z_i2k)) / (2 - abs(z_i1k))
+
+    # Eq (25), typo in the article g is missing
+    c_p_i1i1 = (g[i1] * alpha) / (n**2) - (2.0 * alpha * beta * h[i1] / n)
+    # Eq (26), typo in the article n ** 2
+    c_p_i2i2 = (g[i2] / ((n**2) * alpha)) - (2.0 * h[i2] / (n * alpha * beta))
+
+    return disc + c_p_i1i1 - c_i1i1 + c_p_i2i2 - c_i2i2 + 2 * sum_
+
+
+@_jit
+def _update_discrepancy_row(z, abs_z, pair_products, g, h, i):
+    """
+    Compiled version of
+    `raxpy.does.scipy_optimizations.CenteredDiscrepancyCache._update_row`.
+    """
+    n = z.shape[0]
+    d = z.shape[1]
+
+    for m in range(n):
+        # Eq (19)
+        p = 1.0
+        for k in range(d):
+            p *= 0.5 * (
+                2.0 + abs_z[i, k] + abs_z[m, k] - abs(z[i, k] - z[m, k])
+            )
+        pair_products[i, m] = 1.0 / n**2.0 * p
+        pair_products[m, i] = pair_products[i, m]
+
+    # Eq (20)
+    g_i = 1.0
+    h_i = 1.0
+    for k in range(d):
+        g_i *= 1.0 + abs_z[i, k]
+        h_i *= 1.0 + 0.5 * abs_z[i, k] - 0.5 * z[i, k] ** 2
+    g[i] = g_i
+    h[i] = h_i
+
+
+@_jit
+def random_cd_block(
+    sample,
+    z,
+    abs_z,
+    pair_products,
+    g,
+    h,
+    disc,
+    cols,
+    rows_1,
+    rows_2,
+    n_nochange,
+    nochange,
+):
+    """
+    Compiled version of a block of iterations of
+    `raxpy.does.scipy_optimizations.random_cd`. The sample and the
+    cached discrepancy terms are updated in-place.
+
+    Arguments
+    ---------
+    sample
+        the sample to optimize
+    z
+        the centered sample
+    abs_z
+        the absolute values of the centered sample
+    pair_products
+        the cached row-pair kernel terms
+    g
+        the cached per-row products of Eq (20)
+    h
+        the cached per-row products of Eq (20)
+    disc
+        the centered discrepancy of the sample
+    cols
+        the column of each iteration's permutation
+    rows_1
+        the first row of each iteration's permutation
+    rows_2
+        the second row of each iteration's permutation
+    n_nochange
+        the number of iterations without improvement before stopping
+    nochange
+        the number of iterations without improvement before this block
+
+    Returns
+    -------
+    disc : float
+        the centered discrepancy of the sample
+    nochange : int
+        the number of iterations without improvement
+    iterations : int
+        the number of iterations performed
+    """
+    iterations = 0
+    for it in range(cols.shape[0]):
+        if nochange >= n_nochange:
+            break
+        iterations += 1
+
+        col = cols[it]
+        row_1 = rows_1[it]
+        row_2 = rows_2[it]
+        new_disc = _perturb_discrepancy(
+            z, abs_z, pair_products, g, h, row_1, row_2, col, disc
+        )
+        if new_disc < disc:
+            for a in (sample, z, abs_z):
+                v = a[row_1, col]
+                a[row_1, col] = a[row_2, col]
+                a[row_2, col] = v
+            _update_discrepancy_row(z, abs_z, pair_products, g, h, row_1)
+            _update_discrepancy_row(z, abs_z, pair_products, g, h, row_2)
+            disc = new_disc
+            nochange = 0
+        else:
+            nochange += 1
+
+    return disc, nochange, iterations
+
+
+@_jit
+def count_dominated_points_2d(
+    sorted_values_1, value_ranks_2, sorted_queries_1, query_ranks_2, rank_count
+):
+    """
+    Counts the points dominated by each query point in two dimensions,
+    sweeping the points and queries in order of their first value and
+    counting the ranks of the points' second value with a Fenwick tree.
+
+    Arguments
+    ---------
+    sorted_values_1
+        the first value of the points, sorted ascending
+    value_ranks_2
+        the 1-based rank of the second value of the points, in the
+        order of sorted_values_1
+    sorted_queries_1
+        the first value of the query points, sorted ascending
+    query_ranks_2
+        the number of distinct second point values less than or equal
+        to the second value of the query points, in the order of
+        sorted_queries_1
+    rank_count
+        the number of distinct second point values
+
+    Returns
+    -------
+    np.ndarray
+        the number of points with values less than or equal to the
+        values of each query point, in the order of sorted_queries_1
+    """
+    tree = np.zeros(rank_count + 1, dtype=np.int64)
+    counts = np.zeros(sorted_queries_1.shape[0], dtype=np.int64)
+    j = 0
+    for q in range(sorted_queries_1.shape[0]):
+        while (
+            j < sorted_values_1.shape[0]
+            and sorted_values_1[j] <= sorted_queries_1[q]
+        ):
+            r = value_ranks_2[j]
+            while r <= rank_count:
+                tree[r] += 1
+                r += r & -r
+            j += 1
+
+        r = query_ranks_2[q]
+        count = 0
+        while r > 0:
+            count += tree[r]
+            r -= r & -r
+        counts[q] = count
+    return counts
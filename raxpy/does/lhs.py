@@ -4,6 +4,7 @@ LatinHypercube designs for InputSpaces.
 """
 
 from typing import Dict, List, Optional, Tuple, Literal, cast
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 from scipy.stats.qmc import LatinHypercube
@@ -15,7 +16,7 @@ from ..spaces.root import (
     create_level_iterable,
     create_all_iterable,
 )
-from .doe import DesignOfExperiment, EncodingEnum
+from .doe import DesignOfExperiment, EncodingEnum, spawn_rngs
 from .full_sub_spaces import (
     SubSpaceTargetAllocations,
     allocate_points_to_full_sub_spaces,
@@ -755,6 +756,39 @@ class ValuePool:
         return selected_values
 
 
+def _optimize_and_decode_sub_space_points(
+    space: InputSpace,
+    data_points: np.ndarray,
+    part_input_set_map: Dict[str, int],
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Optimizes the centered discrepancy of a sub-space's data points
+    and decodes them to the values of the sub-space's dimensions.
+
+    Arguments
+    ---------
+    space : InputSpace
+        the space the sub-space belongs to
+    data_points : np.ndarray
+        the zero-one data points of the sub-space's dimensions
+    part_input_set_map : Dict[str, int]
+        the column of each dimension in data_points
+    rng : np.random.Generator
+        Random number generator used to optimize the data points
+
+    Returns
+    -------
+    np.ndarray
+        the decoded data points
+    """
+    data_points = random_cd(data_points, 20000, 200, rng=rng)
+
+    return space.decode_zero_one_matrix(
+        data_points, part_input_set_map, utilize_null_portions=False
+    )
+
+
 def generate_seperate_designs_by_full_subspace_and_pool(
     space: InputSpace,
     n_points: int,
@@ -764,6 +798,7 @@ def generate_seperate_designs_by_full_subspace_and_pool(
     ] = None,
     boundary_mode: bool = True,
     rng: Optional[np.random.Generator] = None,
+    n_jobs: int = 1,
 ) -> DesignOfExperiment:
     """
     Generates an experiment design for the provided space by first
@@ -773,6 +808,12 @@ def generate_seperate_designs_by_full_subspace_and_pool(
     samples to a design that matches the sub-space allocations and
     optimizes this centered discrepency of the design.
 
+    The values of the sub-spaces are pulled from the pools serially;
+    the optimization and decoding of each sub-space's points is then
+    independent and uses a random number generator spawned from rng,
+    so it can run in a pool of n_jobs processes without changing the
+    design.
+
     Arguments
     ---------
     space : InputSpace
@@ -788,6 +829,10 @@ def generate_seperate_designs_by_full_subspace_and_pool(
         the boundary values for each continous/float dimension.
     rng:Optional[np.random.Generator]
         Random number generator to support design creation
+    n_jobs:int=1
+        the number of processes used to optimize and decode the points
+        of the sub-spaces; 1 processes the sub-spaces in the calling
+        process
     Returns
     -------
     DesignOfExperiment :
@@ -831,7 +876,13 @@ def generate_seperate_designs_by_full_subspace_and_pool(
     if rng is None:
         rng = np.random.default_rng()
 
-    # create designs for sub-spaces given the allocated points counts
+    # the sub-space points to optimize and decode, with the rows
+    # and columns of the final design to assign the decoded points to
+    sub_space_tasks: List[
+        Tuple[np.ndarray, Dict[str, int], slice, List[int]]
+    ] = []
+
+    # pull the values of the sub-spaces given the allocated points counts
     for i, sub_space_allocation in enumerate(sorted_allocations):
         points_to_create = sub_space_allocation.allocated_point_count
 
@@ -840,13 +891,8 @@ def generate_seperate_designs_by_full_subspace_and_pool(
             continue
 
         # compute the rows that will specified
-        a_lb_index = lb_index
-        ub_index = lb_index + points_to_create
-        lb_index = ub_index
-        row_mask = [
-            True if (i >= a_lb_index and i < ub_index) else False
-            for i in range(n_points)
-        ]
+        rows = slice(lb_index, lb_index + points_to_create)
+        lb_index += points_to_create
 
         # since the subspace dictakes the values of composite and variant
         # dimensions, exclude them and manually set the values of these
@@ -873,19 +919,11 @@ def generate_seperate_designs_by_full_subspace_and_pool(
                 rng.shuffle(data_points[i, :])
             data_points = data_points.T
 
-            from .scipy_optimizations import random_cd
-
-            data_points = random_cd(data_points, 20000, 200, rng=rng)
-
             part_input_set_map = {}
+            dim_indices = []
             for i, dim in enumerate(active_dims):
                 part_input_set_map[dim.id] = i
 
-            decoded_data_points = space.decode_zero_one_matrix(
-                data_points, part_input_set_map, utilize_null_portions=False
-            )
-
-            for i, dim in enumerate(active_dims):
                 if dim.id not in input_set_map:
                     dim_index = active_index
                     active_index += 1
@@ -894,10 +932,11 @@ def generate_seperate_designs_by_full_subspace_and_pool(
                     input_set_map[dim.id] = dim_index
                 else:
                     dim_index = input_set_map[dim.id]
+                dim_indices.append(dim_index)
 
-                final_data_points[row_mask, dim_index] = decoded_data_points[
-                    :, i
-                ]
+            sub_space_tasks.append(
+                (data_points, part_input_set_map, rows, dim_indices)
+            )
 
         if len(fixed_dims) > 0:
 
@@ -924,7 +963,33 @@ def generate_seperate_designs_by_full_subspace_and_pool(
                                 v = i
                                 break
 
-                    final_data_points[row_mask, dim_index] = v
+                    final_data_points[rows, dim_index] = v
+
+    # optimize and decode the points of each sub-space
+    task_rngs = spawn_rngs(rng, len(sub_space_tasks))
+    task_args = [
+        (space, data_points, part_input_set_map, task_rng)
+        for (data_points, part_input_set_map, _, _), task_rng in zip(
+            sub_space_tasks, task_rngs
+        )
+    ]
+
+    if n_jobs > 1 and len(task_args) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [
+                executor.submit(_optimize_and_decode_sub_space_points, *args)
+                for args in task_args
+            ]
+            decoded_sub_spaces = [future.result() for future in futures]
+    else:
+        decoded_sub_spaces = [
+            _optimize_and_decode_sub_space_points(*args) for args in task_args
+        ]
+
+    for (_, _, rows, dim_indices), decoded_data_points in zip(
+        sub_space_tasks, decoded_sub_spaces
+    ):
+        final_data_points[rows, dim_indices] = decoded_data_points
 
     # adjust if some dimensions never sampled
     if total_dim_count > len(input_set_map):
@@ -9,13 +9,17 @@ for more details about MaxPro.
 https://par.nsf.gov/servlets/purl/10199193
 """
 
-from typing import Optional, cast
+from typing import List, Optional, Tuple, cast
+from concurrent.futures import ProcessPoolExecutor
+import copy
 import math
+import os
 import numpy as np
 from ..spaces.complexity import estimate_complexity
 
 from .. import spaces as s
-from .doe import DesignOfExperiment, EncodingEnum
+from .doe import DesignOfExperiment, EncodingEnum, spawn_rngs
+from . import kernels
 
 
 def _create_max_pro_dist_func(dim):
@@ -33,45 +37,265 @@ def _create_max_pro_dist_func(dim):
     return f
 
 
-def optimize_design_with_sa(
+def _derive_max_pro_column_factors(
+    design: DesignOfExperiment,
+):
+    """
+    Derives the per-column MaxPro settings of a design. Columns
+    that represent optional, heirarchical or finite dimensions use
+    the null-aware MaxPro distance with a level factor; the other
+    columns use the plain difference of values.
+
+    Arguments
+    ---------
+    design: DesignOfExperiment
+        the design to derive the column settings for
+
+    Returns
+    -------
+    level_factors : np.ndarray
+        the level factor added to the distances of each column
+        (0.0 for columns using the plain difference)
+    null_aware : np.ndarray
+        boolean mask of the columns that map null comparisons
+        to the level-factor based distances
+    """
+    d = design.dim_specification_count
+    index_dim_map = design.index_dim_id_map
+    dim_map = design.input_space.create_dim_map()
+
+    root_dim_ids = {
+        dim.id: True
+        for dim in s.create_level_iterable(design.input_space.children)
+    }
+
+    level_factors = np.zeros(d)
+    null_aware = np.zeros(d, dtype=bool)
+
+    for k in range(d):
+        dim_id = index_dim_map[k]
+        dim = dim_map[dim_id]
+        if (
+            (dim.nullable and cast(float, dim.portion_null) > 0.0)
+            or dim_id not in root_dim_ids
+            or dim.has_finite_values()
+        ):
+            level_factors[k] = 1.0 / estimate_complexity(dim)
+            null_aware[k] = True
+
+    return level_factors, null_aware
+
+
+class MaxProPairMatrix:
+    """
+    Array-backed representation of the pairwise MaxPro terms of a design.
+    The per-column level factors and null masks are computed once and the
+    log of the squared distance product of every pair of points is cached.
+    A swap of two values within column k only changes the column-k factor
+    of the pairs including the two swapped rows, so the swap is evaluated
+    by subtracting the old column-k log factor and adding the new one.
+    The MaxPro objective (the sum of the reciprocal distance products of
+    every pair of points) is tracked as a running sum.
+
+    Swaps are recorded in an undo log holding only the swapped cells and
+    the touched rows of the log products, so accepting (`commit`) or
+    rejecting (`rollback`) swaps costs O(n) memory traffic instead of
+    copying the design and the pair matrix.
+    """
+
+    def __init__(
+        self,
+        x: np.ndarray,
+        level_factors: np.ndarray,
+        null_aware: np.ndarray,
+    ):
+        """
+        Arguments
+        ---------
+        x: np.ndarray
+            the design matrix, swaps are applied to this array in-place
+        level_factors: np.ndarray
+            see `_derive_max_pro_column_factors`
+        null_aware: np.ndarray
+            see `_derive_max_pro_column_factors`
+        """
+        self.x = x
+        self.level_factors = level_factors
+        self.null_aware = null_aware
+        # swaps only exchange non-null values, so the null mask
+        # of the design does not change
+        self.null_mask = np.isnan(x)
+
+        n = x.shape[0]
+        # bound the pair terms so the sum of every pair term is finite
+        self.min_log_product = -(
+            np.log(np.finfo(float).max) - 2.0 * np.log(max(n, 2))
+        )
+
+        self.log_products = np.zeros((n, n))
+        for i in range(n):
+            self.log_products[i, :] = np.sum(
+                self._compute_log_factors(i, slice(None)), axis=1
+            )
+            # a point is not paired with itself
+            self.log_products[i, i] = np.inf
+        self.value = self._sum_pair_values()
+
+        # (i, j, k, row i, row j, objective) before each uncommitted swap
+        self._undo_log: List[
+            Tuple[int, int, int, np.ndarray, np.ndarray, float]
+        ] = []
+
+    def _compute_log_factors(self, i: int, columns) -> np.ndarray:
+        """
+        Computes the log of the squared MaxPro distances between
+        point i and every point of the design for the columns.
+        """
+        diffs = (
+            np.abs(self.x[i, columns] - self.x[:, columns])
+            + self.level_factors[columns]
+        )
+        null_i = self.null_mask[i, columns]
+        null_mask = self.null_mask[:, columns]
+        either_null = (null_i | null_mask) & self.null_aware[columns]
+        if np.any(either_null):
+            null_fill = np.where(
+                null_i & null_mask,
+                self.level_factors[columns],
+                1.0 + self.level_factors[columns],
+            )
+            diffs = np.where(either_null, null_fill, diffs)
+
+        return 2.0 * np.log(np.maximum(diffs, kernels.MIN_FACTOR))
+
+    def _compute_pair_values(self, i: int) -> np.ndarray:
+        """
+        Computes the reciprocal squared distance products between
+        point i and every point of the design.
+        """
+        return np.exp(
+            -np.maximum(self.log_products[i, :], self.min_log_product)
+        )
+
+    def _sum_pair_values(self) -> float:
+        return np.sum(
+            np.triu(
+                np.exp(
+                    -np.maximum(self.log_products, self.min_log_product)
+                ),
+                1,
+            )
+        )
+
+    def swap(self, i: int, j: int, k: int) -> float:
+        """
+        Swaps the values of rows i and j in column k and updates
+        the cached log products and the MaxPro objective.
+
+        Arguments
+        ---------
+        i: int
+            the first row of the swap
+        j: int
+            the second row of the swap
+        k: int
+            the column of the swap
+
+        Returns
+        -------
+        float
+            the MaxPro objective of the design after the swap
+        """
+        self._undo_log.append(
+            (
+                i,
+                j,
+                k,
+                np.copy(self.log_products[i, :]),
+                np.copy(self.log_products[j, :]),
+                self.value,
+            )
+        )
+
+        old_i = self._compute_pair_values(i)
+        old_j = self._compute_pair_values(j)
+        old_factors_i = self._compute_log_factors(i, k)
+        old_factors_j = self._compute_log_factors(j, k)
+
+        self.x[i, k], self.x[j, k] = self.x[j, k], self.x[i, k]
+
+        delta_i = self._compute_log_factors(i, k) - old_factors_i
+        delta_j = self._compute_log_factors(j, k) - old_factors_j
+        # the distance between the swapped points does not change
+        delta_i[[i, j]] = 0.0
+        delta_j[[i, j]] = 0.0
+
+        self.log_products[i, :] += delta_i
+        self.log_products[:, i] = self.log_products[i, :]
+        self.log_products[j, :] += delta_j
+        self.log_products[:, j] = self.log_products[j, :]
+
+        new_i = self._compute_pair_values(i)
+        new_j = self._compute_pair_values(j)
+
+        value = self.value + np.sum(new_i - old_i) + np.sum(new_j - old_j)
+        if value < self.value * kernels.RESUM_RATIO:
+            value = self._sum_pair_values()
+        self.value = value
+
+        return self.value
+
+    def commit(self) -> None:
+        """
+        Accepts the swaps made since the last commit or rollback.
+        """
+        self._undo_log.clear()
+
+    def rollback(self) -> None:
+        """
+        Reverts the swaps made since the last commit or rollback.
+        """
+        while len(self._undo_log) > 0:
+            i, j, k, row_i, row_j, value = self._undo_log.pop()
+            self.x[i, k], self.x[j, k] = self.x[j, k], self.x[i, k]
+            self.log_products[i, :] = row_i
+            self.log_products[:, i] = row_i
+            self.log_products[j, :] = row_j
+            self.log_products[:, j] = row_j
+            self.value = value
+
+
+def _prepare_swaps(
     base_design: DesignOfExperiment,
-    encoding: Optional[EncodingEnum] = None,
-    maxiter: int = 10000,
-    max_rabbit_whole_threshold: int = 1,
-    suppress_numerical_computation_warnings: bool = True,
-    rng: Optional[np.random.Generator] = None,
-) -> DesignOfExperiment:
+    encoding: Optional[EncodingEnum],
+):
     """
-    Makes a copy of base_design and swaps non-null values in the design
-    in order to improve the design with the MaxPro-OH critiera.
+    Copies base_design and determines the values the simulated annealing
+    algorithm can swap: the columns of dimensions without children that
+    have at least two non-null values, and the non-null rows of each of
+    these columns.
 
     Arguments
     ---------
     base_design: DesignOfExperiment
-        The design to try to optimize
-    encoding: Optional[EncodingEnum] = None
+        The design to optimize
+    encoding: Optional[EncodingEnum]
         The encoding to use for optimization, otherwise use
         the base_design's encoding
-    maxiter: int = 10000
-        maximium number of iterations to consider in the simulated
-        annealing algorithm
-    max_rabbit_whole_threshold : int = 1
-        experimental value, don't change, likely to remove
-    suppress_numerical_computation_warnings: bool=True
-        flag to suppress some numerical computation warnings that sometimes
-        occur with the algorithm
-    rng:Optional[np.random.Generator] = None
-        random number generator used to pick values to swap
 
     Returns
     -------
-    DesignOfExperiment
-        a design optimized with simulated anneeling
+    opt_design : DesignOfExperiment
+        the copy of base_design to optimize
+    d_best : np.ndarray
+        the data points of opt_design to optimize in-place
+    swap_columns : np.ndarray
+        the columns to swap values in
+    row_offsets : np.ndarray
+        offsets of each swap column's rows within rows_flat
+    rows_flat : np.ndarray
+        the concatenated non-null rows of each swap column
     """
-
-    if rng is None:
-        rng = np.random.default_rng()
-
     opt_design = base_design.copy()
 
     # initalize data structures
@@ -85,20 +309,12 @@ def optimize_design_with_sa(
         opt_design.encoding = encoding
 
     n = opt_design.point_count
-    point_comps = np.zeros((n, n))
-
     d = opt_design.dim_specification_count
 
     index_dim_map = opt_design.index_dim_id_map
 
     dim_map = opt_design.input_space.create_dim_map()
 
-    root_dim_ids = {
-        dim.id: True
-        for dim in s.create_level_iterable(opt_design.input_space.children)
-    }
-
-    dist_funcs = []
     # algorithm avoids swapping values for dimensions that define heirarchy
     column_indices_to_swap = []
     # algorithm avoids swapping null values to retain original's design optionality features
@@ -118,104 +334,414 @@ def optimize_design_with_sa(
                 del active_row_indicies[k]
                 column_indices_to_swap.pop()
 
-        if (
-            (dim.nullable and cast(float, dim.portion_null) > 0.0)
-            or dim_id not in root_dim_ids
-            or dim.has_finite_values()
-        ):
-            dist_funcs.append(_create_max_pro_dist_func(dim))
+    swap_columns = np.array(column_indices_to_swap, dtype=np.int64)
+    row_offsets = np.cumsum(
+        [0] + [len(active_row_indicies[k]) for k in column_indices_to_swap],
+        dtype=np.int64,
+    )
+    rows_flat = np.array(
+        [i for k in column_indices_to_swap for i in active_row_indicies[k]],
+        dtype=np.int64,
+    )
+
+    return opt_design, d_best, swap_columns, row_offsets, rows_flat
+
+
+def _compute_temperatures(
+    maxiter: int, start: int = 0, stop: Optional[int] = None, scale=1.0
+) -> np.ndarray:
+    """
+    Computes the annealing temperatures of iterations start to stop
+    of a linear cooling schedule of maxiter iterations.
+    """
+    if stop is None:
+        stop = maxiter
+    return scale * (1.0 - (np.arange(start, stop) / maxiter))
+
+
+def _anneal(
+    d_try: MaxProPairMatrix,
+    swap_columns: np.ndarray,
+    row_offsets: np.ndarray,
+    rows_flat: np.ndarray,
+    draws: np.ndarray,
+    temperatures: np.ndarray,
+    max_rabbit_whole_threshold: int,
+    numerical_issue_method: str,
+    backend: str,
+    tracked_metrics: Optional[List] = None,
+) -> MaxProPairMatrix:
+    """
+    Runs the simulated annealing loop on the pair matrix d_try (and its
+    design matrix) in-place. See `optimize_design_with_sa` and
+    `_prepare_swaps` for a description of the arguments. The tracked
+    metrics are notified of the accepted swaps, so tracking metrics
+    requires the numpy backend.
+
+    Returns
+    -------
+    MaxProPairMatrix
+        d_try, holding the optimized design matrix and its MaxPro
+        objective (returned so chains annealed in other processes
+        send their pair matrix back)
+    """
+    # resolved in the process running the chain, so a worker process
+    # (e.g., started with spawn) compiles the kernels before using them
+    backend = kernels.resolve_backend(backend)
+    level_factors = d_try.level_factors
+    null_aware = d_try.null_aware
+    with np.errstate(all=numerical_issue_method):
+        # swaps are applied to the design matrix in-place and reverted
+        # with the undo log of the pair matrix when rejected
+        d_best_value = d_try.value
+
+        # Optimization Stage: Iteratively search in the design space to
+        # optimize the criterion (9) using a version of the simulated annealing
+        # algorithm (Morris and Mitchell 1995).
+        max_attempt_from_best_count = 100000
+
+        if backend == kernels.NUMBA_BACKEND:
+            d_try.value = kernels.anneal_max_pro(
+                d_try.x,
+                d_try.log_products,
+                d_try.null_mask,
+                level_factors,
+                null_aware,
+                d_try.min_log_product,
+                d_try.value,
+                swap_columns,
+                row_offsets,
+                rows_flat,
+                draws,
+                temperatures,
+                max_rabbit_whole_threshold,
+                max_attempt_from_best_count,
+            )
         else:
-            dist_funcs.append(lambda x1_value, x2_value: x1_value - x2_value)
+            dig_count = 0
+            attempt_from_best_count = 0
+            # the swaps applied since the last accepted swap
+            pending_swaps: List[Tuple[int, int, int]] = []
+
+            for i_iteration in range(draws.shape[0]):
+                t = temperatures[i_iteration]
+                dig_count += 1
+
+                attempt_from_best_count += 1
+                if attempt_from_best_count > max_attempt_from_best_count:
+                    break
+                # Step 5. Denote the current design matrix as D = [Dx, Du, Dv]. Randomly
+                # choose a column from the [Dx, Du] components, and interchange two
+                # randomly chosen elements within the selected column. Denote the new
+                # design matrix as Dtry.
+                c = int(draws[i_iteration, 0] * len(swap_columns))
+                k = swap_columns[c]
+                start = row_offsets[c]
+                m = row_offsets[c + 1] - start
+
+                # Step 6. If Dtry = D, repeat Step (5).
+                # (the second row is drawn from the other rows)
+                a = int(draws[i_iteration, 1] * m)
+                b = int(draws[i_iteration, 2] * (m - 1))
+                if b >= a:
+                    b += 1
+                i = rows_flat[start + a]
+                j = rows_flat[start + b]
+
+                d_try_value = d_try.swap(i, j, k)
+                if tracked_metrics:
+                    pending_swaps.append((i, j, k))
+
+                # Step 7. If ψ(Dtry) < ψ(D), replace the current design D with Dtry;
+                # otherwise, replace the current design D with Dtry with probability
+                # π = exp{−[ψ(Dtry) − ψ(D)]/T }, where T is a preset parameter
+                # known as “temperature”.
+                if d_try_value < d_best_value or (
+                    math.exp(-(d_try_value - d_best_value) / t)
+                    > draws[i_iteration, 3]
+                ):
+                    d_try.commit()
+                    if tracked_metrics:
+                        for swap in pending_swaps:
+                            for metric in tracked_metrics:
+                                metric.on_swap(*swap)
+                        pending_swaps.clear()
+                    d_best_value = d_try_value
+                    attempt_from_best_count = 0
+                    dig_count = 0
+                elif dig_count >= max_rabbit_whole_threshold:
+                    # reset
+                    dig_count = 0
+                    d_try.rollback()
+                    pending_swaps.clear()
+
+            # revert any swaps that were not accepted
+            d_try.rollback()
 
-    for i_a in range(n - 1):
-        for j_a in range(i_a + 1, n):
-            m = 1.0
-            for k in range(0, d):
-                m *= dist_funcs[k](d_best[i_a, k], d_best[j_a, k]) ** 2
+        # Step 8. Repeat Step (5) to Step (7) until some convergence requirements
+        # are met. Report the design matrix with the smallest ψ(D) value as the
+        # optimal design with respect to criterion (9).
+    d_try.value = float(d_try.value)
+    return d_try
 
-            point_comps[i_a, j_a] = 1.0 / m
 
-    d_try = np.copy(d_best)
-    d_try_point_comps = np.copy(point_comps)
-    d_best_value = np.sum(np.triu(point_comps, -1))
+def optimize_design_with_sa(
+    base_design: DesignOfExperiment,
+    encoding: Optional[EncodingEnum] = None,
+    maxiter: int = 10000,
+    max_rabbit_whole_threshold: int = 1,
+    suppress_numerical_computation_warnings: bool = True,
+    rng: Optional[np.random.Generator] = None,
+    backend: str = kernels.NUMPY_BACKEND,
+    tracked_metrics: Optional[List] = None,
+) -> DesignOfExperiment:
+    """
+    Makes a copy of base_design and swaps non-null values in the design
+    in order to improve the design with the MaxPro-OH critiera.
 
-    # Optimization Stage: Iteratively search in the design space to
-    # optimize the criterion (9) using a version of the simulated annealing
-    # algorithm (Morris and Mitchell 1995).
-    dig_count = 0
-    attempt_from_best_count = 0
-    max_attempt_from_best_count = 100000
+    Arguments
+    ---------
+    base_design: DesignOfExperiment
+        The design to try to optimize
+    encoding: Optional[EncodingEnum] = None
+        The encoding to use for optimization, otherwise use
+        the base_design's encoding
+    maxiter: int = 10000
+        maximium number of iterations to consider in the simulated
+        annealing algorithm
+    max_rabbit_whole_threshold : int = 1
+        experimental value, don't change, likely to remove
+    suppress_numerical_computation_warnings: bool=True
+        flag to suppress numerical computation warnings; the objective is
+        tracked with log-space products, so these warnings should no longer
+        occur
+    rng:Optional[np.random.Generator] = None
+        random number generator used to pick values to swap
+    backend: str = "numpy"
+        the implementation of the annealing loop, either "numpy" or
+        "numba" to run the loop in compiled code (requires the numba
+        optional dependencies, otherwise falls back to "numpy"); both
+        backends give the same results for a fixed seed
+    tracked_metrics: Optional[List] = None
+        incremental metrics (see `raxpy.does.incremental`) initialized
+        with base_design and notified of each accepted swap, so their
+        values measure the optimized design once it is returned; the
+        "numpy" backend is used when tracking metrics
 
-    def revise_temp(i):
-        return 1.0 - (i / maxiter)
+    Returns
+    -------
+    DesignOfExperiment
+        a design optimized with simulated anneeling
+    """
+    if tracked_metrics:
+        backend = kernels.NUMPY_BACKEND
+        for metric in tracked_metrics:
+            metric.init(base_design)
+    backend = kernels.resolve_backend(backend)
+
+    if rng is None:
+        rng = np.random.default_rng()
+
+    opt_design, d_best, swap_columns, row_offsets, rows_flat = (
+        _prepare_swaps(base_design, encoding)
+    )
+
+    if len(swap_columns) == 0:
+        return opt_design
 
     if suppress_numerical_computation_warnings:
         numerical_issue_method = "ignore"
     else:
         numerical_issue_method = "warn"
 
+    level_factors, null_aware = _derive_max_pro_column_factors(opt_design)
+
+    # random values of each iteration are drawn up-front, so every
+    # backend makes the same choices given the same rng: the column,
+    # the two rows to swap and the acceptance threshold
+    draws = rng.random((maxiter, 4))
+
     with np.errstate(all=numerical_issue_method):
-        for i_iteration in range(maxiter):
-            t = revise_temp(i_iteration)
-            dig_count += 1
-
-            attempt_from_best_count += 1
-            if attempt_from_best_count > max_attempt_from_best_count:
-                break
-            # Step 5. Denote the current design matrix as D = [Dx, Du, Dv]. Randomly
-            # choose a column from the [Dx, Du] components, and interchange two
-            # randomly chosen elements within the selected column. Denote the new
-            # design matrix as Dtry.
-            k = rng.choice(column_indices_to_swap)
-            row_indices = active_row_indicies[k]
-
-            i = rng.choice(row_indices)
-            j = rng.choice(row_indices)
-            # Step 6. If Dtry = D, repeat Step (5).
-            while i == j:
-                j = rng.choice(row_indices)
-
-            d_try[i, k], d_try[j, k] = d_try[j, k], d_try[i, k]
-
-            # adjust values that changed
-            for i_a in [i, j]:
-                # up
-                for j_a in range(0, i_a):
-                    m = 1.0
-                    for k in range(0, d):
-                        m *= dist_funcs[k](d_try[i_a, k], d_try[j_a, k]) ** 2
-
-                    d_try_point_comps[j_a, i_a] = 1.0 / m
-
-                # over
-                for j_a in range(i_a + 1, n):
-                    m = 1.0
-                    for k in range(0, d):
-                        m *= dist_funcs[k](d_try[i_a, k], d_try[j_a, k]) ** 2
-
-                    d_try_point_comps[i_a, j_a] = 1.0 / m
-
-            # Step 7. If ψ(Dtry) < ψ(D), replace the current design D with Dtry;
-            # otherwise, replace the current design D with Dtry with probability
-            # π = exp{−[ψ(Dtry) − ψ(D)]/T }, where T is a preset parameter
-            # known as “temperature”.
-            d_try_value = np.sum(np.triu(d_try_point_comps, -1))
-            p_threshold = math.e ** (-(d_try_value - d_best_value) / t)
-            if d_try_value < d_best_value or p_threshold > rng.random():
-                # print("Found new best!")
-                d_best[:, :] = d_try
-                point_comps[:, :] = d_try_point_comps
-                d_best_value = d_try_value
-                attempt_from_best_count = 0
-                dig_count = 0
-            elif dig_count >= max_rabbit_whole_threshold:
-                # reset
-                dig_count = 0
-                d_try[:, :] = d_best
-                d_try_point_comps[:, :] = point_comps
+        d_try = MaxProPairMatrix(d_best, level_factors, null_aware)
+
+    _anneal(
+        d_try,
+        swap_columns,
+        row_offsets,
+        rows_flat,
+        draws,
+        _compute_temperatures(maxiter),
+        max_rabbit_whole_threshold,
+        numerical_issue_method,
+        backend,
+        tracked_metrics,
+    )
 
-        # Step 8. Repeat Step (5) to Step (7) until some convergence requirements
-        # are met. Report the design matrix with the smallest ψ(D) value as the
-        # optimal design with respect to criterion (9).
     opt_design.input_sets[:, :] = d_best
     return opt_design
+
+
+def optimize_design_with_multi_chain_sa(
+    base_design: DesignOfExperiment,
+    encoding: Optional[EncodingEnum] = None,
+    maxiter: int = 10000,
+    n_chains: int = 4,
+    n_jobs: Optional[int] = None,
+    parallel_tempering: bool = False,
+    max_temperature: float = 10.0,
+    exchange_interval: int = 1000,
+    max_rabbit_whole_threshold: int = 1,
+    suppress_numerical_computation_warnings: bool = True,
+    rng: Optional[np.random.Generator] = None,
+    backend: str = kernels.NUMPY_BACKEND,
+) -> DesignOfExperiment:
+    """
+    Runs several simulated annealing chains (see `optimize_design_with_sa`)
+    starting from base_design in a pool of processes and returns the
+    design with the best MaxPro-OH value found by the chains.
+
+    With parallel tempering, the chains anneal at temperatures
+    geometrically spaced from 1 to max_temperature and, every
+    exchange_interval iterations, chains at neighbouring temperatures
+    swap their designs with the Metropolis exchange probability.
+
+    The random numbers of each chain are drawn from a generator spawned
+    from rng, so the results only depend on rng (and not on n_jobs).
+
+    Arguments
+    ---------
+    base_design: DesignOfExperiment
+        The design to try to optimize
+    encoding: Optional[EncodingEnum] = None
+        The encoding to use for optimization, otherwise use
+        the base_design's encoding
+    maxiter: int = 10000
+        maximium number of iterations of each chain
+    n_chains: int = 4
+        the number of chains to run
+    n_jobs: Optional[int] = None
+        the number of processes to run the chains in, defaults to
+        the smaller of n_chains and the number of CPUs; 1 runs the
+        chains in the calling process
+    parallel_tempering: bool = False
+        flag to exchange designs between chains at different temperatures
+    max_temperature: float = 10.0
+        the temperature scale of the hottest chain with parallel tempering
+    exchange_interval: int = 1000
+        the number of iterations between exchanges with parallel tempering
+    max_rabbit_whole_threshold : int = 1
+        experimental value, don't change, likely to remove
+    suppress_numerical_computation_warnings: bool=True
+        see `optimize_design_with_sa`
+    rng:Optional[np.random.Generator] = None
+        random number generator used to seed the chains and to
+        accept exchanges
+    backend: str = "numpy"
+        see `optimize_design_with_sa`
+
+    Returns
+    -------
+    DesignOfExperiment
+        the best design found by the chains
+    """
+    if n_chains < 1:
+        raise ValueError("n_chains must be at least 1")
+
+    backend = kernels.resolve_backend(backend)
+
+    if rng is None:
+        rng = np.random.default_rng()
+
+    opt_design, d_best, swap_columns, row_offsets, rows_flat = (
+        _prepare_swaps(base_design, encoding)
+    )
+
+    if len(swap_columns) == 0:
+        return opt_design
+
+    if suppress_numerical_computation_warnings:
+        numerical_issue_method = "ignore"
+    else:
+        numerical_issue_method = "warn"
+
+    if n_jobs is None:
+        n_jobs = min(n_chains, os.cpu_count() or 1)
+
+    level_factors, null_aware = _derive_max_pro_column_factors(opt_design)
+
+    chain_rngs = spawn_rngs(rng, n_chains)
+
+    if parallel_tempering and n_chains > 1:
+        temperature_scales = np.geomspace(1.0, max_temperature, n_chains)
+        round_length = max(1, exchange_interval)
+    else:
+        temperature_scales = np.ones(n_chains)
+        round_length = maxiter
+
+    # the pair matrix of each chain is kept across rounds and exchanged
+    # along with its design
+    with np.errstate(all=numerical_issue_method):
+        d_try = MaxProPairMatrix(np.copy(d_best), level_factors, null_aware)
+    chain_matrices = [d_try] + [
+        copy.deepcopy(d_try) for _ in range(n_chains - 1)
+    ]
+    best_design = d_best
+    best_value = math.inf
+
+    executor = None
+    if n_jobs > 1:
+        executor = ProcessPoolExecutor(max_workers=n_jobs)
+
+    try:
+        for round_index, start in enumerate(range(0, maxiter, round_length)):
+            stop = min(start + round_length, maxiter)
+
+            chain_args = [
+                (
+                    chain_matrices[c],
+                    swap_columns,
+                    row_offsets,
+                    rows_flat,
+                    chain_rngs[c].random((stop - start, 4)),
+                    _compute_temperatures(
+                        maxiter, start, stop, temperature_scales[c]
+                    ),
+                    max_rabbit_whole_threshold,
+                    numerical_issue_method,
+                    backend,
+                )
+                for c in range(n_chains)
+            ]
+
+            if executor is None:
+                chain_matrices = [_anneal(*args) for args in chain_args]
+            else:
+                futures = [executor.submit(_anneal, *a) for a in chain_args]
+                chain_matrices = [future.result() for future in futures]
+
+            for d_chain in chain_matrices:
+                if d_chain.value < best_value:
+                    best_value = d_chain.value
+                    best_design = np.copy(d_chain.x)
+
+            if parallel_tempering and stop < maxiter:
+                # alternate between exchanging the even and odd
+                # neighbouring pairs of chains
+                for c in range(round_index % 2, n_chains - 1, 2):
+                    exponent = (
+                        chain_matrices[c].value - chain_matrices[c + 1].value
+                    ) * (
+                        1.0 / temperature_scales[c]
+                        - 1.0 / temperature_scales[c + 1]
+                    )
+                    if rng.random() < math.exp(min(0.0, exponent)):
+                        chain_matrices[c], chain_matrices[c + 1] = (
+                            chain_matrices[c + 1],
+                            chain_matrices[c],
+                        )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    opt_design.input_sets[:, :] = best_design
+    return opt_design
@@ -3,19 +3,32 @@
     assessments of an experiment design.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Set, Tuple, Optional
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    List,
+    Dict,
+    FrozenSet,
+    Iterator,
+    Set,
+    Tuple,
+    Optional,
+    cast,
+)
 import math
 import itertools
 
 import numpy as np
 from scipy.stats.qmc import discrepancy
-from scipy.spatial import distance_matrix
+from scipy.spatial.distance import pdist, squareform
 from scipy.sparse.csgraph import minimum_spanning_tree
 
 from .doe import DesignOfExperiment, Encoding, EncodingEnum
 from .. import spaces as s
 from .maxpro import _create_max_pro_dist_func
+from . import kernels
 
 
 @dataclass
@@ -166,6 +179,128 @@ def compute_max_pro(
     return (np.sum(np.triu(point_comps, -1)) / (n * (n - 1))) ** (1.0 / d)
 
 
+# the maximum number of point and query pairs compared directly when
+# counting dominated points in two dimensions, larger counts are swept
+# with the compiled Fenwick tree kernel
+DOMINANCE_COMPARISON_SIZE = 2**18
+
+
+def _count_dominated_points(
+    points: np.ndarray, queries: np.ndarray
+) -> np.ndarray:
+    """
+    Counts, for each query point, the points with values less than
+    or equal to the query point's values in every dimension. Supports
+    zero-, one- (sorted prefix counts) and two-dimensional (pairwise
+    comparisons, or a Fenwick tree sweep for many points and queries)
+    points without null values.
+
+    Arguments
+    ---------
+    points : np.ndarray
+        a (m, k) matrix of points
+    queries : np.ndarray
+        a (q, k) matrix of query points
+
+    Returns
+    -------
+    np.ndarray
+        the number of points dominated by each query point
+    """
+    k = points.shape[1]
+    if k == 0 or points.shape[0] == 0:
+        return np.full(queries.shape[0], points.shape[0], dtype=np.int64)
+    if k == 1:
+        return np.searchsorted(
+            np.sort(points[:, 0]), queries[:, 0], side="right"
+        )
+    if k == 2 and (
+        points.shape[0] * queries.shape[0] <= DOMINANCE_COMPARISON_SIZE
+    ):
+        # avoids compiling the sweep for small designs
+        return np.count_nonzero(
+            (points[np.newaxis, :, 0] <= queries[:, np.newaxis, 0])
+            & (points[np.newaxis, :, 1] <= queries[:, np.newaxis, 1]),
+            axis=1,
+        )
+    if k == 2:
+        point_order = np.argsort(points[:, 0], kind="stable")
+        query_order = np.argsort(queries[:, 0], kind="stable")
+        distinct_values_2 = np.unique(points[:, 1])
+        # the sweep is compiled, if numba is installed
+        kernels.compile_kernels()
+        sorted_counts = kernels.count_dominated_points_2d(
+            points[point_order, 0],
+            np.searchsorted(distinct_values_2, points[point_order, 1]) + 1,
+            queries[query_order, 0],
+            np.searchsorted(
+                distinct_values_2, queries[query_order, 1], side="right"
+            ),
+            distinct_values_2.shape[0],
+        )
+        counts = np.empty(queries.shape[0], dtype=np.int64)
+        counts[query_order] = sorted_counts
+        return counts
+    raise ValueError(f"Unsupported projection dimensionality: {k}")
+
+
+def _count_points_in_projection_regions(
+    x: np.ndarray,
+    relevant_points: np.ndarray,
+    col_indexes: List[int],
+    query_points: np.ndarray,
+) -> np.ndarray:
+    """
+    Counts the points in the projection region of each query point for
+    `compute_star_discrepancy`. A point is within the region of a query
+    point if the projection's dimensions are relevant to the point and,
+    for each dimension, either the query point's value is null and the
+    point's value is null or the query point's value is not null and
+    the point's value is null or less than or equal to it. The points
+    are split by which of the projection's values are null, so each
+    split only needs dominance counts over its non-null values.
+
+    Arguments
+    ---------
+    x : np.ndarray
+        the design's data points
+    relevant_points : np.ndarray
+        mask of the points the projection's dimensions are relevant to
+    col_indexes : List[int]
+        the columns of the projection's dimensions
+    query_points : np.ndarray
+        the indexes of the query points
+
+    Returns
+    -------
+    np.ndarray
+        the number of points in the region of each query point
+    """
+    projected_x = x[:, col_indexes]
+    null_x = np.isnan(projected_x)
+    queries = projected_x[query_points]
+    null_queries = null_x[query_points]
+
+    counts = np.zeros(len(query_points), dtype=np.int64)
+    for null_pattern in itertools.product(
+        (False, True), repeat=len(col_indexes)
+    ):
+        null_pattern = np.array(null_pattern, dtype=bool)
+        pattern_points = relevant_points & np.all(
+            null_x == null_pattern, axis=1
+        )
+        # queries with a null value require the point's value to be null
+        pattern_queries = ~np.any(null_queries & ~null_pattern, axis=1)
+        if not np.any(pattern_points) or not np.any(pattern_queries):
+            continue
+        value_cols = np.flatnonzero(~null_pattern)
+        counts[pattern_queries] += _count_dominated_points(
+            projected_x[pattern_points][:, value_cols],
+            queries[pattern_queries][:, value_cols],
+        )
+    return counts
+
+
 def compute_star_discrepancy(
     design: DesignOfExperiment,
     p=np.inf,
@@ -175,6 +310,12 @@ def compute_star_discrepancy(
     Computes a varition of the star discrepancy design objective
     critiera, supportinng optional and heirarchical dimensions.
 
+    Points are grouped by their relevant dimensions and the points in
+    the region of each point are counted once per projection for every
+    point the projection applies to, with sorted prefix counts for
+    one-dimensional projections and a Fenwick tree sweep for
+    two-dimensional projections.
+
     Arguments
     ---------
     design: DesignOfExperiment
@@ -192,95 +333,105 @@ def compute_star_discrepancy(
 
     """
     x = design.get_data_points(encoding)
+    n = design.point_count
 
-    # determine projections for each releval dimension set
-    relevant_dim_sets_proj_map = {}
-    point_relevant_dims = []
-
-    # determine which heirachiral dimensions are active for each point
-    # determine which vairant dimensions are active for each point
-    for point in x:
-        # determine relevant dimensions for point
-        relevant_dims_set = tuple(determine_relevant_dimensions(design, point, False))
-
-        if relevant_dims_set not in relevant_dim_sets_proj_map:
-            projection_sets = []
-            l = len(relevant_dims_set)
-            # determine projects to consider for this set of dimensions
-            for i in range(l):
-                rhs_dim_id = relevant_dims_set[i]
-                projection_sets.append((rhs_dim_id,))
-                for j in range(i + 1, l):
-                    lhs_dim_id = relevant_dims_set[j]
-                    projection_sets.append((rhs_dim_id, lhs_dim_id))
-
-            relevant_dim_sets_proj_map[relevant_dims_set] = projection_sets
+    # group the points by the set of relevant dimensions, determined by
+    # which heirachiral and vairant dimensions are active for each point
+    relevant_dim_sets_points_map: Dict[Tuple[str, ...], List[int]] = {}
+    for i, point in enumerate(x):
+        relevant_dims_set = tuple(
+            determine_relevant_dimensions(design, point, False)
+        )
+        relevant_dim_sets_points_map.setdefault(relevant_dims_set, []).append(
+            i
+        )
 
-        point_relevant_dims.append(relevant_dims_set)
+    relevant_points_map: Dict[str, np.ndarray] = {}
+    projection_queries_map: Dict[Tuple[str, ...], List[Tuple[int, int]]] = {}
+    group_points = []
+    group_discrepancies = []
+    for group_index, (relevant_dims_set, points) in enumerate(
+        relevant_dim_sets_points_map.items()
+    ):
+        points = np.array(points)
+        for dim_id in relevant_dims_set:
+            if dim_id not in relevant_points_map:
+                relevant_points_map[dim_id] = np.zeros(n, dtype=bool)
+            relevant_points_map[dim_id][points] = True
+
+        # determine projects to consider for this set of dimensions
+        projection_sets = []
+        l = len(relevant_dims_set)
+        for i in range(l):
+            rhs_dim_id = relevant_dims_set[i]
+            projection_sets.append((rhs_dim_id,))
+            for j in range(i + 1, l):
+                lhs_dim_id = relevant_dims_set[j]
+                projection_sets.append((rhs_dim_id, lhs_dim_id))
+
+        for projection_index, u in enumerate(projection_sets):
+            projection_queries_map.setdefault(u, []).append(
+                (group_index, projection_index)
+            )
+        group_points.append(points)
+        group_discrepancies.append(
+            np.empty((len(points), len(projection_sets)))
+        )
 
-    local_discrepancies = []
-    n = design.point_count
     dim_map = design.input_space.create_dim_map()
-    # use each point for region discrepancy sample
-    for relevant_dims_set, point in zip(point_relevant_dims, x):
-
-        projection_sets = relevant_dim_sets_proj_map[relevant_dims_set]
-
-        point_projection_discrepancies = []
-        for u in projection_sets:
-            col_indexes = list(design.input_set_map[dim_id] for dim_id in u)
-            point_count_in_projection_region = 0
-            for c_relevant_dims_set, c_point in zip(point_relevant_dims, x):
-                relevant_point = True
-                in_region = True
-                for col_index, dim_id in zip(col_indexes, u):
-                    if dim_id not in c_relevant_dims_set:
-                        relevant_point = False
-                        break
-                    else:
-                        if np.isnan(point[col_index]):
-                            if np.isnan(c_point[col_index]):
-                                pass
-                            else:
-                                in_region = False
-                                break
-                        else:
-                            if np.isnan(c_point[col_index]):
-                                pass
-                            elif c_point[col_index] > point[col_index]:
-                                in_region = False
-                                break
-                if relevant_point and in_region:
-                    point_count_in_projection_region += 1
-
-            region_volumn_percent = 1.0
-            for col_index, dim_id in zip(col_indexes, u):
-                dim = dim_map[dim_id]
-                # compute dimension's culmative distribution for point value
-                v = point[col_index]
-                if np.isnan(v):
-                    region_volumn_percent *= dim.portion_null
-                else:
-                    region_volumn_percent *= (
-                        dim.portion_null + (1 - dim.portion_null) * v
-                    )
+    for u, queries in projection_queries_map.items():
+        col_indexes = list(design.input_set_map[dim_id] for dim_id in u)
+        relevant_points = np.ones(n, dtype=bool)
+        for dim_id in u:
+            relevant_points &= relevant_points_map[dim_id]
+
+        query_points = np.concatenate(
+            [group_points[group_index] for group_index, _ in queries]
+        )
+        point_count_in_projection_region = (
+            _count_points_in_projection_regions(
+                x, relevant_points, col_indexes, query_points
+            )
+        )
 
-            portion_of_points_in_region = point_count_in_projection_region / n
+        region_volumn_percent = np.ones(len(query_points))
+        for col_index, dim_id in zip(col_indexes, u):
+            dim = dim_map[dim_id]
+            # compute dimension's culmative distribution for point value
+            v = x[query_points, col_index]
+            region_volumn_percent *= np.where(
+                np.isnan(v),
+                dim.portion_null,
+                dim.portion_null + (1 - dim.portion_null) * v,
+            )
 
-            ppd = abs(portion_of_points_in_region - region_volumn_percent)
+        portion_of_points_in_region = point_count_in_projection_region / n
 
-            if ppd == 1.0:
-                #print("Here") # TODO: DEBUG WHY THIS OCCURS
-                pass
+        ppd = np.abs(portion_of_points_in_region - region_volumn_percent)
 
-            point_projection_discrepancies.append(ppd)
+        start = 0
+        for group_index, projection_index in queries:
+            stop = start + len(group_points[group_index])
+            group_discrepancies[group_index][:, projection_index] = ppd[
+                start:stop
+            ]
+            start = stop
 
+    local_discrepancies = np.empty(n)
+    for points, point_projection_discrepancies in zip(
+        group_points, group_discrepancies
+    ):
         if p == np.inf:
-            local_discrepancies.append(max(point_projection_discrepancies))
-        else:
-            local_discrepancies.append(
-                sum(ppd ** (p) for ppd in point_projection_discrepancies)
+            local_discrepancies[points] = np.max(
+                point_projection_discrepancies, axis=1
             )
+        elif point_projection_discrepancies.shape[1] == 0:
+            local_discrepancies[points] = 0.0
+        else:
+            # sums in the order of the projections
+            local_discrepancies[points] = np.cumsum(
+                point_projection_discrepancies ** (p), axis=1
+            )[:, -1]
 
     if p == np.inf:
         return max(local_discrepancies)
@@ -305,15 +456,49 @@ def compute_min_point_distance(context: SubSpaceMetricComputeContext) -> float:
     """
     if context.sub_space_doe.point_count <= 1:
         raise ValueError("Not enough points to compute min point distance")
-    points = context.sub_space_doe.input_sets
-    # compute the distances for each point combination
-    dm = distance_matrix(points, points)
-    # the diagonals will be zero since a point's distance to itself is 0,
-    # we don't care about these distances
-    np.fill_diagonal(dm, np.inf)
+    # the distances for each point combination, excluding a point's
+    # distance to itself
+    distances = context.sub_space_doe.get_condensed_distances()
 
     # find the min distances to the each other point
-    return np.min(dm)
+    return np.min(distances)
+
+
+# the number of projections after which the accumulated distances of
+# `compute_average_reciprocal_distance_projection` are recomputed to
+# avoid accumulating rounding errors
+ARD_RESUM_INTERVAL = 256
+
+
+def _compute_dim_distance_powers(points: np.ndarray, z_hp) -> np.ndarray:
+    """
+    Computes the condensed matrices (see `scipy.spatial.distance.pdist`)
+    of the absolute differences of the points' values raised to z_hp,
+    one row per dimension. The z_hp-norm distance of the points
+    projected onto a set of dimensions is the z_hp-th root of the sum
+    of the dimensions' rows.
+    """
+    return np.array(
+        [
+            pdist(points[:, [k]], "cityblock") ** z_hp
+            for k in range(points.shape[1])
+        ]
+    ).reshape(points.shape[1], -1)
+
+
+def _create_ard_pair_weights(n: int) -> np.ndarray:
+    """
+    Creates the weight of each pair of points in the condensed matrices
+    (see `scipy.spatial.distance.pdist`) of the average reciprocal
+    distance projection metric. The metric sums the lower triangle, the
+    diagonal and the first super-diagonal of each projection's
+    reciprocal distance matrix, so the pairs of consecutive points are
+    summed twice (and the diagonal adds the constant n).
+    """
+    weights = np.ones(n * (n - 1) // 2)
+    i = np.arange(n - 1)
+    weights[n * i + i + 1 - ((i + 2) * (i + 1)) // 2] = 2.0
+    return weights
 
 
 def compute_average_reciprocal_distance_projection(
@@ -324,6 +509,12 @@ def compute_average_reciprocal_distance_projection(
     metric as denoted in: Draguljić, Santner, and Dean, “Noncollapsing
     Space-Filling Designs for Bounded Nonrectangular Regions.”
 
+    The projections are enumerated in Gray-code order, so the distances
+    of each projection are derived from the previous projection's
+    distances by adding or subtracting the distances of one dimension.
+    See `estimate_average_reciprocal_distance_projection` for designs
+    with too many dimensions to enumerate every projection.
+
     Arguments
     ---------
     context : SubSpaceMetricComputeContext
@@ -342,42 +533,157 @@ def compute_average_reciprocal_distance_projection(
         raise ValueError("Not enough points to compute ard")
     n = context.sub_space_doe.point_count
     p = context.sub_space_doe.dim_specification_count
-    big_p = list(range(0, p))
-    big_j = list(range(1, p + 1))
 
-    comb_count = 0
+    dim_distances = _compute_dim_distance_powers(
+        context.sub_space_doe.input_sets, z_hp
+    )
+    pair_weights = _create_ard_pair_weights(n)
+    exponent = -lambda_hp / z_hp
+
+    comb_count = 2**p - 1
 
     # compute the reciprocal sum for every subspace projection
     running_sum = 0.0
-    for j in big_j:
-        index_combinations = itertools.combinations(big_p, j)
-
-        max_j_distance = j ** (1.0 / z_hp)
+    accumulated_distances = np.zeros(dim_distances.shape[1])
+    subset = np.zeros(p, dtype=bool)
+    for g in range(1, comb_count + 1):
+        # the dimension to add or remove from the previous projection
+        k = (g & -g).bit_length() - 1
+        subset[k] = not subset[k]
+        if g % ARD_RESUM_INTERVAL == 0:
+            accumulated_distances = np.sum(dim_distances[subset], axis=0)
+        elif subset[k]:
+            accumulated_distances += dim_distances[k]
+        else:
+            accumulated_distances -= dim_distances[k]
+        j = np.count_nonzero(subset)
+
+        # (max_j_distance / distance) ** lambda_hp, with the maximum
+        # distance in j dimensions max_j_distance = j ** (1 / z_hp)
+        running_sum += j ** (lambda_hp / z_hp) * (
+            np.dot(
+                pair_weights,
+                np.maximum(accumulated_distances, 0.0) ** exponent,
+            )
+            + n
+        )
 
-        max_j_distance_m = np.ones((n, n)) * max_j_distance
+    return (running_sum / (math.comb(n, 2) * comb_count)) ** (1.0 / lambda_hp)
 
-        for index_combination in index_combinations:
 
-            x_projection = context.sub_space_doe.input_sets[
-                :, index_combination
-            ]
+def estimate_average_reciprocal_distance_projection(
+    context: SubSpaceMetricComputeContext,
+    lambda_hp=2,
+    z_hp=2,
+    subset_count: int = 1000,
+    rng: Optional[np.random.Generator] = None,
+) -> Tuple[float, float]:
+    """
+    Estimates the average reciprocal distance projection metric (see
+    `compute_average_reciprocal_distance_projection`) from a sample of
+    the projections, stratified by the number of dimensions projected
+    onto. The budget of projections is shared by the strata, from the
+    stratum with the fewest projections to the most. Strata that fit
+    in their share are computed exactly, the others are estimated from
+    a uniform sample of their projections. Low-dimensional projections
+    tend to dominate the metric, so computing them exactly reduces the
+    error of the estimate.
 
-            dm = distance_matrix(x_projection, x_projection, p=z_hp)
-            # fill diagonal to avoid divide by zero
-            # The equation does not need the diagonal elements anyway
-            np.fill_diagonal(dm, 1)
-            reciprocal_distances = (max_j_distance_m / dm) ** lambda_hp
+    Arguments
+    ---------
+    context : SubSpaceMetricComputeContext
+        a full sub-design without null values
+    lambda_hp=2 : int
+        see reference
+    z_hp=2 : int
+        see reference
+    subset_count:int=1000
+        the number of projections to compute
+    rng : np.random.Generator
+        random number generator used to sample the projections
 
-            # sum the upper triangle matrix elements,
-            # excluding the diagonal elements
-            reciprocal_distances_sum = np.sum(
-                np.tril(reciprocal_distances, k=1)
-            )
+    Returns
+    -------
+    float
+        The estimate of the design's average reciprocal distance
+        projection measurement
+    float
+        The standard error of the estimate, 0.0 if every projection
+        was computed
+    """
+    if context.sub_space_doe.point_count <= 1:
+        raise ValueError("Not enough points to compute ard")
+    n = context.sub_space_doe.point_count
+    p = context.sub_space_doe.dim_specification_count
+    if subset_count < 2 * p:
+        raise ValueError(
+            "At least two projections per number of dimensions must be "
+            f"computed: {subset_count} < {2 * p}"
+        )
+    if rng is None:
+        rng = np.random.default_rng()
 
-            running_sum += reciprocal_distances_sum
-            comb_count += 1
+    dim_distances = _compute_dim_distance_powers(
+        context.sub_space_doe.input_sets, z_hp
+    )
+    pair_weights = _create_ard_pair_weights(n)
+    exponent = -lambda_hp / z_hp
+
+    def compute_projection_mean(columns) -> float:
+        j = len(columns)
+        reciprocal_sum = np.dot(
+            pair_weights,
+            np.sum(dim_distances[list(columns)], axis=0) ** exponent,
+        )
+        return (
+            j ** (lambda_hp / z_hp)
+            * (reciprocal_sum + n)
+            / math.comb(n, 2)
+        )
 
-    return (running_sum / (math.comb(n, 2) * comb_count)) ** (1.0 / lambda_hp)
+    comb_count = 2**p - 1
+    mean = 0.0
+    mean_variance = 0.0
+    remaining_subset_count = subset_count
+    strata = sorted(range(1, p + 1), key=lambda j: math.comb(p, j))
+    for i, j in enumerate(strata):
+        stratum_count = math.comb(p, j)
+        stratum_budget = remaining_subset_count // (p - i)
+        if stratum_count <= stratum_budget:
+            projection_means = np.array(
+                [
+                    compute_projection_mean(columns)
+                    for columns in itertools.combinations(range(p), j)
+                ]
+            )
+            stratum_variance = 0.0
+        else:
+            sampled_columns = np.argsort(
+                rng.random((stratum_budget, p)), axis=1
+            )[:, :j]
+            projection_means = np.array(
+                [
+                    compute_projection_mean(columns)
+                    for columns in sampled_columns
+                ]
+            )
+            stratum_variance = (
+                np.var(projection_means, ddof=1) / stratum_budget
+            )
+        remaining_subset_count -= len(projection_means)
+
+        weight = stratum_count / comb_count
+        mean += weight * np.mean(projection_means)
+        mean_variance += weight**2 * stratum_variance
+
+    # propagate the standard error through the lambda_hp-th root
+    value = mean ** (1.0 / lambda_hp)
+    standard_error = (
+        mean ** (1.0 / lambda_hp - 1.0)
+        * math.sqrt(mean_variance)
+        / lambda_hp
+    )
+    return value, standard_error
 
 
 def compute_mst_stats(
@@ -400,9 +706,8 @@ def compute_mst_stats(
     mst_mean, mst_std : Tuple[float, float]
         a tuple of the mean and standard deviation of the MST edges
     """
-    points = context.sub_space_doe.input_sets
-    # compute the distances for each point combination
-    dm = distance_matrix(points, points)
+    # the distances for each point combination
+    dm = squareform(context.sub_space_doe.get_condensed_distances())
 
     mst = minimum_spanning_tree(dm)
 
@@ -506,12 +811,23 @@ class DesignMeasurementSet:
     full_sub_design_measurements: List[FullSubDesignMeasurementSet]
     measurements: Dict[str, float]
 
+    # the full-sub-design measurement sets keyed by their active
+    # dimensions and the number of measurement sets indexed
+    _full_sub_design_index: Dict[
+        FrozenSet[str], FullSubDesignMeasurementSet
+    ] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _full_sub_design_index_count: int = field(
+        default=-1, init=False, repr=False, compare=False
+    )
+
     def get_full_sub_design_measurements(
         self, active_dimensions: List[str]
     ) -> Optional[FullSubDesignMeasurementSet]:
         """
         Looks up the full-sub-design measurement sets
-        matching the active_dimensions.
+        matching the active_dimensions. The measurement sets are
+        indexed by the set of their active dimensions on the first
+        lookup (and re-indexed if measurement sets are added).
 
         Arguments
         ---------
@@ -523,10 +839,50 @@ class DesignMeasurementSet:
             the measurement set, if matching active_dimensions, otherwise None
 
         """
-        for measurement_set in self.full_sub_design_measurements:
-            if measurement_set.compare_dimensions(active_dimensions):
-                return measurement_set
-        return None
+        if self._full_sub_design_index_count != len(
+            self.full_sub_design_measurements
+        ):
+            index = {}
+            for measurement_set in self.full_sub_design_measurements:
+                index.setdefault(
+                    frozenset(measurement_set.active_dimensions),
+                    measurement_set,
+                )
+            self._full_sub_design_index = index
+            self._full_sub_design_index_count = len(
+                self.full_sub_design_measurements
+            )
+
+        measurement_set = self._full_sub_design_index.get(
+            frozenset(active_dimensions)
+        )
+        if measurement_set is None or not measurement_set.compare_dimensions(
+            active_dimensions
+        ):
+            return None
+        return measurement_set
+
+
+def _compute_min_column_gaps(points: np.ndarray) -> np.ndarray:
+    """
+    Computes the minimum distance between the non-null values of each
+    column, as the minimum gap between the column's sorted values.
+
+    Arguments
+    ---------
+    points : np.ndarray
+        the (n, d) matrix of values, with np.nan representing nulls
+
+    Returns
+    -------
+    np.ndarray
+        the minimum distance of each column, np.inf for columns with
+        one or less non null values
+    """
+    # nulls are sorted to the end of the columns
+    gaps = np.diff(np.sort(points, axis=0), axis=0)
+    gaps[np.isnan(gaps)] = np.inf
+    return np.min(gaps, axis=0, initial=np.inf)
 
 
 def compute_average_dim_dist(
@@ -559,23 +915,10 @@ def compute_average_dim_dist(
     else:
         points = design.get_data_points(encoding)
 
-    columns_data = points.T
-
-    min_distances = []
-
-    for k in range(design.dim_specification_count):
-        column_vector = columns_data[k]
-        filtered_vector = column_vector[~np.isnan(column_vector)]
-        # skip dimensions with one or less non null values
-        if len(filtered_vector) > 1:
-            # convert vector to matrix for computatoin
-            f_m = filtered_vector.reshape(len(filtered_vector), 1)
-            dm = distance_matrix(f_m, f_m)
+    min_distances = _compute_min_column_gaps(points)
 
-            np.fill_diagonal(dm, np.inf)
-            min_distances.append(dm.min())
-
-    return np.mean(min_distances)
+    # skip dimensions with one or less non null values
+    return np.mean(min_distances[min_distances != np.inf])
 
 
 def compute_whole_design_max_pro(
@@ -712,6 +1055,11 @@ def compute_weighted_mipd(
     return sum(d * w / weight_sum for d, w in zip(discrepancies, weights))
 
 
+# the maximum number of elements of the temporary arrays created when
+# computing a tile of a null-aware distance matrix
+NAN_DISTANCE_TILE_SIZE = 2**22
+
+
 def _compute_nan_distance(row1, row2, p=2):
     """
     Computes the p-norm distance between two rows,
@@ -733,22 +1081,90 @@ def _compute_nan_distance(row1, row2, p=2):
     -------
         The distance between the two rows
     """
-    # Identify which elements are not NaN in both rows
-    mask = ~np.isnan(row1) | ~np.isnan(row2)
+    return _compute_nan_distance_tile(
+        np.asarray(row1, dtype=float)[np.newaxis, :],
+        np.asarray(row2, dtype=float)[np.newaxis, :],
+        p=p,
+    )[0, 0]
+
+
+def _compute_nan_distance_tile(
+    rows1: np.ndarray, rows2: np.ndarray, p=2
+) -> np.ndarray:
+    """
+    Computes the null-aware p-norm distances between every row of rows1
+    and every row of rows2 (see `_compute_nan_distance`). The distances
+    are accumulated column by column, so the temporary arrays have the
+    size of the returned tile.
+
+    Arguments
+    ---------
+    rows1 : np.ndarray
+        a (m, d) matrix
+    rows2 : np.ndarray
+        a (k, d) matrix
+    p:int=2
+        Which Minkowski p-norm to use in the distance computation
+
+    Returns
+    -------
+    np.ndarray
+        the (m, k) distances
+    """
+    null_1 = np.isnan(rows1)
+    null_2 = np.isnan(rows2)
+    filled_1 = np.where(null_1, 0.0, rows1)
+    filled_2 = np.where(null_2, 0.0, rows2)
+
+    tile = np.zeros((rows1.shape[0], rows2.shape[0]))
+    for k in range(rows1.shape[1]):
+        parts = np.abs(filled_1[:, k, np.newaxis] - filled_2[np.newaxis, :, k])
+        if p != np.inf and p != 1:
+            parts **= p
+        # one null value projects to the maximum difference, 1, and
+        # both null values project to 0 (the filled values are equal)
+        parts[null_1[:, k, np.newaxis] != null_2[np.newaxis, :, k]] = 1.0
+        if p == np.inf:
+            np.maximum(tile, parts, out=tile)
+        else:
+            tile += parts
 
-    # If no valid comparisons, return a distance of 0
-    if not np.any(mask):
-        return 0.0
+    if p != np.inf and p != 1:
+        tile **= 1.0 / p
+    return tile
 
-    # Compute Euclidean distance only for non-NaN elements for both elements
-    parts = (np.abs(row1[mask] - row2[mask])) ** p
 
-    # Replace nan's differences to 1 to represent the maximin difference
-    parts = np.nan_to_num(parts, nan=1)
+def _iterate_nan_distance_tiles(
+    matrix: np.ndarray, p=2
+) -> Iterator[Tuple[int, int, np.ndarray]]:
+    """
+    Iterates over the upper triangle of the null-aware distance matrix
+    (see `_compute_nan_distance_matrix`) in tiles of rows, such that
+    each tile holds at most about `NAN_DISTANCE_TILE_SIZE` distances.
 
-    distance = np.sqrt(np.sum(parts)) # TODO fix
+    Arguments
+    ---------
+    matrix : np.array
+        The design to assess
+    p:int=2
+        Which Minkowski p-norm to use in the distance computation
 
-    return distance
+    Returns
+    -------
+    Iterator[Tuple[int, int, np.ndarray]]
+        the first and last (exclusive) row of each tile and the
+        distances of these rows to the rows from the first row onward
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    num_rows = matrix.shape[0]
+    start = 0
+    while start < num_rows:
+        tile_row_count = max(1, NAN_DISTANCE_TILE_SIZE // (num_rows - start))
+        stop = min(num_rows, start + tile_row_count)
+        yield start, stop, _compute_nan_distance_tile(
+            matrix[start:stop], matrix[start:], p=p
+        )
+        start = stop
 
 
 def _compute_nan_distance_matrix(matrix: np.array, p=2):
@@ -773,11 +1189,10 @@ def _compute_nan_distance_matrix(matrix: np.array, p=2):
     num_rows = matrix.shape[0]
     dm = np.zeros((num_rows, num_rows))
 
-    for i in range(num_rows):
-        for j in range(i + 1, num_rows):
-            dist = _compute_nan_distance(matrix[i], matrix[j], p=p)
-            dm[i, j] = dist
-            dm[j, i] = dist
+    for start, stop, tile in _iterate_nan_distance_tiles(matrix, p=p):
+        dm[start:stop, start:] = tile
+        dm[start:, start:stop] = tile.T
+    np.fill_diagonal(dm, 0.0)
 
     return dm
 
@@ -794,6 +1209,8 @@ def compute_min_interpoint_dist(
     dimension comparison, the distance is projected to 1 for that dimension.
     For comparisons where both points have a nan value for a dimension
     comparison, the distance is projected to 0 for that dimension.
+    The distances are computed in tiles of rows, so the distance matrix
+    is never materialized.
 
     Arguments
     ---------
@@ -811,9 +1228,23 @@ def compute_min_interpoint_dist(
     float
         minimum interpoint distance
     """
-    dm = _compute_nan_distance_matrix(doe.get_data_points(encoding), p=p)
-    np.fill_diagonal(dm, np.inf)
-    return np.min(dm)
+    min_so_far = np.inf
+    for start, stop, tile in _iterate_nan_distance_tiles(
+        doe.get_data_points(encoding), p=p
+    ):
+        # the distances of the tile's rows to themselves and the rows
+        # before them (the lower triangle) are ignored
+        tile_row_count = stop - start
+        upper_mask = np.triu(
+            np.ones((tile_row_count, tile_row_count), dtype=bool), k=1
+        )
+        if tile.shape[1] > tile_row_count:
+            min_so_far = min(min_so_far, np.min(tile[:, tile_row_count:]))
+        if np.any(upper_mask):
+            min_so_far = min(
+                min_so_far, np.min(tile[:, :tile_row_count][upper_mask])
+            )
+    return min_so_far
 
 
 def compute_opt_coverage(doe: DesignOfExperiment) -> float:
@@ -862,22 +1293,18 @@ def compute_min_projected_distance(
     """
     data_points = doe.get_data_points(encoding)
     dim_map = doe.input_space.create_dim_map()
-    min_so_far = np.inf
-    for dim_id, column_i in doe.input_set_map.items():
-        dim = dim_map[dim_id]
-        # ignore dimensions that have children dimensions since the projected
-        # should not apply to these dimensions
-        if dim.has_child_dimensions():
-            continue
 
-        for row_1i in range(doe.point_count):
-            lhs = data_points[row_1i][column_i]
-            for row_2i in range(row_1i + 1, doe.point_count):
-                d = np.abs(lhs - data_points[row_2i][column_i])
-                if d != np.nan and d < min_so_far:
-                    min_so_far = d
+    # ignore dimensions that have children dimensions since the projected
+    # should not apply to these dimensions
+    column_indexes = [
+        column_i
+        for dim_id, column_i in doe.input_set_map.items()
+        if not dim_map[dim_id].has_child_dimensions()
+    ]
+    if len(column_indexes) == 0:
+        return np.inf
 
-    return min_so_far
+    return np.min(_compute_min_column_gaps(data_points[:, column_indexes]))
 
 
 # the following map is used in the assess function
@@ -907,8 +1334,8 @@ def allocate_points_to_full_subspaces(doe: DesignOfExperiment):
     -------
     List[List[str]]
         the full-sub-spaces
-    List[int]
-        list of indexing values for each point to the index of
+    np.ndarray
+        indexing values for each point to the index of
         the full-sub-space it belongs
 
     """
@@ -916,109 +1343,357 @@ def allocate_points_to_full_subspaces(doe: DesignOfExperiment):
     # that could be defined in this space
     sub_spaces = doe.input_space.derive_full_subspaces()
 
-    # assign a index to each sub space
-    sub_space_index_map = {}
-    for i, sub_space in enumerate(sub_spaces):
+    for sub_space in sub_spaces:
         sub_space.sort()
-        standardized_tuple_key = tuple(sub_space)
-        sub_space_index_map[standardized_tuple_key] = i
-
-    # determine the sub-space each data-point belongs to
-    def map_point(point):
-        active_dim_ids = []
 
-        for dim_id, column_index in doe.input_set_map.items():
-            if ~np.isnan(point[column_index]):
-                active_dim_ids.append(dim_id)
+    # determine the sub-space each data-point belongs to, keyed by the
+    # bitmask of the non-null columns packed into bytes
+    dim_ids = list(doe.input_set_map.keys())
+    column_indexes = [doe.input_set_map[dim_id] for dim_id in dim_ids]
 
-        active_dim_ids.sort()
-        return sub_space_index_map[tuple(active_dim_ids)]
+    def pack(non_null_mask: np.ndarray) -> np.ndarray:
+        return np.packbits(non_null_mask, axis=-1, bitorder="little")
 
-    # compute the subspace each point belongs to
-    mapped_values = [map_point(point) for point in doe.decoded_input_sets]
+    sub_space_key_map = {}
+    for i, sub_space in enumerate(sub_spaces):
+        if all(dim_id in doe.input_set_map for dim_id in sub_space):
+            sub_space_dim_ids = set(sub_space)
+            sub_space_key = pack(
+                np.array([dim_id in sub_space_dim_ids for dim_id in dim_ids])
+            ).tobytes()
+            sub_space_key_map[sub_space_key] = i
+
+    # compute the subspace each point belongs to, mapping each
+    # distinct key once
+    non_null_masks = ~np.isnan(doe.decoded_input_sets[:, column_indexes])
+    point_keys, inverse = np.unique(
+        pack(non_null_masks), axis=0, return_inverse=True
+    )
+    key_indexes = np.zeros(len(point_keys), dtype=int)
+    for i, point_key in enumerate(point_keys):
+        if point_key.tobytes() not in sub_space_key_map:
+            active_dim_ids = np.array(dim_ids)[
+                np.unpackbits(
+                    point_key, count=len(dim_ids), bitorder="little"
+                ).astype(bool)
+            ]
+            raise KeyError(tuple(sorted(active_dim_ids.tolist())))
+        key_indexes[i] = sub_space_key_map[point_key.tobytes()]
+    mapped_values = key_indexes[inverse.reshape(-1)]
 
     return sub_spaces, mapped_values
 
 
-def measure_with_all_metrics(
-    doe: DesignOfExperiment,
-    encoding: Encoding = EncodingEnum.ZERO_ONE_NULL_ENCODING,
-) -> DesignMeasurementSet:
-    """
-    Compute design measurements for the experiment design.
+# the metric functions and argument sets of a measurement session,
+# sent once to each process of the session's pool
+_process_computes: List[Callable] = []
+_process_arg_sets: List[Tuple] = []
 
-    Arguments
-    ---------
-    doe : DesignOfExperiment
-        The design to compute measurements for
-    encoding: Encoding
-        The suggested encoding to use during the measurement process
 
-    Returns
-    -------
-    DesignMeasurementSet
-        composition of design measurements
+def _init_measurement_process(computes: List[Callable], arg_sets: List[Tuple]):
+    global _process_computes, _process_arg_sets
+    _process_computes = computes
+    _process_arg_sets = arg_sets
+
+
+def _compute_in_process(compute_index: int, arg_set_index: int):
+    return _process_computes[compute_index](
+        *_process_arg_sets[arg_set_index]
+    )
+
+
+class MeasurementSession:
+    """
+    Measures a design, computing the artifacts shared by the metrics
+    once: the design's encoded and decoded matrices, the allocation of
+    points to full-sub-spaces, the sub-space designs and their distance
+    matrices (see `DesignOfExperiment.get_condensed_distances`). The
+    metrics are independent given these artifacts, so the metrics of every
+    sub-space, and then the whole-design metrics, are computed
+    concurrently in a pool of n_jobs threads (or processes).
     """
-    sub_spaces, mapped_values = allocate_points_to_full_subspaces(doe)
 
-    # prepare data structures for returned assessment structure
-    total_point_count = len(mapped_values)
+    def __init__(
+        self,
+        doe: DesignOfExperiment,
+        encoding: Encoding = EncodingEnum.ZERO_ONE_NULL_ENCODING,
+        n_jobs: int = 1,
+        use_processes: bool = False,
+    ):
+        """
+        Arguments
+        ---------
+        doe : DesignOfExperiment
+            The design to compute measurements for
+        encoding: Encoding
+            The suggested encoding to use during the measurement process
+        n_jobs:int=1
+            the number of metrics to compute concurrently, 1 computes
+            the metrics one after another
+        use_processes:bool=False
+            flag to compute the metrics in a pool of processes instead
+            of threads, the metric functions must then be picklable;
+            the design is sent to each process once and each process
+            computes the distance matrices its metrics use
+        """
+        self.doe = doe
+        self.encoding = encoding
+        self.n_jobs = n_jobs
+        self.use_processes = use_processes
+
+        self._sub_spaces: Optional[List[List[str]]] = None
+        self._sub_space_contexts: Optional[
+            List[SubSpaceMetricComputeContext]
+        ] = None
+
+    @property
+    def sub_spaces(self) -> List[List[str]]:
+        """
+        The full-sub-spaces of the design's input space.
+        """
+        self._allocate_sub_spaces()
+        return cast(List[List[str]], self._sub_spaces)
 
-    full_sub_set_assessments: List[FullSubDesignMeasurementSet] = []
+    @property
+    def sub_space_contexts(self) -> List[SubSpaceMetricComputeContext]:
+        """
+        The contexts to compute the metrics of each full-sub-space
+        design, in the order of `sub_spaces`.
+        """
+        self._allocate_sub_spaces()
+        return cast(
+            List[SubSpaceMetricComputeContext], self._sub_space_contexts
+        )
 
-    ################################
-    # full-sub-design metrics
-    ################################
+    def _allocate_sub_spaces(self) -> None:
+        """
+        Allocates the design's points to the full-sub-spaces and
+        extracts the sub-space designs, once.
+        """
+        if self._sub_space_contexts is not None:
+            return
 
-    for i, sub_space in enumerate(sub_spaces):
-        point_row_mask = [v == i for v in mapped_values]
-        sub_space_doe = doe.extract_points_and_dimensions(
-            point_row_mask, sub_space, encoding
+        sub_spaces, mapped_values = allocate_points_to_full_subspaces(
+            self.doe
         )
-        measurements = {}
-        space_attributes = set()
+        self._sub_spaces = sub_spaces
+        self._sub_space_contexts = [
+            SubSpaceMetricComputeContext(self.doe, sub_space_doe)
+            for sub_space_doe in (
+                self.doe.extract_grouped_points_and_dimensions(
+                    mapped_values, sub_spaces, self.encoding
+                )
+            )
+        ]
+
+    def _prepare_shared_artifacts(self) -> None:
+        """
+        Creates the design's decoded and encoded matrices shared by the
+        whole-design metrics, which the design caches.
+        """
+        # created before the metrics fan out to the pool, so the threads
+        # share the cached matrices instead of each creating them (and
+        # the processes receive them with the pickled design)
+        _ = self.doe.decoded_input_sets
+        self.doe.get_data_points(self.encoding)
+
+    def _compute_all(
+        self, computes: List[Callable], arg_sets: List[Tuple]
+    ) -> List:
+        """
+        Calls each function with each set of arguments, concurrently if
+        n_jobs is greater than 1. The functions and arguments are sent
+        once to each process of a pool of processes, and then only their
+        indexes are sent to compute a metric.
+
+        Returns
+        -------
+        List
+            the value returned by each call, or the exception raised,
+            ordered by the arguments and then the functions
+        """
+        calls = [
+            (compute_index, arg_set_index)
+            for arg_set_index in range(len(arg_sets))
+            for compute_index in range(len(computes))
+        ]
+        if self.n_jobs <= 1 or len(calls) <= 1:
+            results = []
+            for compute_index, arg_set_index in calls:
+                try:
+                    results.append(
+                        computes[compute_index](*arg_sets[arg_set_index])
+                    )
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        if self.use_processes:
+            executor = ProcessPoolExecutor(
+                max_workers=self.n_jobs,
+                initializer=_init_measurement_process,
+                initargs=(computes, arg_sets),
+            )
+            compute_call = _compute_in_process
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.n_jobs)
+
+            def compute_call(compute_index: int, arg_set_index: int):
+                return computes[compute_index](*arg_sets[arg_set_index])
 
-        subspace_context = SubSpaceMetricComputeContext(doe, sub_space_doe)
+        with executor:
+            futures = [
+                executor.submit(compute_call, compute_index, arg_set_index)
+                for compute_index, arg_set_index in calls
+            ]
+            results = []
+            for future in futures:
+                exception = future.exception()
+                results.append(
+                    future.result() if exception is None else exception
+                )
+            return results
+
+    def measure_sub_spaces(
+        self,
+        metric_map: Optional[
+            Dict[str, Callable[[SubSpaceMetricComputeContext], Any]]
+        ] = None,
+    ) -> List[FullSubDesignMeasurementSet]:
+        """
+        Computes the metrics of each full-sub-space design. Metrics that
+        fail are skipped with a warning.
+
+        Arguments
+        ---------
+        metric_map : Dict[str, Callable]
+            the metrics to compute, defaults to
+            `subspace_metric_computation_map`
+
+        Returns
+        -------
+        List[FullSubDesignMeasurementSet]
+            the measurements of each full-sub-space design
+        """
+        if metric_map is None:
+            metric_map = subspace_metric_computation_map
+
+        contexts = self.sub_space_contexts
+        results = iter(
+            self._compute_all(
+                list(metric_map.values()),
+                [(context,) for context in contexts],
+            )
+        )
 
-        for m_id, compute in subspace_metric_computation_map.items():
-            try:
-                value = compute(subspace_context)
-                if isinstance(value, Tuple):
+        full_sub_set_assessments: List[FullSubDesignMeasurementSet] = []
+        for sub_space, context in zip(self.sub_spaces, contexts):
+            measurements = {}
+            for m_id in metric_map:
+                value = next(results)
+                if isinstance(value, Exception):
+                    print(
+                        f"WARNING: failed to compute metric {m_id} "
+                        f"given this error {value}; skipping"
+                    )
+                elif isinstance(value, Tuple):
                     for i, v in enumerate(value):
                         measurements[f"{m_id}-{i}"] = v
                 else:
                     measurements[m_id] = value
-            except Exception as e:
-                print(
-                    f"WARNING: failed to compute metric {m_id} "
-                    f"given this error {e}; skipping"
-                )
 
-        full_sub_set_assessments.append(
-            FullSubDesignMeasurementSet(
-                point_count=sub_space_doe.point_count,
-                active_dimensions=sub_space,
-                measurements=measurements,
-                space_attributes=space_attributes,
+            full_sub_set_assessments.append(
+                FullSubDesignMeasurementSet(
+                    point_count=context.sub_space_doe.point_count,
+                    active_dimensions=sub_space,
+                    measurements=measurements,
+                    space_attributes=set(),
+                )
             )
+        return full_sub_set_assessments
+
+    def measure(
+        self,
+        sub_space_metric_map: Optional[
+            Dict[str, Callable[[SubSpaceMetricComputeContext], Any]]
+        ] = None,
+        metric_map: Optional[Dict[str, Callable]] = None,
+    ) -> DesignMeasurementSet:
+        """
+        Computes the metrics of each full-sub-space design and then the
+        metrics of the whole design.
+
+        Arguments
+        ---------
+        sub_space_metric_map : Dict[str, Callable]
+            the full-sub-space metrics to compute, defaults to
+            `subspace_metric_computation_map`
+        metric_map : Dict[str, Callable]
+            the whole-design metrics to compute, defaults to
+            `doe_metric_computation_map`
+
+        Raises
+        ------
+        Exception
+            The first exception raised by a whole-design metric
+
+        Returns
+        -------
+        DesignMeasurementSet
+            composition of design measurements
+        """
+        if metric_map is None:
+            metric_map = doe_metric_computation_map
+
+        self._prepare_shared_artifacts()
+
+        full_sub_set_assessments = self.measure_sub_spaces(
+            sub_space_metric_map
         )
 
-    ################################
-    # DOE metrics
-    ################################
-    total_measurements = {}
+        results = self._compute_all(
+            list(metric_map.values()),
+            [(self.doe, full_sub_set_assessments, self.encoding)],
+        )
 
-    for m_id, compute in doe_metric_computation_map.items():
+        total_measurements = {}
+        for m_id, value in zip(metric_map, results):
+            if isinstance(value, Exception):
+                raise value
+            if isinstance(value, Tuple):
+                for i, v in enumerate(value):
+                    total_measurements[f"{m_id}-{i}"] = v
+            else:
+                total_measurements[m_id] = value
+
+        return DesignMeasurementSet(
+            total_point_count=self.doe.point_count,
+            full_sub_design_measurements=full_sub_set_assessments,
+            measurements=total_measurements,
+        )
 
-        value = compute(doe, full_sub_set_assessments, encoding)
-        if isinstance(value, Tuple):
-            for i, v in enumerate(value):
-                total_measurements[f"{m_id}-{i}"] = v
-        else:
-            total_measurements[m_id] = value
 
-    return DesignMeasurementSet(
-        total_point_count=total_point_count,
-        full_sub_design_measurements=full_sub_set_assessments,
-        measurements=total_measurements,
-    )
+def measure_with_all_metrics(
+    doe: DesignOfExperiment,
+    encoding: Encoding = EncodingEnum.ZERO_ONE_NULL_ENCODING,
+    n_jobs: int = 1,
+) -> DesignMeasurementSet:
+    """
+    Compute design measurements for the experiment design,
+    see `MeasurementSession`.
+
+    Arguments
+    ---------
+    doe : DesignOfExperiment
+        The design to compute measurements for
+    encoding: Encoding
+        The suggested encoding to use during the measurement process
+    n_jobs:int=1
+        the number of metrics to compute concurrently in threads
+
+    Returns
+    -------
+    DesignMeasurementSet
+        composition of design measurements
+    """
+    return MeasurementSession(doe, encoding, n_jobs=n_jobs).measure()
@@ -35,11 +35,15 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 """
 
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 import numpy as np
 
 from scipy.stats.qmc import discrepancy
 
+from . import kernels
+from .doe import DesignOfExperiment, EncodingEnum
+from ..spaces.root import InputSpace
+
 try:
     from numpy.random import Generator as Generator
 except ImportError:
@@ -48,109 +52,147 @@ except ImportError:
         pass
 
 
-def _perturb_discrepancy(
-    sample: np.ndarray, i1: int, i2: int, k: int, disc: float
-):
-    """Centered discrepancy after an elementary perturbation of a LHS.
-
-    An elementary perturbation consists of an exchange of coordinates between
-    two points: ``sample[i1, k] <-> sample[i2, k]``. By construction,
-    this operation conserves the LHS properties.
-
-    Parameters
-    ----------
-    sample : array_like (n, d)
-        The sample (before permutation) to compute the discrepancy from.
-    i1 : int
-        The first line of the elementary permutation.
-    i2 : int
-        The second line of the elementary permutation.
-    k : int
-        The column of the elementary permutation.
-    disc : float
-        Centered discrepancy of the design before permutation.
-
-    Returns
-    -------
-    discrepancy : float
-        Centered discrepancy of the design after permutation.
+# number of iterations to draw random permutations for at once
+_DRAW_BLOCK_SIZE = 1024
 
-    References
-    ----------
-    .. [1] Jin et al. "An efficient algorithm for constructing optimal design
-       of computer experiments", Journal of Statistical Planning and
-       Inference, 2005.
 
+class CenteredDiscrepancyCache:
+    """
+    Caches the terms of the centered discrepancy of a sample that an
+    elementary perturbation (a swap of two values within a column)
+    depends on: the centered sample, the per-row products g and h of
+    Eq (20) and the row-pair kernel terms c of Eq (19). Evaluating a
+    perturbation then only needs the swapped column, O(n), and applying
+    it recomputes the cached terms of the two swapped rows, O(n d).
     """
-    n = sample.shape[0]
-
-    z_ij = sample - 0.5
-
-    # Eq (19)
-    c_i1j = (
-        1.0
-        / n**2.0
-        * np.prod(
-            0.5
-            * (2.0 + abs(z_ij[i1, :]) + abs(z_ij) - abs(z_ij[i1, :] - z_ij)),
-            axis=1,
+
+    def __init__(self, sample: np.ndarray):
+        """
+        Arguments
+        ---------
+        sample: np.ndarray
+            the (n, d) sample, swaps are applied to this array in-place
+        """
+        n = sample.shape[0]
+
+        self.sample = sample
+        self.z = sample - 0.5
+        self.abs_z = np.abs(self.z)
+        self.pair_products = np.empty((n, n))
+        self.g = np.empty(n)
+        self.h = np.empty(n)
+
+        for i in range(n):
+            self._update_row(i)
+
+    def _update_row(self, i: int) -> None:
+        """
+        Recomputes the cached terms of row i.
+        """
+        n = self.sample.shape[0]
+        z_i = self.z[i, :]
+        abs_z_i = self.abs_z[i, :]
+
+        # Eq (19)
+        c_ij = (
+            1.0
+            / n**2.0
+            * np.prod(
+                0.5 * (2.0 + abs_z_i + self.abs_z - np.abs(z_i - self.z)),
+                axis=1,
+            )
         )
-    )
-    c_i2j = (
-        1.0
-        / n**2.0
-        * np.prod(
-            0.5
-            * (2.0 + abs(z_ij[i2, :]) + abs(z_ij) - abs(z_ij[i2, :] - z_ij)),
-            axis=1,
+        self.pair_products[i, :] = c_ij
+        self.pair_products[:, i] = c_ij
+
+        # Eq (20)
+        self.g[i] = np.prod(1.0 + abs_z_i)
+        self.h[i] = np.prod(1.0 + 0.5 * abs_z_i - 0.5 * z_i**2)
+
+    def perturb_discrepancy(self, i1: int, i2: int, k: int, disc: float):
+        """Centered discrepancy after an elementary perturbation of a LHS.
+
+        An elementary perturbation consists of an exchange of coordinates
+        between two points: ``sample[i1, k] <-> sample[i2, k]``. By
+        construction, this operation conserves the LHS properties.
+
+        Parameters
+        ----------
+        i1 : int
+            The first line of the elementary permutation.
+        i2 : int
+            The second line of the elementary permutation.
+        k : int
+            The column of the elementary permutation.
+        disc : float
+            Centered discrepancy of the design before permutation.
+
+        Returns
+        -------
+        discrepancy : float
+            Centered discrepancy of the design after permutation.
+
+        References
+        ----------
+        .. [1] Jin et al. "An efficient algorithm for constructing optimal
+           design of computer experiments", Journal of Statistical Planning
+           and Inference, 2005.
+
+        """
+        n = self.sample.shape[0]
+
+        z_k = self.z[:, k]
+        abs_z_k = self.abs_z[:, k]
+        z_i1k = z_k[i1]
+        z_i2k = z_k[i2]
+
+        c_i1j = self.pair_products[i1, :]
+        c_i2j = self.pair_products[i2, :]
+
+        # Eq (20)
+        c_i1i1 = 1.0 / n**2 * self.g[i1] - 2.0 / n * self.h[i1]
+        c_i2i2 = 1.0 / n**2 * self.g[i2] - 2.0 / n * self.h[i2]
+
+        # Eq (22), typo in the article in the denominator i2 -> i1
+        num = 2 + abs(z_i2k) + abs_z_k - np.abs(z_i2k - z_k)
+        denum = 2 + abs(z_i1k) + abs_z_k - np.abs(z_i1k - z_k)
+        gamma = num / denum
+
+        # Eq (23)
+        c_p_i1j = gamma * c_i1j
+        # Eq (24)
+        c_p_i2j = c_i2j / gamma
+
+        alpha = (1 + abs(z_i2k)) / (1 + abs(z_i1k))
+        beta = (2 - abs(z_i2k)) / (2 - abs(z_i1k))
+
+        # Eq (25), typo in the article g is missing
+        c_p_i1i1 = (self.g[i1] * alpha) / (n**2) - (
+            2.0 * alpha * beta * self.h[i1] / n
+        )
+        # Eq (26), typo in the article n ** 2
+        c_p_i2i2 = (self.g[i2] / ((n**2) * alpha)) - (
+            2.0 * self.h[i2] / (n * alpha * beta)
         )
-    )
-
-    # Eq (20)
-    c_i1i1 = 1.0 / n**2 * np.prod(1 + abs(z_ij[i1, :])) - 2.0 / n * np.prod(
-        1.0 + 0.5 * abs(z_ij[i1, :]) - 0.5 * z_ij[i1, :] ** 2
-    )
-    c_i2i2 = 1.0 / n**2 * np.prod(1 + abs(z_ij[i2, :])) - 2.0 / n * np.prod(
-        1.0 + 0.5 * abs(z_ij[i2, :]) - 0.5 * z_ij[i2, :] ** 2
-    )
-
-    # Eq (22), typo in the article in the denominator i2 -> i1
-    num = (
-        2 + abs(z_ij[i2, k]) + abs(z_ij[:, k]) - abs(z_ij[i2, k] - z_ij[:, k])
-    )
-    denum = (
-        2 + abs(z_ij[i1, k]) + abs(z_ij[:, k]) - abs(z_ij[i1, k] - z_ij[:, k])
-    )
-    gamma = num / denum
-
-    # Eq (23)
-    c_p_i1j = gamma * c_i1j
-    # Eq (24)
-    c_p_i2j = c_i2j / gamma
-
-    alpha = (1 + abs(z_ij[i2, k])) / (1 + abs(z_ij[i1, k]))
-    beta = (2 - abs(z_ij[i2, k])) / (2 - abs(z_ij[i1, k]))
-
-    g_i1 = np.prod(1.0 + abs(z_ij[i1, :]))
-    g_i2 = np.prod(1.0 + abs(z_ij[i2, :]))
-    h_i1 = np.prod(1.0 + 0.5 * abs(z_ij[i1, :]) - 0.5 * (z_ij[i1, :] ** 2))
-    h_i2 = np.prod(1.0 + 0.5 * abs(z_ij[i2, :]) - 0.5 * (z_ij[i2, :] ** 2))
-
-    # Eq (25), typo in the article g is missing
-    c_p_i1i1 = (g_i1 * alpha) / (n**2) - 2.0 * alpha * beta * h_i1 / n
-    # Eq (26), typo in the article n ** 2
-    c_p_i2i2 = (g_i2 / ((n**2) * alpha)) - (2.0 * h_i2 / (n * alpha * beta))
-
-    # Eq (26)
-    sum_ = c_p_i1j - c_i1j + c_p_i2j - c_i2j
 
-    mask = np.ones(n, dtype=bool)
-    mask[[i1, i2]] = False
-    sum_ = sum(sum_[mask])
+        # Eq (26)
+        sum_ = c_p_i1j - c_i1j + c_p_i2j - c_i2j
+        sum_[i1] = 0.0
+        sum_[i2] = 0.0
 
-    disc_ep = disc + c_p_i1i1 - c_i1i1 + c_p_i2i2 - c_i2i2 + 2 * sum_
+        return (
+            disc + c_p_i1i1 - c_i1i1 + c_p_i2i2 - c_i2i2 + 2 * np.sum(sum_)
+        )
 
-    return disc_ep
+    def swap(self, i1: int, i2: int, k: int) -> None:
+        """
+        Applies the elementary perturbation
+        ``sample[i1, k] <-> sample[i2, k]`` and updates the cached terms.
+        """
+        for a in (self.sample, self.z, self.abs_z):
+            a[i1, k], a[i2, k] = a[i2, k], a[i1, k]
+        self._update_row(i1)
+        self._update_row(i2)
 
 
 def rng_integers(
@@ -225,6 +267,9 @@ def random_cd(
     n_nochange: int,
     column_bounds: Optional[Tuple[int, int]] = None,
     rng: Optional[np.random.Generator] = None,
+    backend: str = kernels.NUMPY_BACKEND,
+    tracked_metrics: Optional[List] = None,
+    design: Optional[DesignOfExperiment] = None,
 ) -> np.ndarray:
     """Optimal LHS on CD.
 
@@ -237,15 +282,48 @@ def random_cd(
     `n_iters` iterations are performed; or if there is no improvement
     for `n_nochange` consecutive iterations.
 
+    The permutations are drawn in blocks and evaluated with the terms of
+    the discrepancy cached in a `CenteredDiscrepancyCache`, so each
+    iteration costs O(n) rather than O(n d).
+
     Arguments
     ---------
 
     rng:Optional[np.random.Generator]
         Random number generator to support design creation
+    backend: str = "numpy"
+        the implementation of the permutation loop, either "numpy" or
+        "numba" to run the loop in compiled code (requires the numba
+        optional dependencies, otherwise falls back to "numpy"); both
+        backends give the same results for a fixed seed
+    tracked_metrics: Optional[List] = None
+        incremental metrics (see `raxpy.does.incremental`) initialized
+        with design and notified of each accepted swap, so their values
+        measure the optimized sample once it is returned; the "numpy"
+        backend is used when tracking metrics
+    design: Optional[DesignOfExperiment] = None
+        the design with the data points of best_sample, used to
+        initialize the tracked metrics; otherwise a design of
+        best_sample's values without dimension specifications is used
     """
     if rng is None:
         rng = np.random.default_rng()
 
+    if tracked_metrics:
+        backend = kernels.NUMPY_BACKEND
+        if design is None:
+            design = DesignOfExperiment(
+                input_space=InputSpace(dimensions=[]),
+                input_sets=best_sample,
+                input_set_map={
+                    f"x{k}": k for k in range(best_sample.shape[1])
+                },
+                encoding=EncodingEnum.NONE,
+            )
+        for metric in tracked_metrics:
+            metric.init(design)
+    backend = kernels.resolve_backend(backend)
+
     n, d = best_sample.shape
 
     if d == 0 or n == 0:
@@ -262,24 +340,51 @@ def random_cd(
 
     bounds = (column_bounds, (0, n - 1), (0, n - 1))
 
+    # the cache swaps values of best_sample in-place
+    cache = CenteredDiscrepancyCache(best_sample)
+
     n_nochange_ = 0
     n_iters_ = 0
     while n_nochange_ < n_nochange and n_iters_ < n_iters:
-        n_iters_ += 1
-
-        col = rng_integers(rng, *bounds[0], endpoint=True)  # type: ignore[misc]
-        row_1 = rng_integers(rng, *bounds[1], endpoint=True)  # type: ignore[misc]
-        row_2 = rng_integers(rng, *bounds[2], endpoint=True)  # type: ignore[misc]
-        disc = _perturb_discrepancy(best_sample, row_1, row_2, col, best_disc)
-        if disc < best_disc:
-            best_sample[row_1, col], best_sample[row_2, col] = (
-                best_sample[row_2, col],
-                best_sample[row_1, col],
+        # draw the permutations of a block of iterations at once
+        block_size = min(_DRAW_BLOCK_SIZE, n_iters - n_iters_)
+        cols = rng_integers(rng, *bounds[0], size=block_size, endpoint=True)  # type: ignore[misc]
+        rows_1 = rng_integers(rng, *bounds[1], size=block_size, endpoint=True)  # type: ignore[misc]
+        rows_2 = rng_integers(rng, *bounds[2], size=block_size, endpoint=True)  # type: ignore[misc]
+
+        if backend == kernels.NUMBA_BACKEND:
+            best_disc, n_nochange_, block_iters = kernels.random_cd_block(
+                cache.sample,
+                cache.z,
+                cache.abs_z,
+                cache.pair_products,
+                cache.g,
+                cache.h,
+                best_disc,
+                cols,
+                rows_1,
+                rows_2,
+                n_nochange,
+                n_nochange_,
             )
-
-            best_disc = disc
-            n_nochange_ = 0
-        else:
-            n_nochange_ += 1
+            n_iters_ += block_iters
+            continue
+
+        for col, row_1, row_2 in zip(cols, rows_1, rows_2):
+            if n_nochange_ >= n_nochange:
+                break
+            n_iters_ += 1
+
+            disc = cache.perturb_discrepancy(row_1, row_2, col, best_disc)
+            if disc < best_disc:
+                cache.swap(row_1, row_2, col)
+                if tracked_metrics:
+                    for metric in tracked_metrics:
+                        metric.on_swap(row_1, row_2, col)
+
+                best_disc = disc
+                n_nochange_ = 0
+            else:
+                n_nochange_ += 1
 
     return best_sample
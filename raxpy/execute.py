@@ -3,8 +3,24 @@ This module provides some capabilites that integrate
 the designing and execution of experiments.
 """
 
+import asyncio
+import inspect
+import os
+import pickle
 import sys
-from typing import Optional, Union
+import time
+import traceback
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import dataclass, replace
+from typing import Any, Iterator, Optional, Union, cast
 from functools import partial
 import numpy as np
 
@@ -21,8 +37,9 @@ else:
         Dict,
     )
 
+from raxpy.cache import EvaluationCache
 from raxpy.does.doe import DesignOfExperiment
-from raxpy.spaces.dimensions import convert_values_from_dict
+from raxpy.journal import ExperimentJournal
 from raxpy.spaces.complexity import assign_null_portions
 from raxpy.spaces import InputSpace, create_level_iterable
 from raxpy.annotations import function_spec
@@ -35,7 +52,11 @@ T = TypeVar("T")
 I = ParamSpec("I")
 
 
-def _default_orchistrator(f: Callable[I, T], inputs: List[Dict]) -> List[T]:
+def _default_orchistrator(
+    f: Callable[I, T],
+    inputs: List[Dict],
+    on_result: Optional[Callable[[int, Any], None]] = None,
+) -> List[T]:
     """
     Simply executes the function f sequentially,
     saving and returning the results
@@ -46,6 +67,9 @@ def _default_orchistrator(f: Callable[I, T], inputs: List[Dict]) -> List[T]:
         the function to execute
     inputs : List[I]
         the values to pass into the function
+    on_result : Optional[Callable[[int, Any], None]]
+        If specified, called with the index and the result of each
+        input as soon as the input is executed
 
     Returns
     -------
@@ -54,12 +78,281 @@ def _default_orchistrator(f: Callable[I, T], inputs: List[Dict]) -> List[T]:
     """
     results = []
 
-    for arg_set in inputs:
-        results.append(f(**arg_set))  # type: ignore
+    for i, arg_set in enumerate(inputs):
+        result = f(**arg_set)  # type: ignore
+        results.append(result)
+        if on_result is not None:
+            on_result(i, result)
+
+    return results
+
+
+@dataclass
+class PointFailure:
+    """
+    Takes the place of the result of a point whose execution raised an
+    exception, so the other points of the experiment are still
+    executed.
+    """
+
+    index: int
+    arg_set: Dict
+    exception: BaseException
+    traceback: str
+
 
+def _execute_chunk(
+    f: Callable[I, T], start_index: int, arg_sets: List[Dict]
+) -> List[Any]:
+    """
+    Helper function that executes f on a chunk of argument sets within a
+    worker process, capturing the exception of each failed point.
+    """
+    results: List[Any] = []
+    for i, arg_set in enumerate(arg_sets):
+        try:
+            results.append(f(**arg_set))  # type: ignore
+        except Exception as e:
+            try:
+                # the exception must be sent back to the parent process,
+                # e.g., exceptions with extra required __init__ arguments
+                # pickle but fail to unpickle
+                pickle.loads(pickle.dumps(e))
+                exception: BaseException = e
+            except Exception:
+                exception = RuntimeError(repr(e))
+            results.append(
+                PointFailure(
+                    index=start_index + i,
+                    arg_set=arg_set,
+                    exception=exception,
+                    traceback=traceback.format_exc(),
+                )
+            )
     return results
 
 
+class ProcessPoolOrchistrator:
+    """
+    Executes the function f in a pool of worker processes, dispatching
+    the argument sets in chunks to reduce the inter-process
+    communication. The results are returned in the order of the
+    argument sets. A point whose execution raises an exception does not
+    abort the experiment, its result is a `PointFailure` instead. If the
+    pool breaks (e.g., a worker process is killed), the results of the
+    completed chunks are kept and the points of the other chunks are
+    `PointFailure`s.
+
+    The function f, its arguments and its results must be picklable;
+    e.g., f must be defined at the top-level of a module.
+    """
+
+    def __init__(
+        self, n_jobs: Optional[int] = None, chunk_size: Optional[int] = None
+    ):
+        """
+        Arguments
+        ---------
+        n_jobs: Optional[int] = None
+            The number of worker processes, defaults to the number of CPUs
+        chunk_size: Optional[int] = None
+            The number of argument sets sent to a worker at a time,
+            defaults to dividing the argument sets into about four chunks
+            per worker
+        """
+        if n_jobs is not None and n_jobs < 1:
+            raise ValueError(f"n_jobs must be at least 1: {n_jobs}")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1: {chunk_size}")
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
+
+    def __call__(
+        self,
+        f: Callable[I, T],
+        inputs: List[Dict],
+        on_result: Optional[Callable[[int, Any], None]] = None,
+    ) -> List[Any]:
+        """
+        Executes the function f on each of the inputs.
+
+        Arguments
+        ---------
+        f (Function) : Callable[I, T]
+            the function to execute
+        inputs : List[I]
+            the values to pass into the function
+        on_result : Optional[Callable[[int, Any], None]]
+            If specified, called (in this process) with the index and the
+            result of each input as soon as the input's chunk completes
+
+        Returns
+        -------
+        results : List[T]
+            the result of each input, or a `PointFailure` for the inputs
+            whose execution raised an exception
+        """
+        if len(inputs) == 0:
+            return []
+
+        n_jobs = self.n_jobs if self.n_jobs is not None else os.cpu_count()
+        n_jobs = min(n_jobs or 1, len(inputs))
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            chunk_size = max(1, -(-len(inputs) // (4 * n_jobs)))
+
+        chunk_results: Dict[int, List[Any]] = {}
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            future_starts = {
+                executor.submit(
+                    _execute_chunk,
+                    f,
+                    start,
+                    inputs[start : start + chunk_size],
+                ): start
+                for start in range(0, len(inputs), chunk_size)
+            }
+            for future in as_completed(future_starts):
+                start = future_starts[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    # e.g., BrokenProcessPool or a result failing to
+                    # unpickle, only the points of this chunk are lost
+                    results = _create_chunk_failures(
+                        start, inputs[start : start + chunk_size], e
+                    )
+                chunk_results[start] = results
+                if on_result is not None:
+                    for i, result in enumerate(results, start):
+                        on_result(i, result)
+        return [
+            result
+            for start in sorted(chunk_results)
+            for result in chunk_results[start]
+        ]
+
+
+def _create_chunk_failures(
+    start_index: int, arg_sets: List[Dict], exception: BaseException
+) -> List[PointFailure]:
+    """
+    Helper function that creates the failures of a chunk of points whose
+    execution failed as a whole.
+    """
+    formatted_traceback = "".join(
+        traceback.format_exception(
+            type(exception), exception, exception.__traceback__
+        )
+    )
+    return [
+        PointFailure(
+            index=start_index + i,
+            arg_set=arg_set,
+            exception=exception,
+            traceback=formatted_traceback,
+        )
+        for i, arg_set in enumerate(arg_sets)
+    ]
+
+
+class AsyncioOrchistrator:
+    """
+    Executes the function f concurrently within an asyncio event loop.
+    Coroutine functions are awaited directly while other functions are
+    called in a pool of threads. The number of concurrent executions is
+    bounded and the rate at which executions start can be limited
+    (e.g., to not overload a model server). The results are returned in
+    the order of the argument sets.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        rate_limit: Optional[float] = None,
+    ):
+        """
+        Arguments
+        ---------
+        max_concurrency: int = 8
+            The maximum number of executions of f at a time, also the
+            number of threads used to call functions that are not
+            coroutine functions
+        rate_limit: Optional[float] = None
+            If specified, the maximum number of executions of f started
+            per second
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1: {max_concurrency}"
+            )
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError(f"rate_limit must be positive: {rate_limit}")
+        self.max_concurrency = max_concurrency
+        self.rate_limit = rate_limit
+
+    async def __call__(self, f: Callable[I, T], inputs: List[Dict]) -> List[T]:
+        """
+        Executes the function f on each of the inputs, raising the
+        first exception raised by an execution after cancelling the
+        executions not yet completed.
+
+        Arguments
+        ---------
+        f (Function) : Callable[I, T]
+            the function (or coroutine function) to execute
+        inputs : List[I]
+            the values to pass into the function
+
+        Returns
+        -------
+        results : List[T]
+            the result of each input
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.BoundedSemaphore(self.max_concurrency)
+        rate_lock = asyncio.Lock()
+        next_start_time = time.monotonic()
+        is_coroutine_function = inspect.iscoroutinefunction(f)
+
+        async def wait_for_rate_limit():
+            nonlocal next_start_time
+            async with rate_lock:
+                delay = next_start_time - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_start_time = max(next_start_time, time.monotonic()) + (
+                    1.0 / cast(float, self.rate_limit)
+                )
+
+        async def execute(arg_set: Dict, executor: ThreadPoolExecutor):
+            async with semaphore:
+                if self.rate_limit is not None:
+                    await wait_for_rate_limit()
+                if is_coroutine_function:
+                    result = f(**arg_set)  # type: ignore
+                else:
+                    result = await loop.run_in_executor(
+                        executor, partial(f, **arg_set)
+                    )
+                # e.g., decorated coroutine functions return awaitables
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            tasks = [
+                asyncio.ensure_future(execute(arg_set, executor))
+                for arg_set in inputs
+            ]
+            try:
+                return list(await asyncio.gather(*tasks))
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+
 def _default_designer(
     input_space: InputSpace, n_points: int, seed: Optional[int] = None
 ) -> DesignOfExperiment:
@@ -90,6 +383,22 @@ def _default_designer(
     return design
 
 
+def _check_sync_orchistrator(orchistrator: Callable) -> None:
+    """
+    Helper function that raises a TypeError if the orchistrator is a
+    coroutine function (e.g., an `AsyncioOrchistrator`), whose results
+    would otherwise be an un-awaited coroutine.
+    """
+    if inspect.iscoroutinefunction(orchistrator) or (
+        inspect.iscoroutinefunction(getattr(orchistrator, "__call__", None))
+    ):
+        raise TypeError(
+            f"Orchistrator {orchistrator!r} is a coroutine function, "
+            "use aperform_experiment to execute the experiment within "
+            "an asyncio event loop"
+        )
+
+
 def perform_experiment(
     f: Callable[I, T],
     n_points: int,
@@ -100,6 +409,8 @@ def perform_experiment(
         [Callable[I, T], List[Dict]], List[T]
     ] = _default_orchistrator,
     seed: Optional[int] = None,
+    cache: Optional[EvaluationCache] = None,
+    journal: Optional[ExperimentJournal] = None,
 ) -> Tuple[DesignOfExperiment, List[Dict], List[T]]:
     """
     Executes a batch experiment for function f.
@@ -122,7 +433,27 @@ def perform_experiment(
     designer : Callable[[InputSpace, int], List[I], Optional[int]]
         A function that designs the experiment
     orchistrator : Callable[[Callable[I, T], List[I]], List[T]]
-        A function that executes the experiment on f
+        A function that executes the experiment on f, such as
+        `ProcessPoolOrchistrator` to execute the points in parallel
+    seed : Optional[int]
+        If specified, seeds the design of the experiment
+    cache : Optional[EvaluationCache]
+        If specified, the values of f are looked up in the cache before
+        executing, so only the distinct argument sets not in the cache
+        are passed to the orchistrator; the new values are stored in
+        the cache (except `PointFailure` results)
+    journal : Optional[ExperimentJournal]
+        If specified, an empty journal that records the design and the
+        results as the points are executed, so the experiment can be
+        continued with `resume_experiment` if stopped
+
+    Raises
+    ------
+    ValueError
+        If the journal already records an experiment
+    TypeError
+        If the orchistrator is a coroutine function, use
+        `aperform_experiment` instead
 
     Returns
     -------
@@ -131,19 +462,432 @@ def perform_experiment(
     results : List[T@perform_experiment]
         the values returned from f for each point
     """
+    _check_sync_orchistrator(orchistrator)
+    if journal is not None and journal.load()[0] is not None:
+        raise ValueError(
+            f"Journal {journal.path} already records an experiment, "
+            "use resume_experiment to continue it"
+        )
 
     input_space = function_spec.extract_input_space(f)
     design = designer(input_space, n_points, seed)
-    value_dicts = input_space.convert_flat_values_to_dict(
+    arg_sets = input_space.convert_flat_values_to_arguments(
         design.decoded_input_sets, design.input_set_map
     )
 
-    arg_sets = list(
-        convert_values_from_dict(input_space.dimensions, value_dict)
-        for value_dict in value_dicts
+    if journal is None:
+        results = _orchistrate(f, arg_sets, orchistrator, cache)
+    else:
+        journal.write_design(design)
+        results = _orchistrate_with_journal(
+            f, arg_sets, orchistrator, cache, journal, {}
+        )
+    return design, arg_sets, results
+
+
+def resume_experiment(
+    f: Callable[I, T],
+    journal: ExperimentJournal,
+    orchistrator: Callable[
+        [Callable[I, T], List[Dict]], List[T]
+    ] = _default_orchistrator,
+    cache: Optional[EvaluationCache] = None,
+) -> Tuple[DesignOfExperiment, List[Dict], List[T]]:
+    """
+    Continues a batch experiment for function f that was executed with
+    a journal (see `perform_experiment`). Reloads the design and the
+    results recorded by the journal and executes only the points
+    without a recorded result, recording their results in the journal.
+
+    Arguments
+    ---------
+    f : Callable[I, T]
+        The function to continue executing the experiment on
+    journal : ExperimentJournal
+        The journal of the experiment
+    orchistrator : Callable[[Callable[I, T], List[I]], List[T]]
+        A function that executes the remaining points on f
+    cache : Optional[EvaluationCache]
+        If specified, the cache of the values of f
+
+    Raises
+    ------
+    ValueError
+        If the journal does not record the design of an experiment
+    TypeError
+        If the orchistrator is a coroutine function
+
+    Returns
+    -------
+    design : DesignOfExperiment
+        the design of the experiment
+    arg_sets : List[I@resume_experiment]
+        the points passed into f as inputs (i.e., the design of the experiment)
+    results : List[T@resume_experiment]
+        the values returned from f for each point
+    """
+    _check_sync_orchistrator(orchistrator)
+    design, completed_results = journal.load()
+    if design is None:
+        raise ValueError(
+            f"Journal {journal.path} does not record an experiment to resume"
+        )
+    arg_sets = design.input_space.convert_flat_values_to_arguments(
+        design.decoded_input_sets, design.input_set_map
+    )
+    results = _orchistrate_with_journal(
+        f, arg_sets, orchistrator, cache, journal, completed_results
+    )
+    return design, arg_sets, results
+
+
+def _orchistrate(
+    f: Callable[I, T],
+    arg_sets: List[Dict],
+    orchistrator: Callable[[Callable[I, T], List[Dict]], List[T]],
+    cache: Optional[EvaluationCache],
+    on_result: Optional[Callable[[int, Any], None]] = None,
+    chunk_size: int = 100,
+) -> List[T]:
+    """
+    Helper function that executes the experiment on f, using the cache
+    if specified and calling on_result as results are available (see
+    `_orchistrate_with_callback`).
+    """
+    if cache is not None:
+        return _orchistrate_with_cache(
+            f, arg_sets, orchistrator, cache, on_result
+        )
+    if on_result is None:
+        return orchistrator(f, arg_sets)
+    return _orchistrate_with_callback(
+        f, arg_sets, orchistrator, on_result, chunk_size
+    )
+
+
+def _orchistrate_with_callback(
+    f: Callable[I, T],
+    arg_sets: List[Dict],
+    orchistrator: Callable[[Callable[I, T], List[Dict]], List[T]],
+    on_result: Callable[[int, Any], None],
+    chunk_size: int,
+) -> List[T]:
+    """
+    Helper function that executes the experiment on f, calling
+    on_result with the index and the result of each point as the
+    results are available. Orchistrators with an on_result parameter
+    (e.g., `ProcessPoolOrchistrator`) are called once, other
+    orchistrators are called with chunks of chunk_size points.
+    """
+    try:
+        supports_on_result = (
+            "on_result" in inspect.signature(orchistrator).parameters
+        )
+    except (TypeError, ValueError):
+        supports_on_result = False
+    if supports_on_result:
+        return orchistrator(f, arg_sets, on_result=on_result)  # type: ignore
+
+    results: List[Any] = []
+    for start in range(0, len(arg_sets), chunk_size):
+        chunk_results = orchistrator(f, arg_sets[start : start + chunk_size])
+        for i, result in enumerate(chunk_results, start):
+            if isinstance(result, PointFailure):
+                result = replace(result, index=i)
+            on_result(i, result)
+            results.append(result)
+    return results
+
+
+def _orchistrate_with_journal(
+    f: Callable[I, T],
+    arg_sets: List[Dict],
+    orchistrator: Callable[[Callable[I, T], List[Dict]], List[T]],
+    cache: Optional[EvaluationCache],
+    journal: ExperimentJournal,
+    completed_results: Dict[int, Any],
+) -> List[T]:
+    """
+    Helper function that executes the points without a completed result,
+    appending each result to the journal as it is available (except
+    `PointFailure` results, so failed points are retried when resuming).
+    """
+    results: List[Any] = [None] * len(arg_sets)
+    for i, result in completed_results.items():
+        results[i] = result
+    missing_indexes = [
+        i for i in range(len(arg_sets)) if i not in completed_results
+    ]
+
+    def record_result(j: int, result: Any):
+        i = missing_indexes[j]
+        if isinstance(result, PointFailure):
+            result = replace(result, index=i)
+        else:
+            journal.append_result(i, result)
+        results[i] = result
+
+    try:
+        if len(missing_indexes) > 0:
+            _orchistrate(
+                f,
+                [arg_sets[i] for i in missing_indexes],
+                orchistrator,
+                cache,
+                on_result=record_result,
+                chunk_size=journal.checkpoint_size,
+            )
+    finally:
+        journal.sync()
+    return results
+
+
+def _orchistrate_with_cache(
+    f: Callable[I, T],
+    arg_sets: List[Dict],
+    orchistrator: Callable[[Callable[I, T], List[Dict]], List[T]],
+    cache: EvaluationCache,
+    on_result: Optional[Callable[[int, Any], None]] = None,
+) -> List[T]:
+    """
+    Helper function that executes the experiment on f for the argument
+    sets whose values are not cached, each distinct argument set once.
+    Each value is stored in the cache as soon as it is available, so
+    the values are kept if the experiment is interrupted.
+    """
+    keys = [cache.create_key(f, arg_set) for arg_set in arg_sets]
+    results: List[Any] = [None] * len(arg_sets)
+    missing_indexes: Dict[str, List[int]] = {}
+    for i, key in enumerate(keys):
+        if key in missing_indexes:
+            missing_indexes[key].append(i)
+            continue
+        found, value = cache.get(key)
+        if found:
+            results[i] = value
+            if on_result is not None:
+                on_result(i, value)
+        else:
+            missing_indexes[key] = [i]
+    missing_items = list(missing_indexes.items())
+
+    def record_result(j: int, result: Any):
+        key, indexes = missing_items[j]
+        if not isinstance(result, PointFailure):
+            cache.put(key, result)
+        for i in indexes:
+            if isinstance(result, PointFailure):
+                results[i] = replace(result, index=i)
+            else:
+                results[i] = result
+            if on_result is not None:
+                on_result(i, results[i])
+
+    try:
+        if len(missing_items) > 0:
+            _orchistrate_with_callback(
+                f,
+                [arg_sets[indexes[0]] for _, indexes in missing_items],
+                orchistrator,
+                record_result,
+                cache.commit_interval,
+            )
+    finally:
+        cache.commit()
+    return results
+
+
+class ExperimentStream:
+    """
+    Iterates the executions of a batch experiment for function f,
+    yielding `(point_index, arg_set, result)` as each execution
+    completes. The design's points are converted to arguments in chunks
+    as they are needed and the results are not kept, so an experiment
+    can be monitored, stopped early (by no longer iterating) and
+    consumed with a bounded memory footprint. See `iperform_experiment`.
+    """
+
+    def __init__(
+        self,
+        f: Callable[I, T],
+        design: DesignOfExperiment,
+        executor: Optional[Executor] = None,
+        max_pending: Optional[int] = None,
+        chunk_size: int = 64,
+    ):
+        """
+        Arguments
+        ---------
+        f : Callable[I, T]
+            The function to execute the experiment by calling
+        design : DesignOfExperiment
+            The design of the experiment
+        executor : Optional[Executor] = None
+            If specified, the executor the points are submitted to,
+            otherwise the points are executed sequentially
+        max_pending : Optional[int] = None
+            The maximum number of points submitted to the executor but
+            not yet yielded, defaults to twice the number of CPUs
+        chunk_size : int = 64
+            The number of points converted to arguments at a time
+        """
+        self.f = f
+        self.design = design
+        self.executor = executor
+        self.max_pending = (
+            max_pending
+            if max_pending is not None
+            else 2 * (os.cpu_count() or 1)
+        )
+        self.chunk_size = chunk_size
+
+    def iterate_arg_sets(self) -> Iterator[Tuple[int, Dict]]:
+        """
+        Iterates the arguments of each point of the design.
+
+        Returns
+        -------
+        Iterator[Tuple[int, Dict]]
+            the index of each point and the arguments of the point
+        """
+        codec = self.design.input_space.create_codec(
+            self.design.input_set_map
+        )
+        decoded_input_sets = self.design.decoded_input_sets
+        for start in range(0, len(decoded_input_sets), self.chunk_size):
+            arg_sets = codec.convert_to_arguments(
+                decoded_input_sets[start : start + self.chunk_size]
+            )
+            for i, arg_set in enumerate(arg_sets):
+                yield start + i, arg_set
+
+    def __iter__(self) -> Iterator[Tuple[int, Dict, T]]:
+        if self.executor is None:
+            for i, arg_set in self.iterate_arg_sets():
+                yield i, arg_set, self.f(**arg_set)  # type: ignore
+            return
+
+        arg_set_iterator = self.iterate_arg_sets()
+        pending: Dict[Future, Tuple[int, Dict]] = {}
+        try:
+            while True:
+                for i, arg_set in arg_set_iterator:
+                    future = self.executor.submit(self.f, **arg_set)
+                    pending[future] = (i, arg_set)
+                    if len(pending) >= self.max_pending:
+                        break
+                if len(pending) == 0:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i, arg_set = pending.pop(future)
+                    yield i, arg_set, future.result()
+        finally:
+            # the iteration stopped early or an execution failed
+            for future in pending:
+                future.cancel()
+
+
+def iperform_experiment(
+    f: Callable[I, T],
+    n_points: int,
+    designer: Callable[
+        [InputSpace, int, Optional[int]], DesignOfExperiment
+    ] = _default_designer,
+    executor: Optional[Executor] = None,
+    max_pending: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> ExperimentStream:
+    """
+    Designs a batch experiment for function f like `perform_experiment`,
+    but returns a stream of the experiment's executions instead of
+    executing every point before returning. Iterating the stream yields
+    `(point_index, arg_set, result)` as each execution completes; with
+    an executor, the points may complete out of design order.
+
+    Arguments
+    ---------
+    f : Callable[I, T]
+        The function to design an experiment with respect to
+        and to execute this experiment by calling
+    n_points : int
+        The maximum number of points to execute the function
+        with.
+    designer : Callable[[InputSpace, int], List[I], Optional[int]]
+        A function that designs the experiment
+    executor : Optional[Executor] = None
+        If specified, the executor the points are submitted to,
+        otherwise the points are executed sequentially while iterating
+    max_pending : Optional[int] = None
+        The maximum number of points submitted to the executor but
+        not yet yielded, defaults to twice the number of CPUs
+    seed : Optional[int]
+        If specified, seeds the design of the experiment
+
+    Returns
+    -------
+    ExperimentStream
+        the iterable executions, with the design of the experiment as
+        its design attribute
+    """
+    input_space = function_spec.extract_input_space(f)
+    design = designer(input_space, n_points, seed)
+    return ExperimentStream(
+        f, design, executor=executor, max_pending=max_pending
+    )
+
+
+async def aperform_experiment(
+    f: Callable[I, T],
+    n_points: int,
+    designer: Callable[
+        [InputSpace, int, Optional[int]], DesignOfExperiment
+    ] = _default_designer,
+    orchistrator: Optional[Callable[[Callable[I, T], List[Dict]], Any]] = None,
+    seed: Optional[int] = None,
+) -> Tuple[DesignOfExperiment, List[Dict], List[T]]:
+    """
+    Executes a batch experiment for function f like `perform_experiment`
+    but from within an asyncio event loop, so f can be a coroutine
+    function (i.e., defined with `async def`).
+
+    Arguments
+    ---------
+    f : Callable[I, T]
+        The function (or coroutine function) to design an experiment
+        with respect to and to execute this experiment by calling
+    n_points : int
+        The maximum number of points to execute the function
+        with.
+    designer : Callable[[InputSpace, int], List[I], Optional[int]]
+        A function that designs the experiment
+    orchistrator : Optional[Callable[[Callable[I, T], List[I]], Any]]
+        A function (or coroutine function) that executes the experiment
+        on f, defaults to an `AsyncioOrchistrator`
+    seed : Optional[int]
+        If specified, seeds the design of the experiment
+
+    Returns
+    -------
+    design : DesignOfExperiment
+        the design of the experiment
+    arg_sets : List[I@aperform_experiment]
+        the points passed into f as inputs (i.e., the design of the experiment)
+    results : List[T@aperform_experiment]
+        the values returned from f for each point
+    """
+    if orchistrator is None:
+        orchistrator = AsyncioOrchistrator()
+
+    input_space = function_spec.extract_input_space(f)
+    design = designer(input_space, n_points, seed)
+    arg_sets = input_space.convert_flat_values_to_arguments(
+        design.decoded_input_sets, design.input_set_map
     )
 
     results = orchistrator(f, arg_sets)
+    if inspect.isawaitable(results):
+        results = await results
     return design, arg_sets, results
 
 
@@ -156,6 +900,9 @@ def design_experiment(
     design_algorithm=lhs.generate_seperate_designs_by_full_subspace_and_pool,
     optimize_projections: bool = True,
     seed: Optional[int] = None,
+    n_chains: int = 1,
+    n_jobs: Optional[int] = None,
+    parallel_tempering: bool = False,
 ) -> DesignOfExperiment:
     """
     Designs a batch experiment for the subject; ensures that all optional
@@ -177,6 +924,15 @@ def design_experiment(
     seed:Optional[int]
         If specified, seeds the random number generator(s) to ensure
         design is created the same way
+    n_chains: int
+        The number of simulated annealing chains used to optimize the
+        projections, the design of the best chain is returned
+    n_jobs: Optional[int]
+        The number of processes to run the chains in, defaults to the
+        smaller of n_chains and the number of CPUs
+    parallel_tempering: bool
+        If true, the chains anneal at different temperatures and
+        exchange designs (requires n_chains > 1)
 
     Returns
     -------
@@ -197,7 +953,16 @@ def design_experiment(
         rng = np.random.default_rng()
 
     design = design_algorithm(input_space, n_points, rng=rng)
-    if optimize_projections:
+    if optimize_projections and n_chains > 1:
+        design = maxpro.optimize_design_with_multi_chain_sa(
+            design,
+            encoding=maxpro.EncodingEnum.ZERO_ONE_NULL_ENCODING,
+            n_chains=n_chains,
+            n_jobs=n_jobs,
+            parallel_tempering=parallel_tempering,
+            rng=rng,
+        )
+    elif optimize_projections:
         design = maxpro.optimize_design_with_sa(
             design,
             # We want to ensure that the projections are optimized
@@ -0,0 +1,187 @@
+"""
+Provides an append-only journal of an experiment's execution, so a
+long-running experiment that stops before completing can be resumed by
+executing only the points without a recorded result.
+"""
+
+import os
+import pickle
+import struct
+import warnings
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+from raxpy.does.doe import DesignOfExperiment
+
+_DESIGN_RECORD = "design"
+_RESULT_RECORD = "result"
+
+# the header of each record: the size and the CRC-32 of the pickled record
+_RECORD_HEADER = struct.Struct("<QI")
+
+
+class ExperimentJournal:
+    """
+    Records the design of an experiment once and then appends a record
+    of each completed point's index and result to a file of pickled
+    records, each prefixed by its size and checksum. The file is flushed
+    after each record and synced to disk periodically (and when closing
+    the journal), so at most the records since the last sync are lost if
+    the host fails. A partially written last record, left by a process
+    stopped while writing, is discarded when the journal is loaded.
+    """
+
+    def __init__(
+        self, path: str, fsync_interval: int = 100, checkpoint_size: int = 100
+    ):
+        """
+        Arguments
+        ---------
+        path: str
+            The path of the journal file, created if it does not exist
+        fsync_interval: int = 100
+            The number of records appended between syncs to disk
+        checkpoint_size: int = 100
+            The number of points executed between appending their
+            results when executing an experiment with an orchistrator
+            without an on_result parameter (see
+            `raxpy.execute.perform_experiment`); the results are
+            otherwise appended as each point completes
+        """
+        if fsync_interval < 1:
+            raise ValueError(
+                f"fsync_interval must be at least 1: {fsync_interval}"
+            )
+        if checkpoint_size < 1:
+            raise ValueError(
+                f"checkpoint_size must be at least 1: {checkpoint_size}"
+            )
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.checkpoint_size = checkpoint_size
+        self._file = None
+        self._unsynced_count = 0
+
+    def load(self) -> Tuple[Optional[DesignOfExperiment], Dict[int, Any]]:
+        """
+        Reads the records of the journal, truncating a partially
+        written last record.
+
+        Raises
+        ------
+        ValueError
+            If a complete record cannot be read (i.e., the journal is
+            corrupted); the journal is not modified
+
+        Returns
+        -------
+        design : Optional[DesignOfExperiment]
+            the design of the experiment, None if not recorded yet
+        results : Dict[int, Any]
+            the result of each completed point given its index
+        """
+        self.close()
+        design = None
+        results: Dict[int, Any] = {}
+        if not os.path.exists(self.path):
+            return design, results
+
+        with open(self.path, "rb") as f:
+            valid_size = 0
+            is_torn = False
+            while True:
+                header = f.read(_RECORD_HEADER.size)
+                if len(header) == 0:
+                    break
+                if len(header) < _RECORD_HEADER.size:
+                    is_torn = True
+                    break
+                size, checksum = _RECORD_HEADER.unpack(header)
+                data = f.read(size)
+                if len(data) < size:
+                    # the record extends past the end of the file
+                    is_torn = True
+                    break
+                try:
+                    if zlib.crc32(data) != checksum:
+                        raise ValueError("checksum mismatch")
+                    record = pickle.loads(data)
+                except Exception as e:
+                    raise ValueError(
+                        f"Unable to read the record at byte {valid_size} of "
+                        f"journal {self.path}"
+                    ) from e
+                valid_size = f.tell()
+                if record[0] == _DESIGN_RECORD:
+                    design = record[1]
+                elif record[0] == _RESULT_RECORD:
+                    results[record[1]] = record[2]
+
+        if is_torn:
+            warnings.warn(
+                "Discarding a partially written record at the end of "
+                f"journal {self.path}"
+            )
+            os.truncate(self.path, valid_size)
+        return design, results
+
+    def _append(self, record: Tuple):
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        data = pickle.dumps(record)
+        self._file.write(_RECORD_HEADER.pack(len(data), zlib.crc32(data)))
+        self._file.write(data)
+        self._file.flush()
+        self._unsynced_count += 1
+        if self._unsynced_count >= self.fsync_interval:
+            self.sync()
+
+    def write_design(self, design: DesignOfExperiment):
+        """
+        Records the design of the experiment, synced to disk immediately.
+
+        Arguments
+        ---------
+        design: DesignOfExperiment
+            the design of the experiment
+        """
+        self._append((_DESIGN_RECORD, design))
+        self.sync()
+
+    def append_result(self, index: int, result: Any):
+        """
+        Records the result of a completed point.
+
+        Arguments
+        ---------
+        index: int
+            the index of the point in the design
+        result: Any
+            the picklable result of the point
+        """
+        self._append((_RESULT_RECORD, index, result))
+
+    def sync(self):
+        """
+        Syncs the appended records to disk.
+        """
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._unsynced_count = 0
+
+    def close(self):
+        """
+        Syncs the appended records to disk and closes the journal's
+        file, reopened as needed.
+        """
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "ExperimentJournal":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
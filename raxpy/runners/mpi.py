@@ -16,6 +16,7 @@ from .coordinator import (
 )
 from .task_provider import BatchExperimentTaskProvider
 from .. import design_experiment, function_spec
+from ..journal import ExperimentJournal
 
 
 EVENT_TYPE_REGISTER = "register"  # sent from worker to coordinator
@@ -31,7 +32,9 @@ class Event:
     data: object = None
 
 
-def perform_distributed_experiment(f, n_points, post_process):
+def perform_distributed_experiment(
+    f, n_points, post_process, journal: Optional[ExperimentJournal] = None
+):
     """
     Executes a distributed experiment. Must be called from
     within a MPI Process.  The MPI Process with rank-0 acts
@@ -49,6 +52,11 @@ def perform_distributed_experiment(f, n_points, post_process):
     is called with the first argument being the designed experiment and
     the second arugment with the list of the results for each point in the
     design.
+
+    If a journal is specified, the coordinator records the design and
+    each point's result in it; if the journal already records an
+    experiment, the experiment is resumed by executing only the points
+    without a recorded result.
     """
     input_space = function_spec.extract_input_space(f)
 
@@ -58,11 +66,14 @@ def perform_distributed_experiment(f, n_points, post_process):
     coordinator_rank = 0
     if rank == coordinator_rank:
         worker_pool = MPIWorkerPool(comm=comm, tag=tag)
-        doe = design_experiment(input_space, n_points=n_points)
-
-        task_provider = BatchExperimentTaskProvider(design=doe)
+        task_provider = BatchExperimentTaskProvider.create(
+            lambda: design_experiment(input_space, n_points=n_points),
+            journal=journal,
+        )
         coordinate(task_provider, worker_pool)
         worker_pool.shutdown()
+        if journal is not None:
+            journal.close()
         post_process(task_provider.design, task_provider.results)
     else:
         # send registration message
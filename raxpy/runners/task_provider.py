@@ -1,8 +1,9 @@
-from typing import Optional, List, Dict
+from typing import Callable, Optional, List, Dict
 from dataclasses import dataclass, field
 import numpy as np
 
 from raxpy.does.doe import DesignOfExperiment
+from raxpy.journal import ExperimentJournal
 from raxpy.spaces.dimensions import convert_values_from_dict
 
 
@@ -12,6 +13,60 @@ class BatchExperimentTaskProvider:
     _active_point = 0
     _active_tasks: Dict = field(default_factory=dict)
     results: List = field(default_factory=list)
+    journal: Optional[ExperimentJournal] = None
+    completed_results: Dict[int, object] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if len(self.completed_results) > 0:
+            self.results = [None for _ in range(self.design.point_count)]
+            for index, result in self.completed_results.items():
+                self.results[index] = result
+        if self.journal is not None:
+            # records the design of a new experiment
+            if self.journal.load()[0] is not None:
+                raise ValueError(
+                    f"Journal {self.journal.path} already records an "
+                    "experiment, use from_journal to resume it"
+                )
+            self.journal.write_design(self.design)
+
+    @classmethod
+    def from_journal(
+        cls, journal: ExperimentJournal
+    ) -> "BatchExperimentTaskProvider":
+        """
+        Creates a task provider that resumes the experiment recorded by
+        the journal, providing tasks only for the points without a
+        recorded result.
+        """
+        design, completed_results = journal.load()
+        if design is None:
+            raise ValueError(
+                f"Journal {journal.path} does not record an experiment to "
+                "resume"
+            )
+        task_provider = cls(
+            design=design, completed_results=completed_results
+        )
+        # assigned after initialization, the design is already recorded
+        task_provider.journal = journal
+        return task_provider
+
+    @classmethod
+    def create(
+        cls,
+        create_design: Callable[[], DesignOfExperiment],
+        journal: Optional[ExperimentJournal] = None,
+    ) -> "BatchExperimentTaskProvider":
+        """
+        Creates a task provider that resumes the experiment recorded by
+        the journal if it records one, otherwise provides the tasks of
+        a new experiment designed by create_design (and recorded by the
+        journal if specified).
+        """
+        if journal is not None and journal.load()[0] is not None:
+            return cls.from_journal(journal)
+        return cls(design=create_design(), journal=journal)
 
     def process_task_result(self, task, task_result):
         if len(self.results) == 0:
@@ -19,8 +74,15 @@ class BatchExperimentTaskProvider:
             self.results = [None for _ in range(self.design.point_count)]
         self.results[task["index"]] = task_result
         del self._active_tasks[task["index"]]
+        if self.journal is not None:
+            self.journal.append_result(task["index"], task_result)
+            if not self.is_waiting_for_results():
+                self.journal.sync()
 
     def next(self) -> Optional[object]:
+        # skip the points completed before resuming
+        while self._active_point in self.completed_results:
+            self._active_point += 1
 
         if self._active_point < self.design.point_count:
             value_dicts = self.design.input_space.convert_flat_values_to_dict(
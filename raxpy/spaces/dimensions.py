@@ -26,7 +26,24 @@ from . import dim_tags
 T = TypeVar("T")
 
 
-def _map_values(x, value_set, portion_null) -> List[Union[int, float]]:
+def _normalize_value_set(value_set) -> Tuple:
+    """
+    Helper function to convert a value set to a tuple before building a
+    lookup of its values by index. The values of unordered sets are
+    sorted to give them a deterministic order.
+    """
+    if isinstance(value_set, tuple):
+        return value_set
+    if isinstance(value_set, (set, frozenset)):
+        try:
+            return tuple(sorted(value_set))
+        except TypeError:
+            # values of types that are not comparable with each other
+            return tuple(sorted(value_set, key=repr))
+    return tuple(value_set)
+
+
+def _map_values(x, value_set, portion_null) -> np.ndarray:
     """
     Helper function to map a 0-1 array of values to a
     discrete set of values and a porition of the values
@@ -44,38 +61,68 @@ def _map_values(x, value_set, portion_null) -> List[Union[int, float]]:
 
     Returns
     -------
-    List[Union[int, float]]
+    np.ndarray
         the transformed array with values from the value_set
     """
+    x = np.asarray(x, dtype=float)
+    value_set = _normalize_value_set(value_set)
     value_count = len(value_set)
     boundary_size = 1.0 / value_count
 
+    null_mask = np.isnan(x)
     if portion_null is not None:
-        return [
-            (
-                value_set[
-                    min(
-                        int(
-                            ((xp - portion_null) / (1.0 - portion_null))
-                            // boundary_size
-                        ),
-                        value_count - 1,
-                    )
-                ]
-                if (not np.isnan(xp)) and xp > portion_null
-                else np.nan
-            )
-            for xp in x
-        ]
-    else:
-        return [
-            (
-                value_set[min(int(xp // boundary_size), value_count - 1)]
-                if not np.isnan(xp)
-                else np.nan
-            )
-            for xp in x
-        ]
+        null_mask |= x <= portion_null
+        x = (x - portion_null) / (1.0 - portion_null)
+
+    indices = np.clip(
+        np.floor_divide(np.where(null_mask, 0.0, x), boundary_size),
+        0,
+        value_count - 1,
+    ).astype(np.intp)
+
+    return np.where(
+        null_mask, np.nan, np.take(np.asarray(value_set, dtype=float), indices)
+    )
+
+
+def _map_values_to_indices(x, value_set) -> np.ndarray:
+    """
+    Helper function to map an array of values from a discrete
+    set of values to the 0-1 encoded position of the values
+    in the set; np.nan values are kept as np.nan.
+
+    Arguments
+    ---------
+    x
+        an array of values from value_set or np.nan
+    value_set
+        a list of values
+
+    Raises
+    ------
+    ValueError:
+        If a value is not in the value_set
+
+    Returns
+    -------
+    np.ndarray
+        the 0-1 encoded array
+    """
+    x = np.asarray(x, dtype=float)
+    values = np.asarray(_normalize_value_set(value_set), dtype=float)
+    c = len(values)
+
+    null_mask = np.isnan(x)
+    sorter = np.argsort(values, kind="stable")
+    positions = np.clip(
+        np.searchsorted(values, x, side="right", sorter=sorter) - 1, 0, c - 1
+    )
+    indices = np.take(sorter, positions)
+
+    if np.any(np.take(values, indices)[~null_mask] != x[~null_mask]):
+        raise ValueError(f"Values {x} are not all in value set {value_set}")
+
+    return np.where(null_mask, np.nan, indices / max(1, c - 1))
 
 
 def convert_values_from_dict(dimensions, input_value: Dict[str, Any]) -> Dict:
@@ -199,7 +246,7 @@ class Dimension(Generic[T]):
 
         Returns
         -------
-            list of decoded values
+            array of decoded values, np.nan representing nulls
         """
         raise NotImplementedError(
             "Abstract method, subclass should implement this method"
@@ -218,7 +265,7 @@ class Dimension(Generic[T]):
 
         Returns
         -------
-            list of encoded values
+            array of encoded values
         """
         raise NotImplementedError(
             "Abstract method, subclass should implement this method"
@@ -368,9 +415,7 @@ class Int(Dimension[int]):
         """
         return int(input_value)
 
-    def collapse_uniform(
-        self, x, utilize_null_portions=True
-    ) -> List[Union[int, float]]:
+    def collapse_uniform(self, x, utilize_null_portions=True) -> np.ndarray:
         """
         Implementation of abstract method. See `Dimension.collapse_uniform`.
 
@@ -386,11 +431,15 @@ class Int(Dimension[int]):
         else:
             if self.lb is not None and self.ub is not None:
                 if self.has_tag(dim_tags.LOG):
-                    floats = _transform(x, self.lb, self.ub, self.has_tag(dim_tags.LOG), utilize_null_portions, self.portion_null)
-                    return np.array(list(
-                        max(min(round(xp),self.ub),self.lb) if not np.isnan(xp) else np.nan
-                        for xp in floats
-                    ))
+                    floats = _transform(
+                        x,
+                        self.lb,
+                        self.ub,
+                        True,
+                        utilize_null_portions,
+                        self.portion_null,
+                    )
+                    return np.clip(np.round(floats), self.lb, self.ub)
                 else:
                     vs = list(range(self.lb, self.ub + 1))
 
@@ -415,33 +464,21 @@ class Int(Dimension[int]):
 
         Returns
         -------
-            list of encoded values
+            array of encoded values
         """
 
         possible_values = self.value_set
         if possible_values is None:
             if self.has_tag(dim_tags.LOG):
-                def mapping_f(x_value):
-                    if np.isnan(x_value):
-                        return x_value
-                    return (math.log(x_value) - math.log(self.lb)) / (math.log(self.ub) - math.log(self.lb))
-                return np.array(list(map(mapping_f, x)))
+                lb = math.log(cast(int, self.lb))
+                ub = math.log(cast(int, self.ub))
+                return (np.log(np.asarray(x, dtype=float)) - lb) / (ub - lb)
             else:
                 possible_values = list(
                     range(cast(int, self.lb), cast(int, self.ub) + 1)
                 )
 
-        c = len(possible_values)
-        map_dict = {}
-        for i, value in enumerate(possible_values):
-            map_dict[value] = i / max(1, c - 1)
-
-        def mapping_f(x_value):
-            if np.isnan(x_value):
-                return x_value
-            return map_dict[x_value]
-
-        return np.array(list(map(mapping_f, x)))
+        return _map_values_to_indices(x, possible_values)
 
     def validate(self, input_value, specified_input: bool) -> None:
         """
@@ -484,7 +521,7 @@ class Int(Dimension[int]):
             Optional[List[int]]: the discrete values represented by this dimension if applicable, None otherwise
         """
         if self.value_set is not None:
-            return list(self.value_set)
+            return list(_normalize_value_set(self.value_set))
         elif self.lb is not None and self.ub is not None:
             return list(range(self.lb, self.ub + 1))
         else:
@@ -560,49 +597,22 @@ def _transform(x, lb, ub, use_log, utilize_null_portions, portion_null):
     utilize_null_portions   whether to consider the portion_null attribute to assign null values
     portion_null   the threshold of the 0-1 range to map to null values if utilize_null_portions is True
     """
-    r = ub - lb
-            
+    x = np.asarray(x, dtype=float)
+
+    null_mask = None
     if portion_null is not None and utilize_null_portions:
-        if use_log:
-            return [
-                (
-                    math.exp(math.log(lb) + (
-                        (xp - portion_null)
-                        / (1.0 - portion_null)
-                    ) * (math.log(ub) - math.log(lb)))
-                    if xp is not None and not np.isnan(xp) and xp > portion_null
-                    else np.nan
-                )
-                for xp in x
-            ]
-        else:
-            return [
-                (
-                    lb
-                    + r
-                    * (
-                        (xp - portion_null)
-                        / (1.0 - portion_null)
-                    )
-                    if xp is not None and not np.isnan(xp) and xp > portion_null
-                    else np.nan
-                )
-                for xp in x
-            ]
+        null_mask = np.isnan(x) | (x <= portion_null)
+        x = (x - portion_null) / (1.0 - portion_null)
+
+    if use_log:
+        values = np.exp(math.log(lb) + x * (math.log(ub) - math.log(lb)))
     else:
-        if use_log:
-            return [
-                (
-                    math.exp(math.log(lb) + (
-                        xp
-                    ) * (math.log(ub) - math.log(lb)))
-                )
-                for xp in x
-            ]
-        else:
-            return [
-                lb + r * xp if xp is not None else None for xp in x
-            ]
+        values = lb + (ub - lb) * x
+
+    if null_mask is not None:
+        values[null_mask] = np.nan
+    return values
+
 
 @dataclass
 class Float(Dimension[float]):
@@ -639,8 +649,15 @@ class Float(Dimension[float]):
             )
 
         if self.lb is not None and self.ub is not None:
-            return _transform(x, self.lb, self.ub, self.has_tag(dim_tags.LOG), utilize_null_portions, self.portion_null)
-            
+            return _transform(
+                x,
+                self.lb,
+                self.ub,
+                self.has_tag(dim_tags.LOG),
+                utilize_null_portions,
+                self.portion_null,
+            )
+
         raise ValueError(
             "Unbounded Float dimension cannot transform a uniform 0-1 value"
         )
@@ -658,47 +675,27 @@ class Float(Dimension[float]):
 
         Returns
         -------
-            list of encoded values
+            array of encoded values
         """
 
-        def mapping_df(x_value):
-            # default mapping function if criteira for reverse decoding are not specified
-            raise NotImplementedError("Unable to reverse decoding")
-
-        mapping_f = mapping_df
+        x = np.asarray(x, dtype=float)
 
         if self.value_set is not None:
-
-            c = len(self.value_set)
-            map_dict = {}
-            for i, value in enumerate(self.value_set):
-                map_dict[value] = i / max(1, c - 1)
-
-            def mapping_f1(x_value):
-                if np.isnan(x_value):
-                    return x_value
-                return map_dict[x_value]
-
-            mapping_f = mapping_f1
+            return _map_values_to_indices(x, self.value_set)
         elif self.lb is not None and self.ub is not None:
             if self.has_tag(dim_tags.LOG):
-                def mapping_f2(x_value):
-                    if np.isnan(x_value):
-                        return x_value
-                    return (math.log(x_value) - math.log(self.lb)) / (math.log(self.ub) - math.log(self.lb))
-
-                mapping_f = mapping_f2
+                lb = math.log(self.lb)
+                ub = math.log(cast(float, self.ub))
+                return (np.log(x) - lb) / (ub - lb)
             else:
-                def mapping_f2(x_value):
-                    if np.isnan(x_value):
-                        return x_value
-                    return (x_value - self.lb) / (
-                        cast(float, self.ub) - cast(float, self.lb)
-                    )
-
-                mapping_f = mapping_f2
+                return (x - self.lb) / (
+                    cast(float, self.ub) - cast(float, self.lb)
+                )
 
-        return np.array(list(map(mapping_f, x)))
+        if len(x) > 0:
+            # criteira for reverse decoding are not specified
+            raise NotImplementedError("Unable to reverse decoding")
+        return x
 
     def validate(self, input_value, specified_input: bool) -> None:
         """
@@ -747,7 +744,7 @@ class Float(Dimension[float]):
             Optional[List[float]]: the discrete values represented by this dimension if applicable, None otherwise
         """
         if self.value_set is not None:
-            return list(self.value_set)
+            return list(_normalize_value_set(self.value_set))
         else:
             return None
 
@@ -794,7 +791,7 @@ class Text(Dimension[str]):
             and self.value_set is not None
         ):
             index = int(input_value)
-            v = self.value_set[index]
+            v = _normalize_value_set(self.value_set)[index]
             return v.value if isinstance(v, CategoryValue) else v
 
         return str(input_value)
@@ -804,15 +801,9 @@ class Text(Dimension[str]):
         Implementation of abstract method. See `Dimension.reverse_decoding`.
         """
         if self.value_set is not None:
-
-            def mapping_f(x_value):
-                if (
-                    np.isnan(x_value)
-                 ):
-                    return np.nan
-                return x_value/(len(self.value_set)-1)
-
-            return np.array(list(map(mapping_f, x)))
+            return np.asarray(x, dtype=float) / max(
+                1, len(self.value_set) - 1
+            )
         else:
             raise NotImplementedError(
                 "Unable to reverse decode Text dimension without a value set"
@@ -872,7 +863,10 @@ class Text(Dimension[str]):
             Optional[List[str]]: the discrete values represented by this dimension if applicable, None otherwise
         """
         if self.value_set is not None:
-            return [v.value if isinstance(v, CategoryValue) else v for v in self.value_set]
+            return [
+                v.value if isinstance(v, CategoryValue) else v
+                for v in _normalize_value_set(self.value_set)
+            ]
         else:
             return None
 
@@ -938,19 +932,10 @@ class Variant(Dimension):
 
         Returns
         -------
-            list of encoded values
-        """
-        return np.array(
-            list(
-                map(
-                    lambda x_value: (
-                        x_value
-                        if np.isnan(x_value)
-                        else x_value / (len(self.options) - 1)
-                    ),
-                    x,
-                )
-            )
+            array of encoded values
+        """
+        return np.asarray(x, dtype=float) / max(
+            1, len(cast(List[Dimension], self.options)) - 1
         )
 
     def collapse_uniform(self, x, utilize_null_portions=True):
@@ -1130,11 +1115,10 @@ class Composite(Dimension):
 
         Returns
         -------
-            list of encoded values
+            array of encoded values
         """
-        return np.array(
-            list(map(lambda x_value: x_value if np.isnan(x_value) else 1.0, x))
-        )
+        x = np.asarray(x, dtype=float)
+        return np.where(np.isnan(x), np.nan, 1.0)
 
     def collapse_uniform(self, x, utilize_null_portions=True):
         """
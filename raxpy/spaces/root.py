@@ -6,12 +6,23 @@ a list of dimensions.
 
 import itertools
 import dataclasses
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 import numpy as np
 
-from .dimensions import Dimension, Variant, ChildrenTypes, Composite
+from .dimensions import (
+    Bool,
+    CategoryValue,
+    ChildrenTypes,
+    Composite,
+    Dimension,
+    Float,
+    Int,
+    Text,
+    Variant,
+    _normalize_value_set,
+)
 
 
 def _generate_combinations(base_list: list) -> list:
@@ -371,6 +382,375 @@ def _create_dict_from_flat_values(
     return dict_values
 
 
+# marks null values of dimensions without children when converting
+# matrices to arguments
+_NULL = object()
+
+
+def _convert_column(dim: Dimension, column: np.ndarray) -> List[Any]:
+    """
+    Helper function that converts a column of decoded values of a
+    dimension without children to Python-native argument values
+    (see `Dimension.convert_to_argument`), with _NULL for np.nan values.
+    """
+    null_mask = np.isnan(column)
+    filled_column = np.where(null_mask, 0.0, column)
+
+    if isinstance(dim, Bool):
+        values = (filled_column.astype(np.int64) == 1).tolist()
+    elif isinstance(dim, Int):
+        values = filled_column.astype(np.int64).tolist()
+    elif isinstance(dim, Float):
+        values = filled_column.tolist()
+    elif isinstance(dim, Text) and dim.value_set is not None:
+        categories = [
+            v.value if isinstance(v, CategoryValue) else v
+            for v in _normalize_value_set(dim.value_set)
+        ]
+        values = [
+            categories[i] for i in filled_column.astype(np.int64).tolist()
+        ]
+    else:
+        values = [
+            None if is_null else dim.convert_to_argument(value)
+            for value, is_null in zip(column, null_mask)
+        ]
+
+    for i in np.flatnonzero(null_mask):
+        values[i] = _NULL
+    return values
+
+
+def _create_arguments(
+    dimensions: List[Dimension],
+    dimension_values: List[Tuple[np.ndarray, List[Any]]],
+    n: int,
+) -> List[Dict]:
+    """
+    Helper function that creates the argument dicts of each row given
+    the converted values of the dimensions, see `SpaceCodec._convert_dimension`.
+    Dimensions not specified by a row are assigned their default value
+    and null values are assigned None for nullable dimensions, following
+    `convert_values_from_dict`.
+    """
+    keys = []
+    columns = []
+    for dim, (present, values) in zip(dimensions, dimension_values):
+        default_value = dim.default_value
+        null_value = None if dim.nullable else default_value
+        keys.append(dim.local_id)
+        columns.append(
+            [
+                (
+                    (null_value if value is _NULL else value)
+                    if is_present
+                    else default_value
+                )
+                for is_present, value in zip(present.tolist(), values)
+            ]
+        )
+
+    if len(columns) == 0:
+        return [{} for _ in range(n)]
+    return [dict(zip(keys, row_values)) for row_values in zip(*columns)]
+
+
+class SpaceCodec:
+    """
+    A plan to encode and decode the matrices of a space given the
+    columns of its dimensions, compiled once per (space, column map).
+    The dimension tree is flattened once to derive the columns to
+    transform, the null thresholds of the dimensions (read when a matrix
+    is encoded, so updates to `portion_null` are respected) and the
+    parent dimensions whose decoded values determine when a column is
+    null. Encoding and decoding a matrix then only costs the vectorized
+    transforms of each column. The codec also converts decoded matrices
+    to function arguments column-wise.
+    """
+
+    def __init__(
+        self, dimensions: List[Dimension], dim_column_map: Dict[str, int]
+    ):
+        """
+        Arguments
+        ---------
+        dimensions : List[Dimension]
+            the root dimensions of the space
+        dim_column_map : Dict[str, int]
+            the index of dimensions in the matrices given the dimensions' ids
+        """
+        self.dimensions = dimensions
+        self.dim_column_map = dict(dim_column_map)
+
+        # the columns to transform, ordered parents before children
+        self.columns: List[Tuple[int, Dimension]] = []
+        seen_ids = set()
+        for dim in create_all_iterable(dimensions):
+            if dim.id in self.dim_column_map and dim.id not in seen_ids:
+                seen_ids.add(dim.id)
+                self.columns.append((self.dim_column_map[dim.id], dim))
+
+        # the paths from the root to each column, a path is a list of
+        # parent columns and the variant option index (None for
+        # composite parents) the parent must decode to
+        column_paths: Dict[int, List[List[Tuple[int, Optional[int]]]]] = {}
+        parent_columns = set()
+        for path, dim in create_path_iterable(dimensions, True):
+            if dim.id in self.dim_column_map and len(path) > 0:
+                column_path = [
+                    (
+                        self.dim_column_map[path_component.dimension_id],
+                        path_component.variant_option_index,
+                    )
+                    for path_component in path
+                    if path_component.dimension_id in self.dim_column_map
+                ]
+                parent_columns.update(c for c, _ in column_path)
+                column_paths.setdefault(
+                    self.dim_column_map[dim.id], []
+                ).append(column_path)
+
+        self.null_dependencies: List[
+            Tuple[int, List[List[Tuple[int, Optional[int]]]]]
+        ] = [
+            (column_index, column_paths[column_index])
+            for column_index, _ in self.columns
+            if column_index in column_paths
+        ]
+        self.parent_columns: List[Tuple[int, Dimension]] = [
+            (column_index, dim)
+            for column_index, dim in self.columns
+            if column_index in parent_columns
+        ]
+
+    def convert_to_arguments(self, decoded_values: np.ndarray) -> List[Dict]:
+        """
+        Converts a matrix of decoded values to the arguments of a function
+        with the dimensions as parameters, one dict per row. Equivalent to
+        calling `convert_values_from_dict` on each of the dicts created by
+        `Space.convert_flat_values_to_dict`, but the matrix is processed
+        column-wise: each column is converted once to Python-native values
+        and the rows of variant options and non-null composites are
+        selected with masks.
+
+        Arguments
+        ---------
+        decoded_values : np.ndarray
+            the decoded matrix with rows representing data-points
+
+        Raises
+        ------
+        ValueError:
+            If a row of a non-nullable variant selects an option that
+            does not specify any values
+
+        Returns
+        -------
+        List[Dict]
+            the arguments of each row
+        """
+        decoded_values = np.asarray(decoded_values, dtype=float)
+        rows = np.arange(decoded_values.shape[0])
+        return _create_arguments(
+            self.dimensions,
+            [
+                self._convert_dimension(dim, decoded_values, rows)
+                for dim in self.dimensions
+            ],
+            len(rows),
+        )
+
+    def _convert_dimension(
+        self, dim: Dimension, decoded_values: np.ndarray, rows: np.ndarray
+    ) -> Tuple[np.ndarray, List[Any]]:
+        """
+        Converts the values of dim for the rows of decoded_values.
+
+        Returns
+        -------
+        present : np.ndarray
+            mask of the rows that specify the dimension
+        values : List[Any]
+            the argument of each row, _NULL for null values of
+            dimensions without children
+        """
+        n = len(rows)
+        column_index = self.dim_column_map.get(dim.id)
+
+        if not dim.has_child_dimensions():
+            if column_index is None:
+                return np.zeros(n, dtype=bool), [None] * n
+            return np.ones(n, dtype=bool), _convert_column(
+                dim, decoded_values[rows, column_index]
+            )
+
+        values: List[Any] = [None] * n
+
+        if isinstance(dim, Variant):
+            if column_index is None:
+                return np.zeros(n, dtype=bool), values
+            column = decoded_values[rows, column_index]
+            present = ~np.isnan(column)
+            option_indices = np.round(np.where(present, column, -1.0))
+            for option_index, option in enumerate(
+                cast(List[Dimension], dim.options)
+            ):
+                option_rows = np.flatnonzero(option_indices == option_index)
+                if len(option_rows) == 0:
+                    continue
+                option_present, option_values = self._convert_dimension(
+                    option, decoded_values, rows[option_rows]
+                )
+                if not dim.nullable and not np.all(option_present):
+                    raise ValueError(
+                        "non-nullable variant trying to convert a row that "
+                        f"does not have an option specified: {dim.id}"
+                    )
+                for i, is_present, value in zip(
+                    option_rows, option_present, option_values
+                ):
+                    if is_present and value is not _NULL:
+                        values[i] = value
+            return present, values
+
+        # dimensions with children that are not variants (composites)
+        if column_index is None:
+            present = np.ones(n, dtype=bool)
+        else:
+            present = ~np.isnan(decoded_values[rows, column_index])
+        present_rows = np.flatnonzero(present)
+
+        children = cast(List[Dimension], cast(ChildrenTypes, dim).children)
+        children_values = [
+            self._convert_dimension(child, decoded_values, rows[present_rows])
+            for child in children
+        ]
+
+        # composites without any specified children are not specified
+        children_present = np.zeros(len(present_rows), dtype=bool)
+        for child_present, _ in children_values:
+            children_present |= child_present
+        present[present_rows[~children_present]] = False
+
+        type_class = cast(Composite, dim).type_class
+        for i, is_present, args in zip(
+            present_rows,
+            children_present,
+            _create_arguments(children, children_values, len(present_rows)),
+        ):
+            if is_present:
+                values[i] = type_class(**args)  # type: ignore
+
+        return present, values
+
+    def encode_to_zero_one_null_matrix(
+        self, zero_one_encoded_values: np.ndarray
+    ) -> np.ndarray:
+        """
+        See `Space.encode_to_zero_one_null_matrix`.
+        """
+        zero_one_encoded_values = np.asarray(
+            zero_one_encoded_values, dtype=float
+        )
+        adjusted_encoded_values = np.array(zero_one_encoded_values)
+        n = zero_one_encoded_values.shape[0]
+
+        decoded_parent_columns = {
+            column_index: np.asarray(
+                dim.collapse_uniform(
+                    zero_one_encoded_values[:, column_index], True
+                )
+            )
+            for column_index, dim in self.parent_columns
+        }
+
+        for column_index, dim in self.columns:
+            portion_null = dim.portion_null
+            if portion_null is not None and portion_null > 0.0:
+                encoded_column = zero_one_encoded_values[:, column_index]
+                adjusted_encoded_values[:, column_index] = np.where(
+                    encoded_column > portion_null,
+                    (encoded_column - portion_null) / (1.0 - portion_null),
+                    np.nan,
+                )
+
+        for column_index, paths in self.null_dependencies:
+            include_mask = np.zeros(n, dtype=bool)
+            for path in paths:
+                path_include_mask = np.ones(n, dtype=bool)
+                for parent_column_index, variant_option_index in path:
+                    parent_decoded_column = decoded_parent_columns[
+                        parent_column_index
+                    ]
+                    if variant_option_index is not None:
+                        # must address variant children
+                        path_include_mask &= (
+                            parent_decoded_column == variant_option_index
+                        )
+                    else:
+                        # must address non-variant children
+                        path_include_mask &= ~np.isnan(parent_decoded_column)
+                include_mask |= path_include_mask
+            adjusted_encoded_values[~include_mask, column_index] = np.nan
+
+        return adjusted_encoded_values
+
+    def reverse_decoding_to_zero_one_null_matrix(
+        self, decoded_values: np.ndarray
+    ) -> np.ndarray:
+        """
+        See `Space.reverse_decoding_to_zero_one_null_matrix`.
+        """
+        adjusted_encoded_values = np.array(decoded_values, dtype=float)
+        for column_index, dim in self.columns:
+            adjusted_encoded_values[:, column_index] = dim.reverse_decoding(
+                adjusted_encoded_values[:, column_index]
+            )
+        return adjusted_encoded_values
+
+    def decode_zero_one_matrix(
+        self,
+        zero_one_encoded_values: np.ndarray,
+        utilize_null_portions=True,
+    ) -> np.ndarray:
+        """
+        See `Space.decode_zero_one_matrix`.
+        """
+        if utilize_null_portions:
+            decoded_values = self.encode_to_zero_one_null_matrix(
+                zero_one_encoded_values
+            )
+        else:
+            decoded_values = np.array(zero_one_encoded_values, dtype=float)
+
+        for column_index, dim in self.columns:
+            decoded_values[:, column_index] = dim.collapse_uniform(
+                decoded_values[:, column_index], utilize_null_portions=False
+            )
+        return decoded_values
+
+
+def _snapshot_dimension(dim: Dimension) -> Tuple:
+    """
+    Helper function that copies the attribute values of a dimension (and
+    of its nested dimensions) to compare them after the dimension may
+    have been mutated.
+    """
+    values = []
+    for value in dim.__dict__.values():
+        if isinstance(value, Dimension):
+            value = _snapshot_dimension(value)
+        elif isinstance(value, (list, tuple)):
+            value = tuple(
+                _snapshot_dimension(v) if isinstance(v, Dimension) else v
+                for v in value
+            )
+        elif isinstance(value, set):
+            value = frozenset(value)
+        values.append(value)
+    return (type(dim), tuple(values))
+
+
 @dataclass
 class Space:
     """
@@ -379,6 +759,22 @@ class Space:
     """
 
     dimensions: List[Dimension]
+    # codecs by column map, with the snapshot of the dimensions they
+    # were compiled for, see create_codec
+    _codec_cache: Dict[Tuple, Tuple[Tuple, SpaceCodec]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any):
+        if name == "dimensions":
+            self.__dict__.get("_codec_cache", {}).clear()
+        super().__setattr__(name, value)
+
+    def __getstate__(self):
+        # codecs are not pickled (or deep-copied) with the space
+        state = self.__dict__.copy()
+        state["_codec_cache"] = {}
+        return state
 
     @property
     def children(self) -> List[Dimension]:
@@ -544,6 +940,62 @@ class Space:
 
         return value_dicts
 
+    def create_codec(self, dim_column_map: Dict[str, int]) -> SpaceCodec:
+        """
+        Gets the codec to encode and decode matrices of this space given
+        the columns of the dimensions. Codecs are compiled once per
+        column map and cached; a cached codec is recompiled if the
+        dimensions (including their children) were mutated after it was
+        compiled.
+
+        Arguments
+        ---------
+        self : Space
+            Space
+        dim_column_map : Dict[str, int]
+            the index of dimensions in the matrices given the dimensions' ids
+
+        Returns
+        -------
+        SpaceCodec
+            the codec of the column map
+        """
+        key = tuple(dim_column_map.items())
+        snapshot = tuple(_snapshot_dimension(d) for d in self.dimensions)
+        cached = self._codec_cache.get(key)
+        if cached is None or cached[0] != snapshot:
+            cached = (snapshot, SpaceCodec(self.dimensions, dim_column_map))
+            self._codec_cache[key] = cached
+        return cached[1]
+
+    def convert_flat_values_to_arguments(
+        self, input_sets: np.ndarray, dim_index_mapping: Dict[str, int]
+    ) -> List[Dict]:
+        """
+        Converts a matrix of decoded values to function arguments, one
+        dict per row. Gives the same arguments as calling
+        `convert_values_from_dict` on each dict created by
+        `convert_flat_values_to_dict`, but converts the matrix column-wise
+        (see `SpaceCodec.convert_to_arguments`).
+
+        Arguments
+        ---------
+        self : Space
+            Space
+        input_sets : np.ndarray
+            the decoded matrix with rows representing data-points
+        dim_index_mapping : Dict[str, int]
+            the index of dimensions in input_sets given the dimensions' ids
+
+        Returns
+        -------
+        List[Dict]
+            the arguments of each row
+        """
+        return self.create_codec(dim_index_mapping).convert_to_arguments(
+            input_sets
+        )
+
     def encode_to_zero_one_null_matrix(
         self,
         zero_one_encoded_values: np.ndarray,
@@ -568,66 +1020,9 @@ class Space:
             a 0-1 matrix with np.nan values
         """
 
-        adjusted_encoded_values = np.array(zero_one_encoded_values)
-        flatted_dimensions = create_all_iterable(self.children)
-
-        dim_path_map = {}
-        paths = create_path_iterable(self.children, True)
-        for path, dim in paths:
-            if dim.id in dim_column_map:
-                if dim.id not in dim_path_map:
-                    column_index = dim_column_map[dim.id]
-                    encoded_column = zero_one_encoded_values[:, column_index]
-                    dim_path_map[dim.id] = ([], np.array(dim.collapse_uniform(encoded_column, True)))
-                dim_path_map[dim.id][0].append(path)
-
-        for dim in flatted_dimensions:
-            if dim.id in dim_column_map:
-                column_index = dim_column_map[dim.id]
-                if dim.portion_null is not None and dim.portion_null > 0.0:
-                    encoded_column = zero_one_encoded_values[:, column_index]
-                    adjusted_encoded_column = np.array([
-                        (
-                            (xp - dim.portion_null) / (1.0 - dim.portion_null)
-                            if not np.isnan(xp) and xp > dim.portion_null
-                            else np.nan
-                        )
-                        for xp in encoded_column
-                    ])
-                    adjusted_encoded_values[:, column_index] = (
-                        adjusted_encoded_column
-                    )
-                paths, _ = dim_path_map[dim.id]
-                
-                ored_paths = []
-                for path in paths:
-                    if len(path) > 0:
-                        path_include_mask = np.array([True] * len(encoded_column))
-                        for path_component in path:
-                            parent_dim_id = path_component.dimension_id
-                            parent_decoded_column = dim_path_map[parent_dim_id][1]
-
-                            if path_component.variant_option_index is not None:
-                                # must address variant children
-                                path_include_mask = path_include_mask & (
-                                    parent_decoded_column == path_component.variant_option_index
-                                )
-                            else:
-                                # must address non-variant children
-                                path_include_mask = path_include_mask & (
-                                    np.isnan(parent_decoded_column) == False
-                                )
-                        ored_paths.append(path_include_mask)
-                
-                if len(ored_paths) > 0:
-                    total_nan_mask = (np.logical_or.reduce(ored_paths) == False)
-                    adjusted_encoded_column = adjusted_encoded_values[:, column_index]
-                    adjusted_encoded_column[total_nan_mask] = np.nan
-                    adjusted_encoded_values[:, column_index] = (
-                        adjusted_encoded_column
-                    )
-            
-        return adjusted_encoded_values
+        return self.create_codec(
+            dim_column_map
+        ).encode_to_zero_one_null_matrix(zero_one_encoded_values)
 
     def reverse_decoding_to_zero_one_null_matrix(
         self,
@@ -653,18 +1048,9 @@ class Space:
             a 0-1 matrix with np.nan values
         """
 
-        adjusted_encoded_values = np.array(decoded_values)
-        flatted_dimensions = create_all_iterable(self.children)
-        for dim in flatted_dimensions:
-            if dim.id in dim_column_map:
-                column_index = dim_column_map[dim.id]
-                decoded_column = decoded_values[:, column_index]
-                adjusted_encoded_column = dim.reverse_decoding(decoded_column)
-
-                adjusted_encoded_values[:, column_index] = (
-                    adjusted_encoded_column
-                )
-        return adjusted_encoded_values
+        return self.create_codec(
+            dim_column_map
+        ).reverse_decoding_to_zero_one_null_matrix(decoded_values)
 
     def decode_zero_one_matrix(
         self,
@@ -696,34 +1082,20 @@ class Space:
         np.array:
             matrix of decoded values with np.nan representing nulls
         """
-        if utilize_null_portions:
-            zero_one_null_values = self.encode_to_zero_one_null_matrix(
-                zero_one_encoded_values, dim_column_map
-            )
-        else:
-            zero_one_null_values = zero_one_encoded_values
-
-        decoded_values = np.array(zero_one_null_values)
-        flatted_dimensions = create_all_iterable(self.children)
-        for dim in flatted_dimensions:
-
-            if dim.id in dim_column_map:
-                column_index = dim_column_map[dim.id]
-                encoded_column = zero_one_null_values[:, column_index]
-                decoded_column = dim.collapse_uniform(
-                    encoded_column, utilize_null_portions=False
-                )
-
-                decoded_values[:, column_index] = decoded_column
-        return decoded_values
+        return self.create_codec(dim_column_map).decode_zero_one_matrix(
+            zero_one_encoded_values, utilize_null_portions
+        )
 
     def to_json_dict(self):
         def asdict_with_type(obj):
             if dataclasses.is_dataclass(obj):
                 result = {"__type__": type(obj).__name__}
-                for field in dataclasses.fields(obj):
-                    value = getattr(obj, field.name)
-                    result[field.name] = asdict_with_type(value)
+                for obj_field in dataclasses.fields(obj):
+                    # skips internal state, such as cached codecs
+                    if not obj_field.init:
+                        continue
+                    value = getattr(obj, obj_field.name)
+                    result[obj_field.name] = asdict_with_type(value)
                 return result
             elif isinstance(obj, list):
                 return [asdict_with_type(i) for i in obj]
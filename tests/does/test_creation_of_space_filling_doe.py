@@ -278,6 +278,32 @@ def test_creation_of_space_filling_by_subspaces_with_value_pool():
     assert np.allclose(design1.input_sets, design2.input_sets, equal_nan=True)
 
 
+def test_creation_of_space_filling_by_subspaces_with_value_pool_in_parallel():
+    """
+    Tests that optimizing the sub-spaces of a design in a pool of
+    processes creates the same design as optimizing them serially.
+
+    Asserts
+    -------
+    Designs created with 1 and 2 jobs are the same
+
+    """
+    design1 = doe.generate_seperate_designs_by_full_subspace_and_pool(
+        SPACE, 100, rng=np.random.default_rng(seed=42)
+    )
+    design2 = doe.generate_seperate_designs_by_full_subspace_and_pool(
+        SPACE, 100, rng=np.random.default_rng(seed=42), n_jobs=2
+    )
+
+    assert design1.input_set_map == design2.input_set_map
+    assert np.array_equal(
+        design1.input_sets, design2.input_sets, equal_nan=True
+    )
+    assert_every_point_in_a_full_sub_space(
+        sub_spaces_list=SUB_SPACES, design=design2
+    )
+
+
 def test_creation_of_space_filling_by_subspaces_null_fill():
     """
     TODO Explain the Function
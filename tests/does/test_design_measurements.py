@@ -1,6 +1,10 @@
 """ TODO Explain Module"""
 
+import itertools
+
 import numpy as np
+import pytest
+from scipy.spatial.distance import pdist, squareform
 from scipy.stats.qmc import discrepancy
 
 import raxpy.does.measure as a
@@ -51,6 +55,69 @@ def test_doe_assessments():
     assert assessment is not None
 
 
+def test_concurrent_measurement_session():
+    """
+    Tests measuring a design with a session computing the metrics in a
+    pool of threads or processes.
+
+    Asserts
+    -------
+        the measurements equal the measurements computed sequentially
+        and failing sub-space metrics are skipped
+    """
+    space = s.InputSpace(
+        dimensions=[
+            s.Float(id="x1", lb=0.0, ub=1.0, nullable=True, portion_null=0.1),
+            s.Float(id="x2", lb=0.0, ub=1.0, nullable=True, portion_null=0.1),
+        ]
+    )
+    rng = np.random.default_rng(3)
+    input_sets = rng.random((40, 2))
+    input_sets[rng.random(input_sets.shape) < 0.2] = np.nan
+
+    def create_design():
+        return doe.DesignOfExperiment(
+            input_space=space,
+            input_set_map={"x1": 0, "x2": 1},
+            input_sets=input_sets,
+            encoding=doe.EncodingEnum.ZERO_ONE_NULL_ENCODING,
+        )
+
+    def fail(_):
+        raise ValueError("failed")
+
+    sub_space_metric_map = dict(a.subspace_metric_computation_map)
+    sub_space_metric_map["fail"] = fail
+
+    sequential = a.MeasurementSession(create_design()).measure(
+        sub_space_metric_map
+    )
+    concurrent = a.MeasurementSession(create_design(), n_jobs=3).measure(
+        sub_space_metric_map
+    )
+
+    assert concurrent.measurements == sequential.measurements
+    assert len(concurrent.full_sub_design_measurements) == 4
+    for c, m in zip(
+        concurrent.full_sub_design_measurements,
+        sequential.full_sub_design_measurements,
+    ):
+        assert c.active_dimensions == m.active_dimensions
+        assert c.measurements == m.measurements
+        assert "fail" not in c.measurements
+
+    processes = a.MeasurementSession(
+        create_design(), n_jobs=2, use_processes=True
+    ).measure()
+    expected = a.MeasurementSession(create_design()).measure()
+    assert processes.measurements == expected.measurements
+    for c, m in zip(
+        processes.full_sub_design_measurements,
+        expected.full_sub_design_measurements,
+    ):
+        assert c.measurements == m.measurements
+
+
 def test_metric_computations():
     """
     Tests a many of the DOE metric computations.
@@ -142,6 +209,59 @@ def test_metric_computations():
     assert mst_std > 0.0
 
 
+def test_average_reciprocal_distance_projection():
+    """
+    Tests the exact and estimated average reciprocal distance projection
+    metric computations.
+
+    Asserts
+    -------
+        the exact metric equals the metric computed projection by
+        projection and the estimate is within a few standard errors
+    """
+    rng = np.random.default_rng(11)
+    input_sets = rng.random((12, 6))
+    design = doe.DesignOfExperiment(
+        input_space=s.InputSpace(dimensions=[]),
+        input_sets=input_sets,
+        input_set_map={f"x{k}": k for k in range(6)},
+        encoding=doe.EncodingEnum.NONE,
+    )
+    context = a.SubSpaceMetricComputeContext(design, design)
+
+    # the sums of the original implementation
+    running_sum = 0.0
+    comb_count = 0
+    for j in range(1, 7):
+        for columns in itertools.combinations(range(6), j):
+            dm = squareform(
+                pdist(input_sets[:, columns], "minkowski", p=3)
+            )
+            np.fill_diagonal(dm, 1)
+            running_sum += np.sum(np.tril((j ** (1.0 / 3) / dm) ** 2, k=1))
+            comb_count += 1
+    expected_ard = (running_sum / (66 * comb_count)) ** 0.5
+
+    ard = a.compute_average_reciprocal_distance_projection(context, 2, 3)
+    assert ard == pytest.approx(expected_ard)
+
+    estimated_ard, standard_error = (
+        a.estimate_average_reciprocal_distance_projection(
+            context, 2, 3, subset_count=100, rng=rng
+        )
+    )
+    assert estimated_ard == pytest.approx(expected_ard)
+    assert standard_error == 0.0
+
+    estimated_ard, standard_error = (
+        a.estimate_average_reciprocal_distance_projection(
+            context, 2, 3, subset_count=30, rng=rng
+        )
+    )
+    assert standard_error > 0.0
+    assert abs(estimated_ard - expected_ard) < 4 * standard_error
+
+
 def test_whole_min_distance_computation():
     """
     Tests the min distance computation for a DOE with nan values.
@@ -173,6 +293,53 @@ def test_whole_min_distance_computation():
     assert min_d == ((4.0 - 1.0) ** 2 + (1)) ** 0.5
 
 
+def test_whole_min_distance_computation_in_tiles(monkeypatch):
+    """
+    Tests the min distance computation of a design with nan values
+    computed over multiple tiles with a non-Euclidean norm.
+
+    Asserts
+    -------
+        the computed min distance is equal to the min of the pairwise
+        distances of the rows
+    """
+    monkeypatch.setattr(a, "NAN_DISTANCE_TILE_SIZE", 10)
+    space = s.InputSpace(
+        dimensions=[
+            s.Float(id="x1", lb=0.0, ub=1.0, nullable=True, portion_null=0.1),
+            s.Float(id="x2", lb=0.0, ub=1.0, nullable=True, portion_null=0.1),
+        ]
+    )
+    input_sets = np.array(
+        [
+            [0.1, 0.5],
+            [0.9, np.nan],
+            [np.nan, np.nan],
+            [0.4, 0.8],
+            [0.8, 0.2],
+            [0.2, 0.1],
+        ]
+    )
+    whole_doe = doe.DesignOfExperiment(
+        input_space=space,
+        input_set_map={"x1": 0, "x2": 1},
+        input_sets=input_sets,
+        encoding=doe.EncodingEnum.NONE,
+    )
+
+    dm = a._compute_nan_distance_matrix(input_sets, p=1)
+    assert dm[0, 1] == pytest.approx(0.8 + 1.0)
+    assert dm[1, 2] == pytest.approx(1.0)
+    assert dm[4, 5] == pytest.approx(0.6 + 0.1)
+    assert np.all(np.diag(dm) == 0.0)
+    assert np.all(dm == dm.T)
+
+    min_d = a.compute_min_interpoint_dist(
+        whole_doe, [], doe.EncodingEnum.NONE, p=1
+    )
+    assert min_d == pytest.approx(0.1 + 0.4)
+
+
 def test_compute_min_projected_distance():
     """
     Tests the min projected distance computation for a DOE with nan values.
@@ -312,6 +479,42 @@ def test_compute_star_discrepancy():
     assert star_discrep > 0.0
 
 
+@pytest.mark.parametrize("comparison_size", [2**18, 0])
+def test_count_points_in_projection_regions(monkeypatch, comparison_size):
+    """
+    Tests the counts of points in the projection regions used to
+    compute the star discrepancy, with tied and null values, counted
+    with direct comparisons and with the Fenwick tree sweep.
+
+    Asserts
+    -------
+        the counts equal the counts of a pairwise comparison of points
+    """
+    monkeypatch.setattr(a, "DOMINANCE_COMPARISON_SIZE", comparison_size)
+    rng = np.random.default_rng(7)
+    x = np.round(rng.random((60, 2)) * 4) / 4
+    x[rng.random(x.shape) < 0.3] = np.nan
+    relevant_points = rng.random(60) < 0.8
+    query_points = np.arange(0, 60, 3)
+
+    for col_indexes in ([0], [1], [0, 1]):
+        counts = a._count_points_in_projection_regions(
+            x, relevant_points, col_indexes, query_points
+        )
+        for count, i in zip(counts, query_points):
+            expected_count = 0
+            for j in np.flatnonzero(relevant_points):
+                expected_count += all(
+                    (
+                        np.isnan(x[j, k])
+                        if np.isnan(x[i, k])
+                        else np.isnan(x[j, k]) or x[j, k] <= x[i, k]
+                    )
+                    for k in col_indexes
+                )
+            assert count == expected_count
+
+
 def test_compute_max_pro():
     space = s.InputSpace(
         dimensions=[
@@ -414,3 +617,84 @@ def test_compute_average_dim_distance():
     expected_average = (0.3 + 0.8 + 0.0 + 0.1) / 4
 
     assert actual_average == expected_average
+
+
+def test_min_column_gaps_with_nulls():
+    """
+    Tests the minimum distance between the non-null values of columns.
+
+    Asserts
+    -------
+        null values are ignored and columns with one or less non-null
+        values are skipped
+    """
+    points = np.array(
+        [
+            [0.5, np.nan, np.nan, 0.1],
+            [0.1, 0.3, np.nan, np.nan],
+            [np.nan, np.nan, np.nan, 0.7],
+            [0.45, np.nan, np.nan, 0.2],
+        ]
+    )
+    gaps = a._compute_min_column_gaps(points)
+    assert gaps[0] == pytest.approx(0.05)
+    assert gaps[1] == np.inf
+    assert gaps[2] == np.inf
+    assert gaps[3] == pytest.approx(0.1)
+
+    design = doe.DesignOfExperiment(
+        input_space=s.InputSpace(dimensions=[]),
+        input_sets=points,
+        input_set_map={"x1": 0, "x2": 1, "x3": 2, "x4": 3},
+        encoding=doe.EncodingEnum.NONE,
+    )
+    assert a.compute_average_dim_dist(design) == pytest.approx(0.075)
+
+
+def test_allocate_points_and_lookup_sub_design_measurements():
+    """
+    Tests allocating the points of a design to full-sub-spaces and
+    looking up the measurements of a full-sub-design.
+
+    Asserts
+    -------
+        points are allocated to the sub-space of their non-null
+        dimensions and lookups ignore the order of the dimensions
+    """
+    space = s.InputSpace(
+        dimensions=[
+            s.Float(id="x1", lb=0.0, ub=1.0, nullable=True, portion_null=0.1),
+            s.Float(id="x2", lb=0.0, ub=1.0, nullable=True, portion_null=0.1),
+        ]
+    )
+    design = doe.DesignOfExperiment(
+        input_space=space,
+        input_set_map={"x2": 0, "x1": 1},
+        input_sets=np.array(
+            [
+                [0.1, np.nan],
+                [0.2, 0.3],
+                [np.nan, np.nan],
+                [0.4, 0.5],
+            ]
+        ),
+        encoding=doe.EncodingEnum.NONE,
+    )
+
+    sub_spaces, mapped_values = a.allocate_points_to_full_subspaces(design)
+    assert [sub_spaces[i] for i in mapped_values] == [
+        ["x2"],
+        ["x1", "x2"],
+        [],
+        ["x1", "x2"],
+    ]
+
+    assessment = a.measure_with_all_metrics(
+        design, encoding=doe.EncodingEnum.NONE
+    )
+    measurement_set = assessment.get_full_sub_design_measurements(
+        ["x2", "x1"]
+    )
+    assert measurement_set is not None
+    assert measurement_set.point_count == 2
+    assert assessment.get_full_sub_design_measurements(["x3"]) is None
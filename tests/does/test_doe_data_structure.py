@@ -1,5 +1,7 @@
 """ TODO Explain Module """
 
+import pickle
+
 import numpy as np
 import pytest
 
@@ -90,3 +92,90 @@ def test_error_init_doe():
             },
             encoding=doe.EncodingEnum.NONE,
         )
+
+
+def test_condensed_distance_cache(monkeypatch):
+    """
+    Tests the cache of condensed distance matrices of a design.
+
+    Asserts
+    -------
+        the distances match the distances of the selected rows and
+        columns, the least recently used matrices are evicted and the
+        cache is cleared when the input sets are assigned
+    """
+    monkeypatch.setattr(doe, "DISTANCE_CACHE_SIZE", 2)
+    design = doe.DesignOfExperiment(
+        input_space=InputSpace(dimensions=[]),
+        input_sets=np.array(
+            [
+                [0.0, 0.0, 0.0],
+                [3.0, 4.0, 1.0],
+                [1.0, 1.0, 2.0],
+            ]
+        ),
+        input_set_map={"x1": 0, "x2": 1, "x3": 2},
+        encoding=doe.EncodingEnum.NONE,
+    )
+
+    distances = design.get_condensed_distances(columns=[0, 1])
+    assert np.allclose(distances, [5.0, np.sqrt(2.0), np.sqrt(13.0)])
+    assert design.get_condensed_distances(columns=[0, 1]) is distances
+
+    assert np.allclose(
+        design.get_condensed_distances(rows=[0, 1], columns=[0, 1], p=1),
+        [7.0],
+    )
+    assert np.allclose(
+        design.get_condensed_distances(p=np.inf), [4.0, 2.0, 3.0]
+    )
+    # the first matrix was the least recently used
+    assert design.get_condensed_distances(columns=[0, 1]) is not distances
+
+    # assigning the input sets clears the cache
+    design.input_sets = design.input_sets[:2]
+    assert np.allclose(design.get_condensed_distances(columns=[0, 1]), [5.0])
+
+    design_copy = pickle.loads(pickle.dumps(design))
+    assert np.allclose(
+        design_copy.get_condensed_distances(columns=[0, 1]), [5.0]
+    )
+
+
+def test_extract_grouped_points_and_dimensions():
+    """
+    Tests extracting the sub-designs of groups of points at once.
+
+    Asserts
+    -------
+        the sub-designs equal the sub-designs extracted with row masks
+        and contiguous columns are views of the grouped points
+    """
+    design = doe.DesignOfExperiment(
+        input_space=InputSpace(dimensions=[]),
+        input_sets=np.arange(24, dtype=float).reshape(8, 3),
+        input_set_map={"x1": 0, "x2": 1, "x3": 2},
+        encoding=doe.EncodingEnum.NONE,
+    )
+    point_groups = np.array([2, 0, 2, 1, 0, 2, 0, 0])
+    dim_sets = [["x1", "x2"], ["x3", "x1"], ["x2", "x3"], []]
+
+    sub_designs = design.extract_grouped_points_and_dimensions(
+        point_groups, dim_sets, doe.EncodingEnum.NONE
+    )
+
+    assert len(sub_designs) == 4
+    for i, (sub_design, dim_set) in enumerate(zip(sub_designs, dim_sets)):
+        expected_design = design.extract_points_and_dimensions(
+            point_groups == i, dim_set, doe.EncodingEnum.NONE
+        )
+        assert np.array_equal(
+            sub_design.input_sets, expected_design.input_sets
+        )
+        assert sub_design.input_set_map == expected_design.input_set_map
+
+    assert sub_designs[3].point_count == 0
+    # both are views of the grouped points
+    grouped_points = sub_designs[0].input_sets.base
+    assert grouped_points is not None
+    assert sub_designs[2].input_sets.base is grouped_points
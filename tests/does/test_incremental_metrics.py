@@ -0,0 +1,222 @@
+"""
+Tests the incremental design measurements.
+"""
+
+import numpy as np
+import pytest
+from scipy.spatial.distance import pdist
+from scipy.stats.qmc import discrepancy
+
+import raxpy.spaces as s
+import raxpy.does.doe as doe
+import raxpy.does.measure as measure
+from raxpy.does import incremental, lhs, maxpro
+from raxpy.does.scipy_optimizations import random_cd
+from raxpy.spaces.complexity import assign_null_portions
+
+
+def test_incremental_metrics_track_swaps():
+    """
+    Tests tracking metrics of a design with null values while values
+    are swapped within columns.
+
+    Asserts
+    -------
+        the tracked metrics equal the metrics measured from scratch
+    """
+    space = s.InputSpace(
+        dimensions=[
+            s.Float(id="x1", lb=0.0, ub=1.0, nullable=True, portion_null=0.2),
+            s.Float(id="x2", lb=0.0, ub=1.0, portion_null=0.0),
+            s.Composite(
+                id="c1",
+                nullable=True,
+                portion_null=0.3,
+                children=[
+                    s.Float(id="x3", lb=0.0, ub=1.0, portion_null=0.0),
+                ],
+            ),
+        ]
+    )
+    input_set_map = {"x1": 0, "x2": 1, "c1": 2, "x3": 3}
+    rng = np.random.default_rng(5)
+    x = space.encode_to_zero_one_null_matrix(
+        rng.random((25, 4)), input_set_map
+    )
+
+    def create_design(input_sets):
+        return doe.DesignOfExperiment(
+            input_space=space,
+            input_set_map=input_set_map,
+            input_sets=np.copy(input_sets),
+            encoding=doe.EncodingEnum.ZERO_ONE_NULL_ENCODING,
+        )
+
+    metrics = [
+        incremental.IncrementalMaxPro(),
+        incremental.IncrementalMinInterpointDistance(),
+        incremental.IncrementalMinProjectedDistance(),
+    ]
+    for metric in metrics:
+        metric.init(create_design(x))
+
+    for _ in range(100):
+        k = rng.choice([0, 1, 3])
+        i, j = rng.choice(np.flatnonzero(~np.isnan(x[:, k])), 2, False)
+        x[i, k], x[j, k] = x[j, k], x[i, k]
+        for metric in metrics:
+            metric.on_swap(i, j, k)
+
+    design = create_design(x)
+    assert metrics[0].value() == pytest.approx(measure.compute_max_pro(design))
+    assert metrics[1].value() == pytest.approx(
+        measure.compute_min_interpoint_dist(design)
+    )
+    assert metrics[2].value() == pytest.approx(
+        measure.compute_min_projected_distance(
+            design, [], doe.EncodingEnum.ZERO_ONE_NULL_ENCODING
+        )
+    )
+
+
+def test_incremental_centered_discrepancy():
+    """
+    Tests tracking the centered discrepancy of a design while values
+    are swapped within columns.
+
+    Asserts
+    -------
+        the tracked discrepancy equals the discrepancy measured from
+        scratch and designs with null values are rejected
+    """
+    rng = np.random.default_rng(6)
+    x = rng.random((20, 3))
+    design = doe.DesignOfExperiment(
+        input_space=s.InputSpace(dimensions=[]),
+        input_sets=np.copy(x),
+        input_set_map={"x1": 0, "x2": 1, "x3": 2},
+        encoding=doe.EncodingEnum.NONE,
+    )
+
+    metric = incremental.IncrementalCenteredDiscrepancy()
+    metric.init(design)
+    for _ in range(100):
+        k = rng.integers(3)
+        i, j = rng.choice(20, 2, False)
+        x[i, k], x[j, k] = x[j, k], x[i, k]
+        metric.on_swap(i, j, k)
+
+    assert metric.value() == pytest.approx(discrepancy(x, method="CD"))
+
+    design.input_sets[0, 0] = np.nan
+    with pytest.raises(ValueError):
+        metric.init(design)
+
+
+def test_incremental_max_pro_matches_compute_max_pro():
+    """
+    Tests tracking the MaxPro measurement of a design with null values
+    that is not encoded with the zero-one-null encoding.
+
+    Asserts
+    -------
+        the tracked MaxPro measurement equals compute_max_pro and the
+        base metric class is abstract
+    """
+    space = s.InputSpace(
+        dimensions=[
+            s.Float(id="x1", lb=2.0, ub=10.0, nullable=True),
+            s.Int(id="x2", lb=0, ub=4),
+            s.Composite(
+                id="c1",
+                nullable=True,
+                children=[s.Float(id="x3", lb=-5.0, ub=5.0)],
+            ),
+        ]
+    )
+    assign_null_portions(s.create_level_iterable(space.children))
+    design = lhs.generate_seperate_designs_by_full_subspace_and_pool(
+        space, 30, rng=np.random.default_rng(3)
+    )
+    assert design.encoding == doe.EncodingEnum.NONE
+    assert np.any(np.isnan(design.input_sets))
+
+    metric = incremental.IncrementalMaxPro()
+    metric.init(design)
+    assert metric.value() == pytest.approx(measure.compute_max_pro(design))
+
+    with pytest.raises(TypeError):
+        incremental.IncrementalMetric()
+
+
+def test_optimize_design_with_sa_tracks_metrics():
+    """
+    Tests tracking metrics while optimizing a design with simulated
+    annealing.
+
+    Asserts
+    -------
+        the tracked metrics measure the optimized design
+    """
+    space = s.InputSpace(
+        dimensions=[
+            s.Float(id="x1", lb=0.0, ub=1.0, nullable=True),
+            s.Float(id="x2", lb=0.0, ub=1.0),
+            s.Float(id="x3", lb=0.0, ub=1.0),
+        ]
+    )
+    assign_null_portions(s.create_level_iterable(space.children))
+    design = lhs.generate_seperate_designs_by_full_subspace_and_pool(
+        space, 20, rng=np.random.default_rng(4)
+    )
+
+    metrics = [
+        incremental.IncrementalMaxPro(),
+        incremental.IncrementalMinInterpointDistance(
+            doe.EncodingEnum.ZERO_ONE_NULL_ENCODING
+        ),
+    ]
+    opt_design = maxpro.optimize_design_with_sa(
+        design,
+        encoding=doe.EncodingEnum.ZERO_ONE_NULL_ENCODING,
+        maxiter=500,
+        rng=np.random.default_rng(5),
+        tracked_metrics=metrics,
+    )
+    assert metrics[0].value() != pytest.approx(measure.compute_max_pro(design))
+    assert metrics[0].value() == pytest.approx(
+        measure.compute_max_pro(opt_design)
+    )
+    assert metrics[1].value() == pytest.approx(
+        measure.compute_min_interpoint_dist(opt_design)
+    )
+
+
+def test_random_cd_tracks_metrics():
+    """
+    Tests tracking metrics while optimizing a sample's centered
+    discrepancy.
+
+    Asserts
+    -------
+        the tracked metrics measure the optimized sample
+    """
+    sample = np.random.default_rng(8).random((20, 3))
+    initial_discrepancy = discrepancy(sample, method="CD")
+
+    metrics = [
+        incremental.IncrementalCenteredDiscrepancy(),
+        incremental.IncrementalMinInterpointDistance(),
+    ]
+    opt_sample = random_cd(
+        sample,
+        2000,
+        100,
+        rng=np.random.default_rng(9),
+        tracked_metrics=metrics,
+    )
+    assert metrics[0].value() < initial_discrepancy
+    assert metrics[0].value() == pytest.approx(
+        discrepancy(opt_sample, method="CD")
+    )
+    assert metrics[1].value() == pytest.approx(np.min(pdist(opt_sample)))
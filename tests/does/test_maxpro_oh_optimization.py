@@ -6,7 +6,12 @@ import numpy as np
 
 import raxpy.spaces as s
 from raxpy.does import doe
-from raxpy.does.maxpro import optimize_design_with_sa
+from raxpy.does.maxpro import (
+    optimize_design_with_sa,
+    optimize_design_with_multi_chain_sa,
+    MaxProPairMatrix,
+    _derive_max_pro_column_factors,
+)
 
 
 def test_maxpro_oh_optimization():
@@ -82,3 +87,181 @@ def test_maxpro_oh_optimization():
     opt_design = optimize_design_with_sa(design, design.encoding, maxiter=10)
 
     assert np.any(design.input_sets != opt_design.input_sets)
+
+
+def _brute_force_max_pro_sum(x, level_factors, null_aware):
+    n, d = x.shape
+    total = 0.0
+    for i in range(n - 1):
+        for j in range(i + 1, n):
+            m = 1.0
+            for k in range(d):
+                v1, v2 = x[i, k], x[j, k]
+                if not null_aware[k]:
+                    m *= (v1 - v2) ** 2
+                elif np.isnan(v1) and np.isnan(v2):
+                    m *= level_factors[k] ** 2
+                elif np.isnan(v1) or np.isnan(v2):
+                    m *= (1.0 + level_factors[k]) ** 2
+                else:
+                    m *= (abs(v1 - v2) + level_factors[k]) ** 2
+            total += 1.0 / m
+    return total
+
+
+def test_max_pro_pair_matrix_swap_updates():
+    """
+    Tests that the running MaxPro objective of the pair matrix
+    matches a full recomputation after swaps
+
+    Asserts
+    -------
+        the objective matches the brute force computation
+    """
+    rng = np.random.default_rng(42)
+    x = rng.random((12, 4))
+    x[rng.random((12, 4)) < 0.3] = np.nan
+    x[:, 0] = np.linspace(0.0, 1.0, 12)
+    level_factors = np.array([0.0, 0.25, 0.5, 1.0 / 3.0])
+    null_aware = np.array([False, True, True, True])
+
+    pair_matrix = MaxProPairMatrix(np.copy(x), level_factors, null_aware)
+
+    assert np.isclose(
+        pair_matrix.value,
+        _brute_force_max_pro_sum(x, level_factors, null_aware),
+    )
+
+    for k in [0, 2, 0, 3, 1]:
+        # swaps only exchange non-null values
+        i, j = rng.choice(np.flatnonzero(~np.isnan(x[:, k])), 2, False)
+        pair_matrix.swap(i, j, k)
+        x[i, k], x[j, k] = x[j, k], x[i, k]
+
+        assert np.isclose(
+            pair_matrix.value,
+            _brute_force_max_pro_sum(x, level_factors, null_aware),
+        )
+
+
+def test_max_pro_pair_matrix_with_coincident_values():
+    """
+    Tests that points sharing a value in a column without a
+    level factor do not create numerical warnings or a non-finite
+    objective
+
+    Asserts
+    -------
+        the objective is finite before and after a swap
+    """
+    x = np.array(
+        [
+            [0.0, 0.1],
+            [0.5, 0.1],
+            [0.5, np.nan],
+            [1.0, 0.7],
+        ]
+    )
+    level_factors = np.array([0.0, 0.5])
+    null_aware = np.array([False, True])
+
+    with np.errstate(all="raise"):
+        pair_matrix = MaxProPairMatrix(x, level_factors, null_aware)
+        assert np.isfinite(pair_matrix.value)
+
+        pair_matrix.swap(0, 1, 0)
+        assert np.isfinite(pair_matrix.value)
+
+
+def test_max_pro_pair_matrix_rollback():
+    """
+    Tests that rolling back swaps restores the design, the cached
+    log products and the objective of the last commit
+
+    Asserts
+    -------
+        the state after the rollback matches the committed state
+    """
+    rng = np.random.default_rng(7)
+    x = rng.random((10, 3))
+    level_factors = np.array([0.0, 0.5, 0.5])
+    null_aware = np.array([False, True, True])
+
+    pair_matrix = MaxProPairMatrix(x, level_factors, null_aware)
+    pair_matrix.swap(0, 1, 0)
+    pair_matrix.commit()
+
+    committed_x = np.copy(pair_matrix.x)
+    committed_log_products = np.copy(pair_matrix.log_products)
+    committed_value = pair_matrix.value
+
+    pair_matrix.swap(2, 3, 1)
+    pair_matrix.swap(3, 9, 2)
+    pair_matrix.swap(2, 9, 1)
+    pair_matrix.rollback()
+
+    assert np.array_equal(pair_matrix.x, committed_x)
+    assert np.array_equal(pair_matrix.log_products, committed_log_products)
+    assert pair_matrix.value == committed_value
+
+
+def _create_random_design(n: int, seed: int):
+    space = s.InputSpace(
+        dimensions=[
+            s.Float(id="x1", lb=0.0, ub=1.0),
+            s.Float(id="x2", lb=0.0, ub=1.0, nullable=True, portion_null=0.2),
+            s.Float(id="x3", lb=0.0, ub=1.0),
+        ]
+    )
+    rng = np.random.default_rng(seed)
+    input_sets = rng.random((n, 3))
+    input_sets[rng.random(n) < 0.2, 1] = np.nan
+
+    return doe.DesignOfExperiment(
+        input_space=space,
+        input_set_map={"x1": 0, "x2": 1, "x3": 2},
+        input_sets=input_sets,
+        encoding=doe.EncodingEnum.ZERO_ONE_NULL_ENCODING,
+    )
+
+
+def _compute_value(design):
+    return MaxProPairMatrix(
+        np.copy(design.input_sets), *_derive_max_pro_column_factors(design)
+    ).value
+
+
+def test_multi_chain_optimization():
+    """
+    Tests that multiple annealing chains, with and without parallel
+    tempering, are reproducible regardless of the number of processes
+
+    Asserts
+    -------
+        the designs are the same when run in 1 or 2 processes,
+        the design improves on the base design and
+        the null values of the base design are retained
+    """
+    design = _create_random_design(20, 3)
+
+    for parallel_tempering in (False, True):
+        designs = [
+            optimize_design_with_multi_chain_sa(
+                design,
+                maxiter=400,
+                n_chains=3,
+                n_jobs=n_jobs,
+                parallel_tempering=parallel_tempering,
+                exchange_interval=100,
+                rng=np.random.default_rng(5),
+            )
+            for n_jobs in (1, 2)
+        ]
+
+        assert np.array_equal(
+            designs[0].input_sets, designs[1].input_sets, equal_nan=True
+        )
+        assert _compute_value(designs[0]) < _compute_value(design)
+        assert np.array_equal(
+            np.isnan(designs[0].input_sets), np.isnan(design.input_sets)
+        )
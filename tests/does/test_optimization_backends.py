@@ -0,0 +1,191 @@
+"""
+Tests the compiled backend of the design optimizers.
+"""
+
+import multiprocessing
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import numpy as np
+
+import raxpy.spaces as s
+from raxpy.does import doe, kernels, maxpro
+from raxpy.does.maxpro import optimize_design_with_sa
+from raxpy.does.scipy_optimizations import random_cd
+
+
+def _create_design():
+    space = s.InputSpace(
+        dimensions=[
+            s.Float(id="x1", lb=0.0, ub=1.0),
+            s.Float(id="x2", lb=0.0, ub=1.0, nullable=True, portion_null=0.2),
+            s.Int(id="x3", lb=0, ub=4),
+        ]
+    )
+    rng = np.random.default_rng(11)
+    input_sets = rng.random((40, 3))
+    input_sets[rng.random(40) < 0.2, 1] = np.nan
+
+    return doe.DesignOfExperiment(
+        input_space=space,
+        input_set_map={"x1": 0, "x2": 1, "x3": 2},
+        input_sets=input_sets,
+        encoding=doe.EncodingEnum.ZERO_ONE_NULL_ENCODING,
+    )
+
+
+def test_unsupported_backend():
+    """
+    Tests that an unknown backend is rejected
+
+    Asserts
+    -------
+        a ValueError is raised
+    """
+    with pytest.raises(ValueError):
+        kernels.resolve_backend("fortran")
+
+
+def test_numba_backend_fallback(monkeypatch):
+    """
+    Tests that the optimizers fall back to the numpy backend
+    when numba is not installed
+
+    Asserts
+    -------
+        the numba backend request gives the numpy backend results
+    """
+    monkeypatch.setattr(kernels, "_compiled", False)
+    # importing numba raises an ImportError
+    monkeypatch.setitem(sys.modules, "numba", None)
+
+    with pytest.warns(UserWarning, match="numba is not installed"):
+        assert kernels.resolve_backend("numba") == kernels.NUMPY_BACKEND
+
+    design = _create_design()
+    numpy_design = optimize_design_with_sa(
+        design, maxiter=200, rng=np.random.default_rng(1), backend="numpy"
+    )
+    with pytest.warns(UserWarning):
+        fallback_design = optimize_design_with_sa(
+            design, maxiter=200, rng=np.random.default_rng(1), backend="numba"
+        )
+
+    assert np.array_equal(
+        numpy_design.input_sets, fallback_design.input_sets, equal_nan=True
+    )
+
+
+def test_backends_give_same_results():
+    """
+    Tests that the numpy and numba backends create the same
+    designs given the same seed
+
+    Asserts
+    -------
+        the optimized designs of the backends are equal
+    """
+    pytest.importorskip("numba")
+
+    design = _create_design()
+    numpy_design = optimize_design_with_sa(
+        design, maxiter=500, rng=np.random.default_rng(3), backend="numpy"
+    )
+    numba_design = optimize_design_with_sa(
+        design, maxiter=500, rng=np.random.default_rng(3), backend="numba"
+    )
+
+    assert np.array_equal(
+        numpy_design.input_sets, numba_design.input_sets, equal_nan=True
+    )
+
+    sample = np.random.default_rng(5).random((30, 4))
+    numpy_sample = random_cd(
+        np.copy(sample), 2000, 100, rng=np.random.default_rng(7)
+    )
+    numba_sample = random_cd(
+        np.copy(sample),
+        2000,
+        100,
+        rng=np.random.default_rng(7),
+        backend="numba",
+    )
+
+    assert np.array_equal(numpy_sample, numba_sample)
+
+
+def test_numba_is_imported_lazily():
+    """
+    Tests that importing raxpy does not import numba
+
+    Asserts
+    -------
+        numba is not imported until the numba backend is requested
+    """
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, raxpy.does.measure; "
+            "assert 'numba' not in sys.modules",
+        ],
+        check=True,
+    )
+
+
+# evaluated in a worker process to check the kernels were compiled
+_CHECK_COMPILED = "__import__('raxpy.does.kernels', fromlist=['_'])._compiled"
+
+
+class _SpawnedExecutor(ProcessPoolExecutor):
+    """
+    Runs the chains in one process started with spawn, checking the
+    kernels were compiled in the process before shutting it down.
+    """
+
+    compiled = None
+
+    def __init__(self, max_workers):
+        super().__init__(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def shutdown(self, *args, **kwargs):
+        _SpawnedExecutor.compiled = self.submit(eval, _CHECK_COMPILED).result()
+        super().shutdown(*args, **kwargs)
+
+
+def test_numba_backend_in_spawned_processes(monkeypatch):
+    """
+    Tests running chains with the numba backend in processes started
+    with spawn
+
+    Asserts
+    -------
+        the processes run the compiled kernels and the chains give the
+        results of chains run in the calling process
+    """
+    pytest.importorskip("numba")
+    monkeypatch.setattr(maxpro, "ProcessPoolExecutor", _SpawnedExecutor)
+
+    design = _create_design()
+    designs = [
+        maxpro.optimize_design_with_multi_chain_sa(
+            design,
+            maxiter=500,
+            n_chains=2,
+            n_jobs=n_jobs,
+            parallel_tempering=True,
+            exchange_interval=100,
+            rng=np.random.default_rng(3),
+            backend="numba",
+        )
+        for n_jobs in [1, 2]
+    ]
+
+    assert _SpawnedExecutor.compiled is True
+    assert np.array_equal(
+        designs[0].input_sets, designs[1].input_sets, equal_nan=True
+    )
@@ -0,0 +1,49 @@
+"""
+Tests the discrepancy optimization adapted from scipy
+"""
+
+import numpy as np
+from scipy.stats.qmc import discrepancy
+
+from raxpy.does.scipy_optimizations import CenteredDiscrepancyCache, random_cd
+
+
+def test_centered_discrepancy_cache():
+    """
+    Tests that perturbations evaluated with the cached terms
+    match recomputing the centered discrepancy
+
+    Asserts
+    -------
+        the perturbed discrepancy matches scipy's discrepancy
+        after each swap
+    """
+    rng = np.random.default_rng(3)
+    sample = rng.random((25, 4))
+    disc = discrepancy(sample)
+
+    cache = CenteredDiscrepancyCache(sample)
+    for i1, i2, k in [(0, 1, 0), (3, 24, 2), (0, 3, 3), (24, 1, 0)]:
+        disc = cache.perturb_discrepancy(i1, i2, k, disc)
+        cache.swap(i1, i2, k)
+
+        assert np.isclose(disc, discrepancy(sample), rtol=1e-10)
+        assert np.allclose(cache.z, sample - 0.5)
+
+
+def test_random_cd_improves_discrepancy():
+    """
+    Tests that random_cd lowers the centered discrepancy
+    by permuting values within columns
+
+    Asserts
+    -------
+        the discrepancy is lowered and columns keep their values
+    """
+    sample = np.random.default_rng(8).random((30, 3))
+    opt_sample = random_cd(
+        np.copy(sample), 2000, 100, rng=np.random.default_rng(1)
+    )
+
+    assert discrepancy(opt_sample) < discrepancy(sample)
+    assert np.array_equal(np.sort(opt_sample, axis=0), np.sort(sample, axis=0))
@@ -2,6 +2,8 @@
 Unit tests for encoding and decoding of dimensions
 """
 
+import pytest
+
 import raxpy.spaces as s
 import numpy as np
 
@@ -134,3 +136,198 @@ def test_int_type():
 
     assert np.array_equal(decoded_data, decoded_data1, equal_nan=True)
 
+
+
+def test_decoding_with_null_portions():
+    """
+    Tests that the decoding of 0-1 values considers the null portions
+    of dimensions with value sets, ranges and log-scaled ranges
+    Asserts
+    -------
+    Values under the null portion are decoded to nan and the
+    remaining values are rescaled before decoding
+    """
+    encoded_data = np.array([0.1, 0.2, 0.3, 0.7, 1.0, np.nan])
+
+    dim = s.Float(
+        id="x1", nullable=True, portion_null=0.2, value_set=(1.0, 5.0)
+    )
+    assert np.array_equal(
+        dim.collapse_uniform(encoded_data),
+        np.array([np.nan, np.nan, 1.0, 5.0, 5.0, np.nan]),
+        equal_nan=True,
+    )
+
+    dim = s.Float(id="x2", nullable=True, portion_null=0.2, lb=2.0, ub=4.0)
+    assert np.allclose(
+        dim.collapse_uniform(encoded_data),
+        np.array([np.nan, np.nan, 2.25, 3.25, 4.0, np.nan]),
+        equal_nan=True,
+    )
+
+    dim = s.Float(
+        id="x3",
+        nullable=True,
+        portion_null=0.2,
+        lb=1.0,
+        ub=100.0,
+        tags=[s.dim_tags.LOG],
+    )
+    assert np.allclose(
+        dim.collapse_uniform(encoded_data),
+        np.array([np.nan, np.nan, 10**0.25, 10**1.25, 100.0, np.nan]),
+        equal_nan=True,
+    )
+
+
+def test_reverse_decoding_of_value_outside_value_set():
+    """
+    Tests that reverse decoding a value that is not in the
+    dimension's value set is rejected
+    Asserts
+    -------
+    A ValueError is raised
+    """
+    dim = s.Int(id="x1", value_set=(3, 9, 1))
+
+    assert np.array_equal(
+        dim.reverse_decoding(np.array([9, 1, np.nan, 3])),
+        np.array([0.5, 1.0, np.nan, 0.0]),
+        equal_nan=True,
+    )
+    with pytest.raises(ValueError):
+        dim.reverse_decoding(np.array([9, 2]))
+
+
+def test_space_codec():
+    """
+    Tests that encoding a 0-1 matrix with a space's codec nulls the
+    values of children dimensions given their parents' values and
+    that the codec is reused for the same column map
+    Asserts
+    -------
+    Children of null composites and inactive variant options are null
+    and the codec is cached
+    """
+    space = s.InputSpace(
+        dimensions=[
+            s.Composite(
+                id="x1",
+                nullable=True,
+                portion_null=0.5,
+                children=[s.Float(id="x2", lb=0.0, ub=1.0)],
+            ),
+            s.Variant(
+                id="x3",
+                options=[
+                    s.Float(id="x4", lb=0.0, ub=1.0),
+                    s.Float(id="x5", lb=0.0, ub=1.0),
+                ],
+            ),
+        ]
+    )
+    dim_column_map = {"x1": 0, "x2": 1, "x3": 2, "x4": 3, "x5": 4}
+    zero_one_values = np.array(
+        [
+            [0.25, 0.1, 0.2, 0.3, 0.4],
+            [0.75, 0.1, 0.8, 0.3, 0.4],
+        ]
+    )
+
+    encoded_values = space.encode_to_zero_one_null_matrix(
+        zero_one_values, dim_column_map
+    )
+
+    assert np.array_equal(
+        encoded_values,
+        np.array(
+            [
+                [np.nan, np.nan, 0.2, 0.3, np.nan],
+                [0.5, 0.1, 0.8, np.nan, 0.4],
+            ]
+        ),
+        equal_nan=True,
+    )
+    assert space.create_codec(dim_column_map) is space.create_codec(
+        dict(dim_column_map)
+    )
+
+
+def test_codec_cache_invalidation_and_pickling():
+    """
+    Tests the codecs cached by a space
+
+    Asserts
+    -------
+        A mutated space decodes with its new dimensions and cached
+        codecs are not pickled, copied or compared with the space.
+    """
+    import copy
+    import pickle
+
+    space = s.InputSpace(
+        dimensions=[
+            s.Int(id="x1", value_set=(1, 2)),
+            s.Float(id="x2", lb=0.0, ub=1.0),
+        ]
+    )
+    column_map = {"x1": 0, "x2": 1}
+    encoded = np.array([[0.1, 0.5], [0.9, 0.5]])
+    decoded = space.decode_zero_one_matrix(encoded, column_map)
+    assert list(decoded[:, 0]) == [1, 2]
+
+    space.dimensions[0].value_set = (5, 6)
+    decoded = space.decode_zero_one_matrix(encoded, column_map)
+    assert list(decoded[:, 0]) == [5, 6]
+
+    space.dimensions = [
+        s.Int(id="x1", value_set=(7, 8)),
+        s.Float(id="x2", lb=0.0, ub=2.0),
+    ]
+    decoded = space.decode_zero_one_matrix(encoded, column_map)
+    assert list(decoded[:, 0]) == [7, 8]
+    assert list(decoded[:, 1]) == [1.0, 1.0]
+
+    assert len(space._codec_cache) == 1
+    for space_copy in [
+        pickle.loads(pickle.dumps(space)),
+        copy.deepcopy(space),
+    ]:
+        assert len(space_copy._codec_cache) == 0
+        assert space_copy == space
+    assert "_codec_cache" not in space.to_json_dict()
+
+
+def test_set_value_sets():
+    """
+    Tests encoding and decoding dimensions with a value set specified
+    as a set
+
+    Asserts
+    -------
+        The values of the sets are looked up in sorted order, so values
+        are decoded, converted to arguments and reverse decoded
+        consistently.
+    """
+    space = s.InputSpace(
+        dimensions=[
+            s.Int(id="x1", value_set={5, 1, 3}),
+            s.Float(id="x2", value_set={0.5, 0.25}),
+            s.Text(id="x3", value_set={"b", "a", "c"}),
+        ]
+    )
+    assert space.dimensions[2].get_discrete_values() == ["a", "b", "c"]
+
+    column_map = {"x1": 0, "x2": 1, "x3": 2}
+    encoded = np.array([[0.1, 0.1, 0.1], [0.9, 0.9, 0.5]])
+    decoded = space.decode_zero_one_matrix(encoded, column_map)
+    assert space.convert_flat_values_to_arguments(decoded, column_map) == [
+        {"x1": 1, "x2": 0.25, "x3": "a"},
+        {"x1": 5, "x2": 0.5, "x3": "b"},
+    ]
+
+    for k, dim in enumerate(space.dimensions):
+        assert np.allclose(
+            dim.collapse_uniform(dim.reverse_decoding(decoded[:, k])),
+            decoded[:, k],
+        )
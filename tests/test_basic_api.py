@@ -2,6 +2,8 @@
 Tests the high-level perform experiment API and default settings.
 """
 
+import os
+from concurrent.futures.process import BrokenProcessPool
 from typing import Annotated, Optional
 from dataclasses import dataclass
 import pytest
@@ -122,6 +124,56 @@ def test_random_seed_spec():
     )
 
 
+def test_multi_chain_design_seed_spec():
+    """
+    Tests designing an experiment with multiple annealing chains
+
+    Asserts
+    -------
+        Designs with the same seed are the same
+    """
+    designs = [
+        raxpy.design_experiment(f, 10, seed=42, n_chains=2, n_jobs=1)
+        for _ in range(2)
+    ]
+
+    assert np.all(
+        _arrays_equal_with_nan(designs[0].input_sets, designs[1].input_sets)
+    )
+
+
+def test_bulk_argument_conversion():
+    """
+    Tests that converting a design to arguments column-wise gives
+    the same arguments as converting the design row by row
+
+    Asserts
+    -------
+        the arguments of the two conversions are equal
+    """
+    input_space = raxpy.function_spec.extract_input_space(f)
+    design = raxpy.design_experiment(
+        input_space, 20, seed=3, optimize_projections=False
+    )
+
+    value_dicts = input_space.convert_flat_values_to_dict(
+        design.decoded_input_sets, design.input_set_map
+    )
+    expected_arg_sets = [
+        raxpy.spaces.convert_values_from_dict(
+            input_space.dimensions, value_dict
+        )
+        for value_dict in value_dicts
+    ]
+
+    arg_sets = input_space.convert_flat_values_to_arguments(
+        design.decoded_input_sets, design.input_set_map
+    )
+
+    assert arg_sets == expected_arg_sets
+    assert any(isinstance(arg_set["x3"], Object) for arg_set in arg_sets)
+
+
 def test_validation_decorator():
     """
         Tests the runtime validation decorator
@@ -174,3 +226,195 @@ def test_random_design_api():
     assert np.all(
         _arrays_equal_with_nan(design2.input_sets, design3.input_sets)
     )
+
+
+def _fail_on_large_x1(x1: Annotated[float, raxpy.Float(lb=0.0, ub=1.0)]):
+    if x1 > 0.5:
+        raise ValueError("x1 too large")
+    return x1
+
+
+def test_perform_experiment_with_process_pool():
+    """
+    Tests executing an experiment in a process pool
+
+    Asserts
+    -------
+        The results are in the order of the design and match the
+        sequential execution, and failed points are reported without
+        aborting the other points.
+    """
+
+    _, arg_sets, outputs = raxpy.perform_experiment(f, 10, seed=3)
+    _, pool_arg_sets, pool_outputs = raxpy.perform_experiment(
+        f,
+        10,
+        orchistrator=raxpy.ProcessPoolOrchistrator(n_jobs=2, chunk_size=3),
+        seed=3,
+    )
+    assert pool_arg_sets == arg_sets
+    assert pool_outputs == outputs
+
+    _, arg_sets, outputs = raxpy.perform_experiment(
+        _fail_on_large_x1,
+        10,
+        orchistrator=raxpy.ProcessPoolOrchistrator(n_jobs=2),
+        seed=3,
+    )
+    assert len(outputs) == 10
+    for i, (arg_set, output) in enumerate(zip(arg_sets, outputs)):
+        if arg_set["x1"] > 0.5:
+            assert isinstance(output, raxpy.PointFailure)
+            assert output.index == i
+            assert isinstance(output.exception, ValueError)
+            assert "x1 too large" in output.traceback
+        else:
+            assert output == arg_set["x1"]
+
+
+class _ThresholdError(Exception):
+    def __init__(self, value, threshold):
+        super().__init__(f"{value} exceeds {threshold}")
+
+
+def _fail_with_unpicklable_exception(
+    x1: Annotated[float, raxpy.Float(lb=0.0, ub=1.0)]
+):
+    if x1 > 0.5:
+        # pickles, but fails to unpickle as __init__ requires 2 arguments
+        raise _ThresholdError(x1, 0.5)
+    return x1
+
+
+def _exit_on_large_x1(x1: Annotated[float, raxpy.Float(lb=0.0, ub=1.0)]):
+    if x1 > 0.8:
+        # simulates a worker process being killed
+        os._exit(1)
+    return x1
+
+
+def test_process_pool_failures_do_not_abort_batch():
+    """
+    Tests executing an experiment in a process pool with points raising
+    exceptions that cannot be unpickled and a point killing its worker
+
+    Asserts
+    -------
+        The failures are reported per point and the results of the other
+        (completed) points are kept.
+    """
+    _, arg_sets, outputs = raxpy.perform_experiment(
+        _fail_with_unpicklable_exception,
+        10,
+        orchistrator=raxpy.ProcessPoolOrchistrator(n_jobs=2, chunk_size=2),
+        seed=3,
+    )
+    for i, (arg_set, output) in enumerate(zip(arg_sets, outputs)):
+        if arg_set["x1"] > 0.5:
+            assert isinstance(output, raxpy.PointFailure)
+            assert output.index == i
+            assert isinstance(output.exception, RuntimeError)
+            assert "_ThresholdError" in str(output.exception)
+        else:
+            assert output == arg_set["x1"]
+
+    _, arg_sets, outputs = raxpy.perform_experiment(
+        _exit_on_large_x1,
+        10,
+        orchistrator=raxpy.ProcessPoolOrchistrator(n_jobs=1, chunk_size=1),
+        seed=3,
+    )
+    assert len(outputs) == 10
+    exit_index = next(i for i, a in enumerate(arg_sets) if a["x1"] > 0.8)
+    assert outputs[:exit_index] == [a["x1"] for a in arg_sets[:exit_index]]
+    assert isinstance(outputs[exit_index], raxpy.PointFailure)
+    assert isinstance(outputs[exit_index].exception, BrokenProcessPool)
+
+
+def test_aperform_experiment():
+    """
+    Tests executing an experiment with coroutine and regular subject
+    functions in an asyncio event loop
+
+    Asserts
+    -------
+        The results are in the order of the design, the number of
+        concurrent executions is bounded and sync subjects are
+        supported.
+    """
+    import asyncio
+
+    active_count = 0
+    max_active_count = 0
+
+    async def async_f(x1: Annotated[float, raxpy.Float(lb=0.0, ub=1.0)]):
+        nonlocal active_count, max_active_count
+        active_count += 1
+        max_active_count = max(max_active_count, active_count)
+        await asyncio.sleep(0.01 * (1.0 - x1))
+        active_count -= 1
+        return 2.0 * x1
+
+    _, arg_sets, outputs = asyncio.run(
+        raxpy.aperform_experiment(
+            async_f,
+            12,
+            orchistrator=raxpy.AsyncioOrchistrator(
+                max_concurrency=3, rate_limit=1000.0
+            ),
+            seed=3,
+        )
+    )
+    assert outputs == [2.0 * arg_set["x1"] for arg_set in arg_sets]
+    assert max_active_count == 3
+
+    _, _, outputs = raxpy.perform_experiment(f, 10, seed=3)
+    _, _, async_outputs = asyncio.run(raxpy.aperform_experiment(f, 10, seed=3))
+    assert async_outputs == outputs
+
+    with pytest.raises(ValueError):
+        asyncio.run(raxpy.aperform_experiment(_fail_on_large_x1, 10, seed=3))
+
+    with pytest.raises(TypeError, match="aperform_experiment"):
+        raxpy.perform_experiment(
+            f, 10, orchistrator=raxpy.AsyncioOrchistrator(), seed=3
+        )
+
+
+def test_iperform_experiment():
+    """
+    Tests streaming the executions of an experiment
+
+    Asserts
+    -------
+        The streamed executions match the batch execution, with and
+        without an executor, and the stream can be stopped early.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    _, arg_sets, outputs = raxpy.perform_experiment(f, 10, seed=3)
+
+    stream = raxpy.iperform_experiment(f, 10, seed=3)
+    stream.chunk_size = 3
+    assert stream.design.point_count == 10
+    assert list(stream) == list(zip(range(10), arg_sets, outputs))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        stream = raxpy.iperform_experiment(
+            f, 10, executor=executor, max_pending=3, seed=3
+        )
+        executions = sorted(stream, key=lambda execution: execution[0])
+        assert executions == list(zip(range(10), arg_sets, outputs))
+
+        called_count = 0
+
+        def g(x1: Annotated[float, raxpy.Float(lb=0.0, ub=1.0)]):
+            nonlocal called_count
+            called_count += 1
+            return x1
+
+        for _ in raxpy.iperform_experiment(
+            g, 100, executor=executor, max_pending=4
+        ):
+            break
+    assert called_count < 100
@@ -0,0 +1,141 @@
+"""
+Tests the persistent cache of subject function evaluations.
+"""
+
+from typing import Annotated, Optional
+
+import pytest
+
+import raxpy
+
+
+def test_perform_experiment_with_cache(tmp_path):
+    """
+    Tests re-executing an experiment with a cache
+
+    Asserts
+    -------
+        Repeated and re-executed argument sets are only evaluated once,
+        and changing the subject version invalidates the values.
+    """
+    call_count = 0
+
+    def f(
+        x1: Annotated[int, raxpy.Integer(value_set=(1, 2))],
+        x2: Optional[bool] = None,
+    ):
+        nonlocal call_count
+        call_count += 1
+        return f"{x1}{x2}"
+
+    path = str(tmp_path / "cache.db")
+    with raxpy.EvaluationCache(path, subject_version="1") as cache:
+        _, arg_sets, outputs = raxpy.perform_experiment(
+            f, 20, cache=cache, seed=1
+        )
+        assert outputs == [f"{a['x1']}{a['x2']}" for a in arg_sets]
+        distinct_count = len(set(outputs))
+        assert call_count == distinct_count < 20
+        assert len(cache) == distinct_count
+
+    # a resumed experiment reuses the values stored on disk
+    with raxpy.EvaluationCache(path, subject_version="1") as cache:
+        _, _, resumed_outputs = raxpy.perform_experiment(
+            f, 20, cache=cache, seed=1
+        )
+    assert resumed_outputs == outputs
+    assert call_count == distinct_count
+
+    with raxpy.EvaluationCache(path, subject_version="2") as cache:
+        raxpy.perform_experiment(f, 20, cache=cache, seed=1)
+    assert call_count == 2 * distinct_count
+
+
+def test_cache_size_eviction(tmp_path):
+    """
+    Tests evicting values from a cache exceeding its maximum size
+
+    Asserts
+    -------
+        The least recently used values are evicted.
+    """
+    with raxpy.EvaluationCache(
+        str(tmp_path / "cache.db"), max_size_bytes=2500
+    ) as cache:
+        for key in ["a", "b", "c"]:
+            cache.put(key, bytes(1000))
+        assert len(cache) == 2
+        assert not cache.get("a")[0]
+
+        assert cache.get("b")[0]
+        cache.put("d", bytes(1000))
+        assert cache.get("b")[0]
+        assert not cache.get("c")[0]
+
+
+def test_cache_keeps_values_of_interrupted_experiment(tmp_path):
+    """
+    Tests the values stored in the cache when an experiment is
+    interrupted by a failing point
+
+    Asserts
+    -------
+        The values of the points completed before the failure are
+        stored and not evaluated again when re-executing.
+    """
+    calls = []
+    interrupt = True
+
+    def f(x1: Annotated[float, raxpy.Float(lb=0.0, ub=1.0)]):
+        if interrupt and len(calls) == 4:
+            raise InterruptedError()
+        calls.append(x1)
+        return x1
+
+    path = str(tmp_path / "cache.db")
+    with raxpy.EvaluationCache(path) as cache:
+        with pytest.raises(InterruptedError):
+            raxpy.perform_experiment(f, 10, cache=cache, seed=1)
+    with raxpy.EvaluationCache(path) as cache:
+        assert len(cache) == 4
+
+        calls.clear()
+        interrupt = False
+        _, arg_sets, outputs = raxpy.perform_experiment(
+            f, 10, cache=cache, seed=1
+        )
+    assert len(calls) == 6
+    assert outputs == [arg_set["x1"] for arg_set in arg_sets]
+
+
+def test_cache_key_of_unsupported_values(tmp_path):
+    """
+    Tests creating the keys of argument sets with values that cannot be
+    canonicalized
+
+    Asserts
+    -------
+        A TypeError is raised unless a key function is specified.
+    """
+
+    class Opaque:
+        def __init__(self, name):
+            self.name = name
+
+    def f(x):
+        return x
+
+    cache = raxpy.EvaluationCache(str(tmp_path / "cache.db"))
+    with pytest.raises(TypeError):
+        cache.create_key(f, {"x": Opaque("a")})
+
+    cache = raxpy.EvaluationCache(
+        str(tmp_path / "cache.db"),
+        key_function=lambda arg_set: arg_set["x"].name,
+    )
+    assert cache.create_key(f, {"x": Opaque("a")}) == cache.create_key(
+        f, {"x": Opaque("a")}
+    )
+    assert cache.create_key(f, {"x": Opaque("a")}) != cache.create_key(
+        f, {"x": Opaque("b")}
+    )
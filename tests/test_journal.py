@@ -0,0 +1,238 @@
+"""
+Tests checkpointing and resuming experiments with a journal.
+"""
+
+from typing import Annotated
+
+import pytest
+
+import raxpy
+from raxpy.runners.coordinator import (
+    CompletedTaskEvent,
+    WorkerContext,
+    WorkerPool,
+    coordinate,
+)
+from raxpy.runners.task_provider import BatchExperimentTaskProvider
+
+
+class _Crash(Exception):
+    pass
+
+
+def _create_subject(crash_after: int, calls: list):
+    def f(x1: Annotated[float, raxpy.Float(lb=0.0, ub=1.0)]):
+        if len(calls) >= crash_after:
+            raise _Crash()
+        calls.append(x1)
+        return 2.0 * x1
+
+    return f
+
+
+def test_resume_experiment(tmp_path):
+    """
+    Tests resuming an experiment stopped by a failure
+
+    Asserts
+    -------
+        Resuming reloads the design, only executes the points without a
+        journaled result and tolerates a partially written record.
+    """
+    path = str(tmp_path / "experiment.journal")
+    calls: list = []
+    with raxpy.ExperimentJournal(path, checkpoint_size=3) as journal:
+        with pytest.raises(_Crash):
+            raxpy.perform_experiment(
+                _create_subject(7, calls), 10, journal=journal, seed=1
+            )
+    # the results were journaled as each point completed
+    assert len(calls) == 7
+
+    with open(path, "ab") as f:
+        f.write(b"\x80\x04partial")
+
+    calls.clear()
+    with raxpy.ExperimentJournal(path, checkpoint_size=3) as journal:
+        with pytest.warns(UserWarning, match="partially written"):
+            design, arg_sets, results = raxpy.resume_experiment(
+                _create_subject(10, calls), journal
+            )
+        with pytest.raises(ValueError):
+            raxpy.perform_experiment(
+                _create_subject(10, []), 10, journal=journal
+            )
+    assert len(calls) == 3
+    assert design.point_count == 10
+    assert results == [2.0 * arg_set["x1"] for arg_set in arg_sets]
+
+    _, expected_arg_sets, expected_results = raxpy.perform_experiment(
+        _create_subject(10, []), 10, seed=1
+    )
+    assert arg_sets == expected_arg_sets
+    assert results == expected_results
+
+
+def test_journal_with_chunked_orchistrator(tmp_path):
+    """
+    Tests journaling an experiment executed by an orchistrator without
+    an on_result parameter
+
+    Asserts
+    -------
+        The results are journaled after each chunk of checkpoint_size
+        points.
+    """
+    calls: list = []
+
+    def orchistrator(f, inputs):
+        return [f(**arg_set) for arg_set in inputs]
+
+    journal = raxpy.ExperimentJournal(
+        str(tmp_path / "experiment.journal"), checkpoint_size=3
+    )
+    with pytest.raises(_Crash):
+        raxpy.perform_experiment(
+            _create_subject(7, calls),
+            10,
+            orchistrator=orchistrator,
+            journal=journal,
+            seed=1,
+        )
+    assert len(calls) == 7
+    _, results = journal.load()
+    assert sorted(results) == list(range(6))
+
+
+def test_corrupted_journal_is_not_truncated(tmp_path):
+    """
+    Tests loading a journal with a corrupted record followed by valid
+    records
+
+    Asserts
+    -------
+        Loading raises a ValueError and the journal is not modified.
+    """
+    path = str(tmp_path / "experiment.journal")
+    with raxpy.ExperimentJournal(path) as journal:
+        for i in range(3):
+            journal.append_result(i, float(i))
+    with open(path, "rb") as f:
+        data = bytearray(f.read())
+    # corrupts the first record's pickled data
+    data[14] ^= 0xFF
+    with open(path, "wb") as f:
+        f.write(data)
+
+    with pytest.raises(ValueError):
+        raxpy.ExperimentJournal(path).load()
+    with open(path, "rb") as f:
+        assert f.read() == data
+
+
+def test_resume_task_provider_from_partial_journal(tmp_path):
+    """
+    Tests resuming a task provider from a journal with some results
+
+    Asserts
+    -------
+        The completed points are not provided as tasks again, and
+        creating a task provider resumes the journaled experiment.
+    """
+    path = str(tmp_path / "experiment.journal")
+    f = _create_subject(100, [])
+    design = raxpy.design_experiment(f, 8, seed=1)
+
+    with raxpy.ExperimentJournal(path) as journal:
+        provider = BatchExperimentTaskProvider(design=design, journal=journal)
+        for _ in range(3):
+            task = provider.next()
+            provider.process_task_result(task, task["index"])
+        # the completed points are not consecutive
+        provider.process_task_result(provider.next(), 3)
+        skipped_task = provider.next()
+        provider.process_task_result(provider.next(), 5)
+
+    with raxpy.ExperimentJournal(path) as journal:
+        with pytest.raises(ValueError):
+            BatchExperimentTaskProvider(design=design, journal=journal)
+
+        provider = BatchExperimentTaskProvider.create(
+            lambda: pytest.fail("the journaled design is resumed"),
+            journal=journal,
+        )
+        assert provider.completed_results == {i: i for i in [0, 1, 2, 3, 5]}
+        indexes = []
+        while True:
+            task = provider.next()
+            if task is None:
+                break
+            indexes.append(task["index"])
+            provider.process_task_result(task, task["index"])
+    assert indexes == [skipped_task["index"], 6, 7]
+    assert provider.results == list(range(8))
+
+    with raxpy.ExperimentJournal(path) as journal:
+        assert journal.load()[1] == {i: i for i in range(8)}
+
+
+class _LocalWorkerPool(WorkerPool):
+    """
+    Executes each delegated task immediately in the current process.
+    """
+
+    def __init__(self, f, crash_after=None):
+        super().__init__(unassigned_workers=[WorkerContext(id=0)])
+        self.f = f
+        self.crash_after = crash_after
+        self.completed_events = []
+        self.task_count = 0
+
+    def send_to_worker(self, worker_context, data):
+        if self.crash_after is not None and self.task_count >= (
+            self.crash_after
+        ):
+            raise _Crash()
+        self.task_count += 1
+        self.completed_events.append(
+            CompletedTaskEvent(worker_context, self.f(**data["input"]), data)
+        )
+
+    def _process(self):
+        if len(self.completed_events) == 0:
+            return None
+        event = self.completed_events.pop()
+        self.unassigned_workers.append(event.worker_context)
+        return event
+
+
+def test_resume_coordinated_experiment(tmp_path):
+    """
+    Tests resuming a coordinated experiment stopped by a failure
+
+    Asserts
+    -------
+        The resumed task provider only provides the points without a
+        journaled result and gathers the results of every point.
+    """
+    path = str(tmp_path / "experiment.journal")
+    calls: list = []
+    f = _create_subject(100, calls)
+    design = raxpy.design_experiment(f, 8, seed=1)
+
+    with raxpy.ExperimentJournal(path) as journal:
+        provider = BatchExperimentTaskProvider(design=design, journal=journal)
+        with pytest.raises(_Crash):
+            coordinate(provider, _LocalWorkerPool(f, crash_after=5))
+    assert len(calls) == 5
+
+    calls.clear()
+    with raxpy.ExperimentJournal(path) as journal:
+        provider = BatchExperimentTaskProvider.from_journal(journal)
+        coordinate(provider, _LocalWorkerPool(f))
+    assert len(calls) == 3
+
+    arg_sets = design.input_space.convert_flat_values_to_arguments(
+        design.decoded_input_sets, design.input_set_map
+    )
+    assert provider.results == [2.0 * a["x1"] for a in arg_sets]